@@ -1,15 +1,118 @@
+import hashlib
 import os
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from typing import Callable, Literal
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import FastAPI, Header, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field
 
-from numbers_core import ProfileInput, analyze_profile as analyze_profile_ai, build_profile
-from numbers_core.intelligence.openrouter_client import OpenRouterClient
+from numbers_core import (
+    ProfileInput,
+    analyze_profile_async as analyze_profile_ai,
+    analyze_profile_stream,
+    build_calendar,
+    build_normalized_profile,
+    build_personal_months,
+    build_profile,
+    build_profiles,
+    normalize_birthdate,
+    normalize_input,
+)
+from numbers_core.calc.compatibility import compatibility_matrix
+from numbers_core.calc.graph import ALGORITHM_VERSION, PROFILE_FIELDS, parse_profile_fields
+from numbers_core.calc.matching import MatchIndex
+from numbers_core.helpers import metrics
+from numbers_core.helpers.serialization import EncodedCache, dumps
+from numbers_core.intelligence.analysis import DEFAULT_ERROR_MESSAGE
+from numbers_core.intelligence.cache import AnalysisCache
+from numbers_core.intelligence.limiter import ConcurrencyLimiter, Overloaded
+from numbers_core.intelligence.openrouter_client import (
+    DEFAULT_MODEL,
+    DEFAULT_URL,
+    AsyncOpenRouterClient,
+)
+from numbers_core.intelligence.prompts.loader import registry as prompt_registry
+from numbers_core.intelligence.singleflight import SingleFlight
 
 load_dotenv()
 
-app = FastAPI()
+_ai_clients: dict[tuple[str, str, str], AsyncOpenRouterClient] = {}
+analysis_cache = AnalysisCache(
+    max_entries=int(os.getenv("ANALYSIS_CACHE_SIZE", "1024")),
+    path=os.getenv("ANALYSIS_CACHE_PATH") or None,
+    ttl=float(os.getenv("ANALYSIS_CACHE_TTL", str(7 * 24 * 3600))),
+)
+analysis_flights = SingleFlight()
+analysis_limiter = ConcurrencyLimiter(
+    max_concurrent=int(os.getenv("OPENROUTER_MAX_CONCURRENCY", "16")),
+    max_queue=int(os.getenv("OPENROUTER_MAX_QUEUE", "64")),
+    queue_timeout=float(os.getenv("OPENROUTER_QUEUE_TIMEOUT", "30")),
+)
+# Per-process: uvicorn workers do not share the match index.
+match_index = MatchIndex()
+profile_responses = EncodedCache(
+    max_entries=int(os.getenv("PROFILE_RESPONSE_CACHE_SIZE", "4096")),
+    max_bytes=int(os.getenv("PROFILE_RESPONSE_CACHE_BYTES", str(32 * 1024 * 1024))),
+)
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", "86400"))
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded by ``dumps`` (orjson when installed) with the same bytes.
+
+    Routes return it directly, which skips FastAPI's ``jsonable_encoder`` pass;
+    pre-encoded ``bytes`` are sent as they are.
+    """
+
+    def render(self, content) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    prompt_registry.preload()
+    yield
+    clients = list(_ai_clients.values())
+    _ai_clients.clear()
+    for client in clients:
+        await client.aclose()
+    analysis_cache.close()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
+app.add_middleware(metrics.MetricsMiddleware)
+
+metrics.registry.register_stats(
+    "analysis_cache", analysis_cache.stats, counters=("hits", "misses", "disk_hits")
+)
+metrics.registry.register_stats(
+    "analysis_flights", analysis_flights.stats, counters=("calls", "collapsed")
+)
+metrics.registry.register_stats(
+    "prompt", prompt_registry.stats, counters=("renders", "render_seconds_total")
+)
+metrics.registry.register_stats(
+    "analysis_limiter",
+    analysis_limiter.stats,
+    counters=("admitted", "queued", "rejected", "timed_out"),
+)
+metrics.registry.register_stats("match_index", lambda: {"size": len(match_index)})
+metrics.registry.register_stats(
+    "profile_responses", profile_responses.stats, counters=("hits", "misses")
+)
+
+MAX_BATCH_SIZE = 50_000
+MAX_MATRIX_SIZE = 5_000
+# Cells in one matrix response; details carry five extra values per cell.
+MAX_MATRIX_CELLS = 1_000_000
+MAX_DETAILED_MATRIX_CELLS = 50_000
+MAX_CALENDAR_MONTHS = 1_200
+MAX_PERSONAL_MONTH_YEARS = 100
 
 
 class ProfileRequest(BaseModel):
@@ -17,26 +120,324 @@ class ProfileRequest(BaseModel):
     birthdate: str
 
 
+class ProfileFieldsMixin(BaseModel):
+    """Optional section selection; without ``fields`` only the flat core profile is returned."""
+
+    fields: list[str] | None = Field(default=None, max_length=len(PROFILE_FIELDS))
+    year: int | None = Field(default=None, ge=1, le=9999)
+    month: int | None = Field(default=None, ge=1, le=12)
+
+
+class ProfileQueryRequest(ProfileFieldsMixin, ProfileRequest):
+    pass
+
+
+class ProfileBatchRequest(ProfileFieldsMixin):
+    items: list[ProfileRequest] = Field(max_length=MAX_BATCH_SIZE)
+
+
+class MatchItem(ProfileRequest):
+    id: str
+
+
+class MatchIndexRequest(BaseModel):
+    items: list[MatchItem] = Field(max_length=MAX_BATCH_SIZE)
+
+
+class MatchQuery(ProfileRequest):
+    k: int = Field(default=10, ge=1, le=1000)
+    exclude: str | None = None
+
+
+class CompatibilityMatrixRequest(BaseModel):
+    people: list[ProfileRequest] = Field(min_length=1, max_length=MAX_MATRIX_SIZE)
+    others: list[ProfileRequest] | None = Field(default=None, max_length=MAX_MATRIX_SIZE)
+    details: bool = False
+
+
 def _make_input(payload: ProfileRequest) -> ProfileInput:
     return ProfileInput(name=payload.full_name, birthdate=payload.birthdate)
 
 
 def _select_ai_client():
+    """Shared async client per API key, URL and model, so its pool outlives a request."""
+
     api_key = os.getenv("OPENROUTER_API_KEY")
-    return OpenRouterClient(api_key=api_key) if api_key else None
+    if not api_key:
+        return None
+    url = os.getenv("OPENROUTER_URL", DEFAULT_URL)
+    model = os.getenv("OPENROUTER_MODEL", DEFAULT_MODEL)
+    client = _ai_clients.get((api_key, url, model))
+    if client is None:
+        client = _ai_clients[api_key, url, model] = AsyncOpenRouterClient(
+            model=model,
+            api_key=api_key,
+            url=url,
+            max_connections=int(os.getenv("OPENROUTER_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("OPENROUTER_MAX_KEEPALIVE", "20")),
+        )
+    return client
+
+
+def _current_period(fields: tuple[str, ...] | None, year: int | None, month: int | None):
+    """Today's date when the response depends on it (personal cycles of the current period)."""
+
+    if fields is None or (year is not None and month is not None):
+        return None
+    if any(field.startswith("personal_") for field in fields):
+        return date.today()
+    return None
+
+
+def _profile_key(
+    full_name: str, birthdate: str, fields, year: int | None, month: int | None
+) -> tuple:
+    try:
+        name, normalized = normalize_input(ProfileInput(name=full_name, birthdate=birthdate))
+        sections = None if fields is None else parse_profile_fields(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return (
+        "profile",
+        name,
+        normalized,
+        sections,
+        year,
+        month,
+        _current_period(sections, year, month),
+    )
+
+
+def _cached_body(key: tuple, build: Callable[[], object]) -> bytes:
+    """Encoded body for ``key`` from the response LRU, built and stored on a miss."""
+
+    body = profile_responses.get(key)
+    if body is None:
+        body = dumps(build())
+        profile_responses.put(key, body)
+    return body
+
+
+def _etag(key: tuple) -> str:
+    """Strong validator of the normalized input and the algorithm version."""
+
+    digest = hashlib.blake2b(repr((ALGORITHM_VERSION, key)).encode(), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison: W/"x" matches "x"
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def _cache_control(key: tuple) -> str:
+    max_age = HTTP_CACHE_MAX_AGE
+    if key[-1] is not None:  # depends on today's date: fresh only until midnight
+        now = datetime.now()
+        max_age = min(max_age, 86400 - (now.hour * 3600 + now.minute * 60 + now.second))
+    return f"public, max-age={max_age}"
+
+
+def _cacheable(request: Request, key: tuple, build: Callable[[], object]) -> Response:
+    """Conditional GET: 304 for a matching ``If-None-Match``, otherwise the (cached) body.
+
+    The last element of ``key`` is the date the response depends on, or ``None``.
+    """
+
+    headers = {"ETag": _etag(key), "Cache-Control": _cache_control(key)}
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return FastJSONResponse(_cached_body(key, build), headers=headers)
+
+
+def _profile_builder(key: tuple) -> Callable[[], dict]:
+    _, name, birthdate, fields, year, month, _ = key
+    return lambda: build_normalized_profile(name, birthdate, fields, year, month)
 
 
 @app.post("/profile")
-def create_profile(payload: ProfileRequest):
+def create_profile(payload: ProfileQueryRequest):
+    """Repeated normalized inputs are answered with the cached encoded body."""
+
+    key = _profile_key(
+        payload.full_name, payload.birthdate, payload.fields, payload.year, payload.month
+    )
+    return FastJSONResponse(_cached_body(key, _profile_builder(key)))
+
+
+@app.get("/profile")
+def get_profile(
+    request: Request,
+    full_name: str,
+    birthdate: str,
+    fields: str | None = Query(default=None, description="comma-separated sections"),
+    year: int | None = Query(default=None, ge=1, le=9999),
+    month: int | None = Query(default=None, ge=1, le=12),
+):
+    """Same body as ``POST /profile``, with ``ETag`` and ``Cache-Control`` for HTTP caches."""
+
+    key = _profile_key(full_name, birthdate, fields, year, month)
+    return _cacheable(request, key, _profile_builder(key))
+
+
+@app.post("/profiles/batch")
+def create_profiles_batch(payload: ProfileBatchRequest):
+    try:
+        results = build_profiles(
+            (_make_input(item) for item in payload.items),
+            payload.fields,
+            payload.year,
+            payload.month,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return FastJSONResponse({"results": results})
+
+
+def _build_group(field: str, items: list[ProfileRequest]) -> list[dict]:
+    profiles = []
+    for index, result in enumerate(build_profiles(_make_input(item) for item in items)):
+        if "error" in result:
+            raise HTTPException(status_code=400, detail=f"{field}[{index}]: {result['error']}")
+        profiles.append(result["profile"])
+    return profiles
+
+
+@app.post("/compatibility/matrix")
+def create_compatibility_matrix(payload: CompatibilityMatrixRequest):
+    columns = payload.others if payload.others is not None else payload.people
+    cells = len(payload.people) * len(columns)
+    limit = MAX_DETAILED_MATRIX_CELLS if payload.details else MAX_MATRIX_CELLS
+    if cells > limit:
+        raise HTTPException(
+            status_code=413,
+            detail=f"matrix has {cells} cells, the limit is {limit}"
+            + (" with details" if payload.details else ""),
+        )
+    people = _build_group("people", payload.people)
+    others = _build_group("others", payload.others) if payload.others is not None else None
+    return FastJSONResponse(compatibility_matrix(people, others, details=payload.details).to_dict())
+
+
+def _birthdate_or_400(birthdate: str):
+    try:
+        return normalize_birthdate(birthdate)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@app.get("/calendar")
+def get_calendar(
+    request: Request,
+    birthdate: str,
+    year: int | None = Query(default=None, ge=1, le=9999),
+    months: int = Query(default=12, ge=1, le=MAX_CALENDAR_MONTHS),
+    month: int = Query(default=1, ge=1, le=12),
+):
+    start_year = year if year is not None else date.today().year
+    if start_year * 12 + month - 1 + months > 9999 * 12 + 12:
+        raise HTTPException(status_code=400, detail="calendar range exceeds year 9999")
+    normalized = _birthdate_or_400(birthdate)
+    today = date.today() if year is None else None
+    key = ("calendar", normalized, start_year, months, month, today)
+    return _cacheable(
+        request,
+        key,
+        lambda: {
+            "birthdate": str(normalized),
+            "months": build_calendar(normalized, start_year, months, month),
+        },
+    )
+
+
+@app.get("/personal-months")
+def get_personal_months(
+    request: Request,
+    birthdate: str,
+    year: int | None = Query(default=None, ge=1, le=9999),
+    years: int = Query(default=1, ge=1, le=MAX_PERSONAL_MONTH_YEARS),
+):
+    """Personal month numbers by month name for ``years`` years from ``year`` (this year)."""
+
+    start_year = year if year is not None else date.today().year
+    if start_year + years - 1 > 9999:
+        raise HTTPException(status_code=400, detail="personal months range exceeds year 9999")
+    normalized = _birthdate_or_400(birthdate)
+    today = date.today() if year is None else None
+    key = ("personal_months", normalized, start_year, years, today)
+    return _cacheable(
+        request,
+        key,
+        lambda: {
+            "birthdate": str(normalized),
+            "years": build_personal_months(normalized, start_year, years),
+        },
+    )
+
+
+@app.post("/match/index")
+def add_to_match_index(payload: MatchIndexRequest):
+    """Index profiles for ``/match/top``.
+
+    The index lives in this process only: with several uvicorn workers each keeps its own copy,
+    so a profile added here is invisible to requests served by the other workers.
+    """
+
+    results = build_profiles(_make_input(item) for item in payload.items)
+    errors = []
+    for item, result in zip(payload.items, results):
+        if "error" in result:
+            errors.append({"id": item.id, "error": result["error"]})
+        else:
+            match_index.add(item.id, result["profile"])
+    return FastJSONResponse(
+        {"added": len(payload.items) - len(errors), "errors": errors, "size": len(match_index)}
+    )
+
+
+@app.delete("/match/index/{item_id}")
+def remove_from_match_index(item_id: str):
+    """Drop a profile from this process's match index."""
+
+    if not match_index.remove(item_id):
+        raise HTTPException(status_code=404, detail=f"profile {item_id!r} is not indexed")
+    return FastJSONResponse({"removed": item_id, "size": len(match_index)})
+
+
+@app.post("/match/top")
+def find_top_matches(payload: MatchQuery):
+    """Best matches among the profiles indexed by this process (see ``add_to_match_index``)."""
+
     try:
         profile = build_profile(_make_input(payload))
-    except Exception as exc:  # pragma: no cover
+    except Exception as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return profile
+    matches = match_index.top(profile, k=payload.k, exclude=payload.exclude)
+    return FastJSONResponse(
+        {"profile": profile, "matches": [{"id": i, "score": s} for i, s in matches]}
+    )
+
+
+# Interactive (GUI) analysis calls get a free provider slot before bulk jobs.
+Lane = Literal["interactive", "bulk"]
+
+
+def _overloaded(exc: Overloaded) -> HTTPException:
+    return HTTPException(
+        status_code=exc.status_code,
+        detail=str(exc),
+        headers={"Retry-After": str(exc.retry_after)},
+    )
 
 
 @app.post("/profile/analysis")
-def create_profile_with_analysis(payload: ProfileRequest):
+async def create_profile_with_analysis(
+    payload: ProfileRequest, x_priority: Lane = Header(default="interactive")
+):
     try:
         profile = build_profile(_make_input(payload))
     except Exception as exc:
@@ -44,11 +445,82 @@ def create_profile_with_analysis(payload: ProfileRequest):
 
     try:
         client = _select_ai_client()
-        analysis = analyze_profile_ai(profile, ai=client).get("text", "Анализ временно недоступен.")
+        result = await analyze_profile_ai(
+            profile,
+            ai=client,
+            cache=analysis_cache,
+            flights=analysis_flights,
+            limiter=analysis_limiter,
+            lane=x_priority,
+        )
+        analysis = result.get("text", "Анализ временно недоступен.")
+    except Overloaded as exc:
+        raise _overloaded(exc) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
-    return {"profile": profile, "analysis": analysis}
+    return FastJSONResponse({"profile": profile, "analysis": analysis})
+
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {dumps(data).decode()}\n\n"
+
+
+async def _analysis_events(profile: dict, lane: str):
+    """Profile first, then analysis tokens as they arrive, then the full text."""
+
+    yield _sse("profile", profile)
+    parts = []
+    try:
+        async for piece in analyze_profile_stream(
+            profile,
+            ai=_select_ai_client(),
+            cache=analysis_cache,
+            limiter=analysis_limiter,
+            lane=lane,
+        ):
+            parts.append(piece)
+            yield _sse("token", {"text": piece})
+    except Overloaded as exc:
+        yield _sse("error", {"detail": str(exc), "retry_after": exc.retry_after})
+        return
+    except Exception as exc:
+        yield _sse("error", {"detail": f"{DEFAULT_ERROR_MESSAGE} Причина: {exc}"})
+        return
+    yield _sse("done", {"analysis": "".join(parts).strip()})
+
+
+def _stream_analysis(payload: ProfileRequest, lane: str) -> StreamingResponse:
+    try:
+        profile = build_profile(_make_input(payload))
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return StreamingResponse(
+        _analysis_events(profile, lane),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/profile/analysis/stream")
+async def stream_profile_analysis(
+    full_name: str, birthdate: str, x_priority: Lane = Header(default="interactive")
+):
+    return _stream_analysis(ProfileRequest(full_name=full_name, birthdate=birthdate), x_priority)
+
+
+@app.post("/profile/analysis/stream")
+async def stream_profile_analysis_post(
+    payload: ProfileRequest, x_priority: Lane = Header(default="interactive")
+):
+    return _stream_analysis(payload, x_priority)
+
+
+@app.get("/metrics")
+def get_metrics():
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="metrics are disabled")
+    return Response(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
 
 
 if __name__ == "__main__":
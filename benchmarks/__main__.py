@@ -0,0 +1,71 @@
+"""Run the microbenchmark suite or compare two result files.
+
+Usage:
+    python -m benchmarks run [--output results.json] [--compare baseline.json] [-k NAME ...]
+    python -m benchmarks compare baseline.json current.json [--threshold 0.15]
+"""
+
+import argparse
+import sys
+
+from .suite import DEFAULT_THRESHOLD, compare_results, load_results, run_suite, save_results
+
+
+def _print_progress(name: str, result: dict) -> None:
+    print(f"{name:<48} {result['ns_per_item']:>12.0f} ns/item", flush=True)
+
+
+def _report(baseline: dict, current: dict, threshold: float) -> int:
+    rows = compare_results(baseline, current, threshold)
+    for name, before, after, ratio, regressed in rows:
+        mark = "REGRESSION" if regressed else ""
+        print(f"{name:<48} {before:>10.0f} -> {after:>10.0f} ns/item {ratio:>6.2f}x {mark}")
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than {1 + threshold:.2f}x the baseline")
+        return 1
+    print(f"no regressions beyond {threshold:.0%} across {len(rows)} benchmark(s)")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.splitlines()[0]
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the suite")
+    run.add_argument("--rows", type=int, default=2_000, help="dataset size per benchmark")
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--min-time", type=float, default=0.05, help="seconds per repeat")
+    run.add_argument("-k", dest="select", action="append", help="run benchmarks matching NAME")
+    run.add_argument("--output", help="write JSON results to this file")
+    run.add_argument("--compare", metavar="BASELINE", help="compare against a results file")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare = commands.add_parser("compare", help="compare two result files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        return _report(load_results(args.baseline), load_results(args.current), args.threshold)
+
+    baseline = load_results(args.compare) if args.compare else None
+    results = run_suite(
+        rows=args.rows,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        select=args.select,
+        progress=_print_progress,
+    )
+    if args.output:
+        save_results(results, args.output)
+    if baseline is not None:
+        return _report(baseline, results, args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""Compare batch profile throughput with the single-item path.
+
+Usage: python -m benchmarks.bench_batch [--rows N]
+"""
+
+import argparse
+import time
+
+from numbers_core import ProfileInput, build_profile, build_profiles
+
+from .datasets import make_people
+
+
+def _single(inputs):
+    results = []
+    for inp in inputs:
+        try:
+            results.append({"profile": build_profile(inp)})
+        except ValueError as exc:
+            results.append({"error": str(exc)})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    args = parser.parse_args()
+
+    inputs = [
+        ProfileInput(name=n, birthdate=b) for n, b in make_people(args.rows, mixed_formats=True)
+    ]
+
+    timings = {}
+    for label, func in (("single", _single), ("batch", build_profiles)):
+        start = time.perf_counter()
+        func(inputs)
+        timings[label] = time.perf_counter() - start
+        print(f"{label:>6}: {args.rows / timings[label]:>10.0f} rows/s")
+    print(f"speedup: {timings['single'] / timings['batch']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
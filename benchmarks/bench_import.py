@@ -0,0 +1,102 @@
+"""Measure cold import time of the package entry points and guard the start-up budget.
+
+Usage: python -m benchmarks.bench_import [--repeat N] [--budget-ms MS]
+
+Every sample runs in a fresh interpreter, so nothing is cached in ``sys.modules``;
+interpreter start-up itself is not counted. Calc-only entry points must stay under
+the budget and must not load the AI stack (HTTP clients, jinja2) or
+multiprocessing; the exit code is 1 otherwise. The full API import is reported for
+reference only.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import NamedTuple
+
+DEFAULT_BUDGET_MS = 200.0
+
+# Modules a calc-only consumer should never pay for.
+HEAVY_MODULES = (
+    "requests",
+    "httpx",
+    "jinja2",
+    "numbers_core.intelligence.analysis",
+    "numbers_core.intelligence.openrouter_client",
+    "multiprocessing",
+)
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+heavy = {heavy!r}
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [m for m in heavy if m in sys.modules]}}))
+"""
+
+
+class Target(NamedTuple):
+    name: str
+    code: str
+    budgeted: bool = True
+
+
+TARGETS = (
+    Target("import numbers_core", "import numbers_core"),
+    Target("import numbers_core.calc", "import numbers_core.calc"),
+    Target(
+        "build_profile",
+        "import numbers_core\n"
+        "numbers_core.build_profile(numbers_core.ProfileInput('Анна Иванова', '01.02.1990'))",
+    ),
+    Target("batch CLI", "import numbers_core.__main__"),
+    Target("api", "import api", budgeted=False),
+)
+
+
+def measure(target: Target, repeat: int = 5) -> dict:
+    """Import ``target`` in ``repeat`` fresh interpreters; times are in milliseconds."""
+
+    samples, loaded = [], set()
+    probe = _PROBE.format(code=target.code, heavy=HEAVY_MODULES)
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.splitlines()[-1])
+        samples.append(result["ms"])
+        loaded.update(result["loaded"])
+    return {
+        "min_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "loaded": sorted(loaded),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for target in TARGETS:
+        result = measure(target, args.repeat)
+        problems = []
+        if target.budgeted and result["min_ms"] > args.budget_ms:
+            problems.append(f"over {args.budget_ms:.0f} ms budget")
+        if target.budgeted and result["loaded"]:
+            problems.append("loads " + ", ".join(result["loaded"]))
+        failures += bool(problems)
+        print(
+            f"{target.name:<26} min {result['min_ms']:>7.1f} ms  "
+            f"median {result['median_ms']:>7.1f} ms  {'; '.join(problems)}"
+        )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
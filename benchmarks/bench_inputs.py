@@ -0,0 +1,61 @@
+"""Measure per-input validation cost of the orchestrator's normalization layer.
+
+Usage: python -m benchmarks.bench_inputs [--rows N]
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+from numbers_core.core.orchestrator import _normalize_birthdate, _normalize_name
+
+from .datasets import make_people
+
+
+def _legacy_birthdate(value):
+    for fmt in ("%Y-%m-%d", "%d.%m.%Y", "%d/%m/%Y", "%d-%m-%Y"):
+        try:
+            return datetime.strptime(value.strip(), fmt).strftime("%d.%m.%Y")
+        except ValueError:
+            continue
+    raise ValueError(value)
+
+
+def _legacy_name(value):
+    parts = [part for part in value.strip().split() if part]
+    normalized = " ".join(parts)
+    if not any(ch.isalpha() for ch in normalized):
+        raise ValueError(value)
+    for part in parts:
+        if not all(ch.isalpha() or ch in "-'" for ch in part):
+            raise ValueError(value)
+    return normalized
+
+
+def _per_input(func, values) -> float:
+    start = time.perf_counter()
+    for value in values:
+        func(value)
+    return (time.perf_counter() - start) / len(values) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    people = make_people(args.rows, mixed_formats=True)
+    names = [name for name, _ in people]
+    birthdates = [born for _, born in people]
+
+    for label, legacy, current, values in (
+        ("birthdate", _legacy_birthdate, _normalize_birthdate, birthdates),
+        ("name", _legacy_name, _normalize_name, names),
+    ):
+        before = _per_input(legacy, values)
+        after = _per_input(current, values)
+        print(f"{label:>9}: {before:6.2f} us -> {after:6.2f} us per input ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
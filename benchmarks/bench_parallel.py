@@ -0,0 +1,97 @@
+"""Measure how bulk workloads scale with the number of worker processes.
+
+Usage: python -m benchmarks.bench_parallel [--rows N] [--workers 1 2 4 ...] [--chunk-size N]
+
+Speedup is relative to ``workers=1`` (no pool). It can only grow with the number
+of idle cores: on a machine with fewer cores than workers the extra processes
+just compete for the same CPUs.
+"""
+
+import argparse
+import io
+import json
+import time
+
+from numbers_core import ProfileInput, build_profiles
+from numbers_core.core.batch import BatchOptions, run_batch
+from numbers_core.core.parallel import (
+    DEFAULT_CHUNK_SIZE,
+    build_profiles_parallel,
+    compatibility_matrix_parallel,
+    default_workers,
+)
+
+from .datasets import make_people
+
+
+def _worker_counts(limit: int) -> list[int]:
+    counts = [1]
+    while counts[-1] * 2 <= limit:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != limit:
+        counts.append(limit)
+    return counts
+
+
+def _profiles(people, workers, chunk_size):
+    inputs = [ProfileInput(name, born) for name, born in people]
+    return lambda: build_profiles_parallel(inputs, workers, chunk_size)
+
+
+def _batch(people, workers, chunk_size):
+    source = "".join(
+        json.dumps({"full_name": name, "birthdate": born}, ensure_ascii=False) + "\n"
+        for name, born in people
+    )
+    options = BatchOptions(extended=True, bridges=True, personal_years=10)
+
+    def run():
+        sink = io.StringIO()
+        run_batch(
+            io.StringIO(source), sink, sink, "jsonl", options, None, 10**9, workers, chunk_size
+        )
+
+    return run
+
+
+def _matrix(people, workers, chunk_size):
+    profiles = [item["profile"] for item in build_profiles(ProfileInput(*p) for p in people)]
+    return lambda: compatibility_matrix_parallel(profiles, workers=workers, chunk_size=chunk_size)
+
+
+WORKLOADS = {"profiles": _profiles, "batch": _batch, "matrix": _matrix}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--matrix-size", type=int, default=3_000)
+    parser.add_argument("--workers", type=int, nargs="+")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--matrix-chunk-size", type=int, default=128)
+    parser.add_argument("-k", dest="select", choices=sorted(WORKLOADS), action="append")
+    args = parser.parse_args()
+
+    workers_list = args.workers or _worker_counts(default_workers())
+    print(f"{default_workers()} CPU(s) available")
+    for name in args.select or WORKLOADS:
+        matrix = name == "matrix"
+        rows = args.matrix_size if matrix else args.rows
+        chunk_size = args.matrix_chunk_size if matrix else args.chunk_size
+        people = make_people(rows, mixed_formats=not matrix)
+        baseline = None
+        for workers in workers_list:
+            run = WORKLOADS[name](people, workers, chunk_size)
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            speedup = baseline / elapsed
+            print(
+                f"{name:>8} workers={workers:<3} {rows / elapsed:>12,.0f} rows/s "
+                f"speedup {speedup:>5.2f}x efficiency {speedup / workers:>4.0%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
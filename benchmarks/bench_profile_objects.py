@@ -0,0 +1,50 @@
+"""Memory per profile and construction time: dict-of-strings vs CoreProfile.
+
+Usage: python -m benchmarks.bench_profile_objects [--rows N]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from numbers_core.calc.profile import CoreProfile, calculate_core_profile
+
+from .datasets import make_people
+
+
+def _measure(label, build, people):
+    start = time.perf_counter()
+    kept = [build(name, born) for name, born in people]
+    elapsed = time.perf_counter() - start
+    del kept
+
+    gc.collect()
+    tracemalloc.start()
+    kept = [build(name, born) for name, born in people]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_item = (size - 8 * len(kept)) / len(kept)
+    print(
+        f"{label:>12}: {per_item:>7.1f} B/profile, {elapsed / len(people) * 1e6:>6.2f} us/profile"
+    )
+    return kept
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    people = make_people(args.rows)
+    _measure("dict", calculate_core_profile, people)
+    profiles = _measure("CoreProfile", CoreProfile.calculate, people)
+
+    start = time.perf_counter()
+    for profile in profiles:
+        profile.to_dict()
+    print(f"     to_dict: {(time.perf_counter() - start) / len(profiles) * 1e6:>6.2f} us/profile")
+
+
+if __name__ == "__main__":
+    main()
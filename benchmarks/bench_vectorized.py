@@ -0,0 +1,43 @@
+"""Compare the NumPy columnar engine with calculate_core_profile.
+
+Usage: python -m benchmarks.bench_vectorized [--rows N] [--scalar-rows N]
+"""
+
+import argparse
+import time
+
+from numbers_core.calc.profile import calculate_core_profile
+from numbers_core.calc.vectorized import calculate_core_profiles_columnar
+
+from .datasets import make_people
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--scalar-rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    people = make_people(args.rows)
+    names = [name for name, _ in people]
+    days = [int(born[:2]) for _, born in people]
+    months = [int(born[3:5]) for _, born in people]
+    years = [int(born[6:]) for _, born in people]
+
+    calculate_core_profiles_columnar(names[:10], days[:10], months[:10], years[:10])
+    start = time.perf_counter()
+    calculate_core_profiles_columnar(names, days, months, years)
+    columnar = args.rows / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for name, born in people[: args.scalar_rows]:
+        calculate_core_profile(name, born)
+    scalar = args.scalar_rows / (time.perf_counter() - start)
+
+    print(f"  scalar: {scalar:>12.0f} rows/s")
+    print(f"columnar: {columnar:>12.0f} rows/s ({args.rows} rows)")
+    print(f" speedup: {columnar / scalar:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
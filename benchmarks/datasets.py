@@ -0,0 +1,58 @@
+"""Fixed, reproducible input data for benchmarks."""
+
+import random
+from datetime import date, timedelta
+
+FIRST_NAMES = (
+    "Иван",
+    "Анна",
+    "Пётр",
+    "Мария",
+    "Алексей",
+    "Ольга",
+    "Сергей",
+    "Елена",
+    "Дмитрий",
+    "Наталья",
+    "Андрей",
+    "Татьяна",
+    "Михаил",
+    "Юлия",
+    "Николай",
+    "Ксения",
+)
+LAST_NAMES = (
+    "Иванов",
+    "Петрова",
+    "Сидоров",
+    "Смирнова",
+    "Кузнецов",
+    "Попова",
+    "Соколов",
+    "Лебедева",
+    "Козлов",
+    "Новикова",
+    "Морозов",
+    "Волкова",
+    "Анна-Мария",
+    "Д'Артаньян",
+)
+DATE_FORMATS = ("%d.%m.%Y", "%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y")
+
+_FIRST_DAY = date(1930, 1, 1)
+_SPAN_DAYS = (date(2015, 12, 31) - _FIRST_DAY).days
+
+
+def make_people(
+    count: int, seed: int = 20240601, mixed_formats: bool = False
+) -> list[tuple[str, str]]:
+    """Return ``count`` deterministic (full_name, birthdate) pairs."""
+
+    rng = random.Random(seed)
+    people = []
+    for _ in range(count):
+        name = f"{rng.choice(LAST_NAMES)} {rng.choice(FIRST_NAMES)}"
+        born = _FIRST_DAY + timedelta(days=rng.randrange(_SPAN_DAYS))
+        fmt = rng.choice(DATE_FORMATS) if mixed_formats else DATE_FORMATS[0]
+        people.append((name, born.strftime(fmt)))
+    return people
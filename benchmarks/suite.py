@@ -0,0 +1,294 @@
+"""Microbenchmarks for the calc, orchestrator and prompt layers.
+
+Every benchmark runs over a fixed dataset from :mod:`benchmarks.datasets` and
+reports the best per-item time over several repeats. Results are written as JSON
+so two runs can be compared; ``compare`` fails when a benchmark present in both
+files got slower than the threshold allows.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Callable, Iterable
+
+from numbers_core.calc import bridges, compatibility, days, extended_profile, mapping, math
+from numbers_core.calc import months, names, profile, years
+from numbers_core.core.orchestrator import ProfileInput, build_profile, build_profiles
+from numbers_core.intelligence.prompts.loader import PROMPTS_DIR, PromptRegistry, load_prompt
+
+from .datasets import make_people
+
+SCHEMA_VERSION = 1
+DEFAULT_THRESHOLD = 0.15
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """``setup(rows)`` returns the callable to time and the number of items it processes."""
+
+    name: str
+    setup: Callable[[int], tuple[Callable[[], object], int]]
+
+
+def _each(func: Callable, items: list) -> tuple[Callable[[], None], int]:
+    def run() -> None:
+        for item in items:
+            func(*item)
+
+    return run, len(items)
+
+
+def _people(rows: int, mixed_formats: bool = False) -> list[tuple[str, str]]:
+    return make_people(rows, mixed_formats=mixed_formats)
+
+
+def _birthdates(rows: int) -> list[tuple[str]]:
+    return [(born,) for _, born in _people(rows)]
+
+
+def _names(rows: int) -> list[tuple[str]]:
+    return [(name,) for name, _ in _people(rows)]
+
+
+def _profiles(rows: int) -> list[dict]:
+    return [profile.calculate_core_profile(name, born) for name, born in _people(rows)]
+
+
+def _tenth(rows: int) -> int:
+    """Dataset size for benchmarks that do ~10x more work per item, at least one item."""
+
+    return max(rows // 10, 1)
+
+
+def _compare_pairs(rows: int):
+    core = _profiles(rows)
+    return _each(compatibility.compare_core_profiles, list(zip(core, reversed(core))))
+
+
+def _prompt_inputs(rows: int) -> list[dict]:
+    return _profiles(min(rows, 200))
+
+
+def _load_prompt(rows: int):
+    user = str(PROMPTS_DIR / "numerology.ru.md")
+    system = str(PROMPTS_DIR / "system.ru.md")
+    return _each(load_prompt, [(user, system, item) for item in _prompt_inputs(rows)])
+
+
+def _render_prompt(rows: int):
+    registry = PromptRegistry(check_interval=None)
+    registry.preload()
+    return _each(registry.render, [(item, "ru") for item in _prompt_inputs(rows)])
+
+
+def _build_profile(rows: int):
+    inputs = [(ProfileInput(name, born),) for name, born in _people(rows, mixed_formats=True)]
+    return _each(build_profile, inputs)
+
+
+def _build_profiles(rows: int):
+    inputs = [ProfileInput(name, born) for name, born in _people(rows, mixed_formats=True)]
+    return (lambda: build_profiles(inputs)), len(inputs)
+
+
+_TARGET = date(2025, 6, 15)
+
+BENCHMARKS = (
+    Benchmark(
+        "math.reduce_number", lambda rows: _each(math.reduce_number, [(n,) for n in range(rows)])
+    ),
+    Benchmark(
+        "math.reduce_number.large",
+        lambda rows: _each(math.reduce_number, [(10**6 + n * 7919,) for n in range(rows)]),
+    ),
+    Benchmark(
+        "math.extract_base",
+        lambda rows: _each(math.extract_base, [(math.reduce_number(n),) for n in range(rows)]),
+    ),
+    Benchmark("mapping.name_to_numbers", lambda rows: _each(mapping.name_to_numbers, _names(rows))),
+    Benchmark("names.score_name", lambda rows: _each(names.score_name, _names(rows))),
+    Benchmark(
+        "profile.calculate_life_path_number",
+        lambda rows: _each(profile.calculate_life_path_number, _birthdates(rows)),
+    ),
+    Benchmark(
+        "profile.calculate_birthday_number",
+        lambda rows: _each(profile.calculate_birthday_number, _birthdates(rows)),
+    ),
+    Benchmark(
+        "profile.calculate_expression_number",
+        lambda rows: _each(profile.calculate_expression_number, _names(rows)),
+    ),
+    Benchmark(
+        "profile.calculate_soul_number",
+        lambda rows: _each(profile.calculate_soul_number, _names(rows)),
+    ),
+    Benchmark(
+        "profile.calculate_personality_number",
+        lambda rows: _each(profile.calculate_personality_number, _names(rows)),
+    ),
+    Benchmark(
+        "profile.calculate_core_profile",
+        lambda rows: _each(profile.calculate_core_profile, _people(rows)),
+    ),
+    Benchmark(
+        "extended_profile.calculate_balance",
+        lambda rows: _each(extended_profile.calculate_balance, _names(rows)),
+    ),
+    Benchmark(
+        "extended_profile.calculate_growth",
+        lambda rows: _each(extended_profile.calculate_growth, _birthdates(rows)),
+    ),
+    Benchmark(
+        "extended_profile.calculate_realization",
+        lambda rows: _each(extended_profile.calculate_realization, _people(rows)),
+    ),
+    Benchmark(
+        "extended_profile.calculate_mind",
+        lambda rows: _each(extended_profile.calculate_mind, _people(rows)),
+    ),
+    Benchmark(
+        "extended_profile.calculate_extended_profile",
+        lambda rows: _each(extended_profile.calculate_extended_profile, _people(rows)),
+    ),
+    Benchmark(
+        "bridges.calculate_bridges",
+        lambda rows: _each(bridges.calculate_bridges, [(item,) for item in _profiles(rows)]),
+    ),
+    Benchmark(
+        "years.calculate_personal_year",
+        lambda rows: _each(
+            years.calculate_personal_year, [(born, 2025) for (born,) in _birthdates(rows)]
+        ),
+    ),
+    Benchmark(
+        "years.get_personal_years",
+        lambda rows: _each(years.get_personal_years, _birthdates(rows)),
+    ),
+    Benchmark(
+        "days.calculate_personal_day_base",
+        lambda rows: _each(
+            days.calculate_personal_day_base, [(born, _TARGET) for (born,) in _birthdates(rows)]
+        ),
+    ),
+    Benchmark(
+        "days.generate_calendar_matrix",
+        lambda rows: _each(
+            days.generate_calendar_matrix,
+            [(born, 2025, 6) for (born,) in _birthdates(_tenth(rows))],
+        ),
+    ),
+    Benchmark(
+        "days.generate_personal_days.year",
+        lambda rows: _each(
+            days.generate_personal_days, [(born, 2025) for (born,) in _birthdates(_tenth(rows))]
+        ),
+    ),
+    Benchmark(
+        "months.get_personal_month",
+        lambda rows: _each(
+            months.get_personal_month, [(born, 2025, 6) for (born,) in _birthdates(rows)]
+        ),
+    ),
+    Benchmark(
+        "months.generate_personal_month_matrix",
+        lambda rows: _each(months.generate_personal_month_matrix, _birthdates(_tenth(rows))),
+    ),
+    Benchmark("compatibility.compare_core_profiles", _compare_pairs),
+    Benchmark("orchestrator.build_profile", _build_profile),
+    Benchmark("orchestrator.build_profiles", _build_profiles),
+    Benchmark("prompts.load_prompt", _load_prompt),
+    Benchmark("prompts.registry.render", _render_prompt),
+)
+
+
+def _time(run: Callable[[], object], items: int, repeat: int, min_time: float) -> dict:
+    run()  # warm-up: imports, lazily compiled tables, caches
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2
+    samples = [elapsed]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        samples.append(time.perf_counter() - start)
+    per_item = [sample / (loops * items) * 1e9 for sample in samples]
+    return {
+        "ns_per_item": min(per_item),
+        "median_ns_per_item": statistics.median(per_item),
+        "items": items,
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def run_suite(
+    rows: int = 2_000,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    select: Iterable[str] | None = None,
+    progress: Callable[[str, dict], None] | None = None,
+) -> dict:
+    """Run the selected benchmarks (all by default; ``select`` matches name substrings)."""
+
+    patterns = list(select or ())
+    results = {}
+    for benchmark in BENCHMARKS:
+        if patterns and not any(pattern in benchmark.name for pattern in patterns):
+            continue
+        run, items = benchmark.setup(rows)
+        if not items:
+            continue
+        results[benchmark.name] = _time(run, items, repeat, min_time)
+        if progress is not None:
+            progress(benchmark.name, results[benchmark.name])
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "rows": rows,
+        "results": results,
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """Rows ``(name, baseline_ns, current_ns, ratio, regressed)`` for shared benchmarks."""
+
+    rows = []
+    for name, before in baseline["results"].items():
+        after = current["results"].get(name)
+        if after is None:
+            continue
+        ratio = after["ns_per_item"] / before["ns_per_item"]
+        rows.append(
+            (name, before["ns_per_item"], after["ns_per_item"], ratio, ratio > 1 + threshold)
+        )
+    return rows
+
+
+def load_results(path: str) -> dict:
+    with open(path, encoding="utf-8") as fh:
+        data = json.load(fh)
+    if data.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"{path}: unsupported benchmark results schema {data.get('schema')!r}")
+    return data
+
+
+def save_results(results: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2, sort_keys=True)
+        fh.write("\n")
@@ -1,8 +1,67 @@
-from numbers_core.core.orchestrator import analyze_profile, build_profile, run, ProfileInput
+from typing import TYPE_CHECKING
+
+from numbers_core.helpers.lazy import lazy_exports
+
+# Names resolve on first access, so calc-only consumers never import the AI stack.
+_EXPORTS = {
+    ".core.orchestrator": (
+        "ProfileInput",
+        "build_profile",
+        "build_profile_fields",
+        "build_profiles",
+        "build_normalized_profile",
+        "normalize_input",
+        "normalize_birthdate",
+        "normalize_name",
+        "normalize_cached",
+        "build_calendar",
+        "build_personal_months",
+        "analyze_profile",
+        "analyze_profile_async",
+        "analyze_profile_stream",
+        "run",
+    ),
+    ".core.parallel": ("build_profiles_parallel", "compatibility_matrix_parallel"),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+if TYPE_CHECKING:
+    from numbers_core.core.orchestrator import (
+        ProfileInput,
+        analyze_profile,
+        analyze_profile_async,
+        analyze_profile_stream,
+        build_calendar,
+        build_normalized_profile,
+        build_personal_months,
+        build_profile,
+        build_profile_fields,
+        build_profiles,
+        normalize_birthdate,
+        normalize_cached,
+        normalize_input,
+        normalize_name,
+        run,
+    )
+    from numbers_core.core.parallel import build_profiles_parallel, compatibility_matrix_parallel
 
 __all__ = [
     "ProfileInput",
     "build_profile",
+    "build_profile_fields",
+    "build_profiles",
+    "build_normalized_profile",
+    "normalize_input",
+    "normalize_birthdate",
+    "normalize_name",
+    "normalize_cached",
+    "build_profiles_parallel",
+    "compatibility_matrix_parallel",
+    "build_calendar",
+    "build_personal_months",
     "analyze_profile",
+    "analyze_profile_async",
+    "analyze_profile_stream",
     "run",
 ]
@@ -0,0 +1,104 @@
+"""Command-line entry point.
+
+Usage:
+    python -m numbers_core batch people.csv --output profiles.jsonl --errors errors.jsonl
+    cat people.jsonl | python -m numbers_core batch --extended --bridges --personal-years
+"""
+
+import argparse
+import sys
+from contextlib import ExitStack
+
+from numbers_core.core.batch import FORMATS, BatchOptions, detect_format, run_batch
+from numbers_core.core.parallel import DEFAULT_CHUNK_SIZE, default_workers
+
+
+def _print_progress(stats) -> None:
+    print(stats.summary(), file=sys.stderr, flush=True)
+
+
+def _open(stack: ExitStack, path, mode: str, default):
+    if path is None or path == "-":
+        return default
+    # utf-8-sig drops the BOM that spreadsheet exports put in front of CSV headers
+    encoding = "utf-8-sig" if "r" in mode else "utf-8"
+    return stack.enter_context(open(path, mode, encoding=encoding, newline=""))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m numbers_core", description="Numbers Core tools"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser(
+        "batch", help="profile (name, birthdate) rows from CSV or JSONL into JSON lines"
+    )
+    batch.add_argument("input", nargs="?", default="-", help="input file, - for stdin (default)")
+    batch.add_argument("--format", choices=("auto", *FORMATS), default="auto")
+    batch.add_argument("--output", "-o", help="results file (default: stdout)")
+    batch.add_argument("--errors", help="per-row errors file (default: stderr)")
+    batch.add_argument("--extended", action="store_true", help="add the extended profile")
+    batch.add_argument("--bridges", action="store_true", help="add bridges between numbers")
+    batch.add_argument(
+        "--personal-years",
+        type=int,
+        nargs="?",
+        const=10,
+        default=0,
+        metavar="N",
+        help="add N personal years starting this year (10 if N is omitted)",
+    )
+    batch.add_argument("--name-field", help="name column (default: full_name, then name)")
+    batch.add_argument("--birthdate-field", default="birthdate")
+    batch.add_argument("--id-field", default="id", help="column copied to results as id")
+    batch.add_argument(
+        "--progress-every", type=int, default=100_000, metavar="ROWS", help="report interval"
+    )
+    batch.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=1,
+        help="worker processes (0: one per CPU, default: 1 — no pool)",
+    )
+    batch.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="rows per worker task"
+    )
+    batch.add_argument("--quiet", "-q", action="store_true", help="no progress or summary")
+
+    args = parser.parse_args(argv)
+    fmt = detect_format(args.input) if args.format == "auto" else args.format
+    try:
+        options = BatchOptions(
+            extended=args.extended,
+            bridges=args.bridges,
+            personal_years=args.personal_years,
+            name_field=args.name_field,
+            birthdate_field=args.birthdate_field,
+            id_field=args.id_field,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    with ExitStack() as stack:
+        source = _open(stack, args.input, "r", sys.stdin)
+        output = _open(stack, args.output, "w", sys.stdout)
+        errors = _open(stack, args.errors, "w", sys.stderr)
+        stats = run_batch(
+            source,
+            output,
+            errors,
+            fmt,
+            options,
+            progress=None if args.quiet else _print_progress,
+            progress_every=max(args.progress_every, 1),
+            workers=args.workers or default_workers(),
+            chunk_size=args.chunk_size,
+        )
+    if not args.quiet:
+        _print_progress(stats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,62 +1,134 @@
 from .bridges import calculate_bridge, calculate_bridges
 from .compatibility import (
+    COMPONENT_LABELS,
+    CompatibilityMatrix,
     compare_core_profiles,
+    compatibility_matrix,
+    compatibility_matrix_from_bases,
+    component_score,
     format_comparison_text,
+    profile_bases,
     score_compatibility,
 )
-from .days import calculate_personal_day_base, generate_calendar_matrix
+from .dates import BirthDate, date_parts
+from .days import (
+    CalendarMonth,
+    calculate_personal_day_base,
+    calendar_month,
+    generate_calendar_matrix,
+    generate_personal_days,
+)
 from .extended_profile import (
+    EXTENDED_COMPONENTS,
+    ExtendedProfile,
     calculate_balance,
     calculate_extended_profile,
     calculate_growth,
     calculate_mind,
     calculate_realization,
 )
+from .graph import (
+    ALGORITHM_VERSION,
+    PROFILE_FIELDS,
+    ProfileGraph,
+    calculate_profile_sections,
+    parse_profile_fields,
+)
+from .matching import MatchIndex
 from .mapping import VOWELS, calculate_sum_by_letters, name_to_numbers
-from .math import extract_base, reduce_number, sum_digits_from_date_parts
+from .names import ALPHABETS, Alphabet, NameScore, NameScorer, score_name
+from .math import (
+    ReducedNumber,
+    extract_base,
+    parse_reduced,
+    reduce_number,
+    reduce_value,
+    sum_digits_from_date_parts,
+)
 from .months import (
     MONTH_NAMES,
     generate_personal_month_cycle_table,
     generate_personal_month_matrix,
     get_personal_month,
+    personal_months,
+    personal_year_base,
+    reduction_class,
 )
 from .profile import (
+    CORE_COMPONENTS,
+    CoreProfile,
     calculate_birthday_number,
     calculate_core_profile,
+    calculate_date_numbers,
     calculate_expression_number,
     calculate_life_path_number,
+    calculate_name_numbers,
     calculate_personality_number,
     calculate_soul_number,
 )
 from .years import calculate_personal_year, get_personal_years
 
 __all__ = [
+    "BirthDate",
+    "date_parts",
     "calculate_bridge",
     "calculate_bridges",
+    "COMPONENT_LABELS",
+    "CompatibilityMatrix",
     "compare_core_profiles",
+    "compatibility_matrix",
+    "compatibility_matrix_from_bases",
+    "component_score",
     "format_comparison_text",
+    "profile_bases",
     "score_compatibility",
     "calculate_personal_day_base",
+    "calendar_month",
     "generate_calendar_matrix",
+    "CalendarMonth",
+    "generate_personal_days",
+    "EXTENDED_COMPONENTS",
+    "ExtendedProfile",
     "calculate_balance",
     "calculate_extended_profile",
     "calculate_growth",
     "calculate_mind",
     "calculate_realization",
+    "ALGORITHM_VERSION",
+    "PROFILE_FIELDS",
+    "ProfileGraph",
+    "calculate_profile_sections",
+    "parse_profile_fields",
+    "MatchIndex",
     "VOWELS",
     "calculate_sum_by_letters",
     "name_to_numbers",
+    "ALPHABETS",
+    "Alphabet",
+    "NameScore",
+    "NameScorer",
+    "score_name",
+    "ReducedNumber",
     "extract_base",
+    "parse_reduced",
     "reduce_number",
+    "reduce_value",
     "sum_digits_from_date_parts",
     "MONTH_NAMES",
     "generate_personal_month_cycle_table",
     "generate_personal_month_matrix",
     "get_personal_month",
+    "personal_months",
+    "personal_year_base",
+    "reduction_class",
+    "CORE_COMPONENTS",
+    "CoreProfile",
     "calculate_birthday_number",
     "calculate_core_profile",
+    "calculate_date_numbers",
     "calculate_expression_number",
     "calculate_life_path_number",
+    "calculate_name_numbers",
     "calculate_personality_number",
     "calculate_soul_number",
     "calculate_personal_year",
@@ -1,15 +1,27 @@
-﻿from .math import extract_base
+﻿from .math import ReducedNumber, extract_base
+from .profile import CoreProfile
 
 
-def calculate_bridge(a: str, b: str) -> int:
+def calculate_bridge(a: str | ReducedNumber, b: str | ReducedNumber) -> int:
     """Разность редуцированных значений двух показателей."""
 
     return abs(extract_base(a) - extract_base(b))
 
 
-def calculate_bridges(core_profile: dict) -> dict:
+def calculate_bridges(core_profile: dict | CoreProfile) -> dict:
     """Подбирает «мосты» между ключевыми компонентами профиля."""
 
+    if isinstance(core_profile, CoreProfile):
+        life_path, _, expression, soul, personality = (
+            value.base for value in core_profile.values()
+        )
+        return {
+            "expression_soul": abs(expression - soul),
+            "soul_personality": abs(soul - personality),
+            "life_soul": abs(life_path - soul),
+            "life_personality": abs(life_path - personality),
+        }
+
     return {
         "expression_soul": calculate_bridge(core_profile["expression"], core_profile["soul"]),
         "soul_personality": calculate_bridge(core_profile["soul"], core_profile["personality"]),
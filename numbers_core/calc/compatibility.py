@@ -1,36 +1,43 @@
-﻿from .bridges import calculate_bridge
+﻿from dataclasses import dataclass
+from typing import Any, Sequence
+
 from .math import extract_base
+from .profile import CORE_COMPONENTS, CoreProfile
 
+COMPONENT_LABELS = {
+    "life_path": "Число жизненного пути",
+    "birthday": "Число рождения",
+    "expression": "Число выражения",
+    "soul": "Число души",
+    "personality": "Число личности",
+}
 
-def compare_core_profiles(profile_a: dict, profile_b: dict) -> list[dict]:
-    """Создаёт таблицу сопоставления двух базовых профилей."""
 
-    components = ["life_path", "birthday", "expression", "soul", "personality"]
-    labels = {
-        "life_path": "Число жизненного пути",
-        "birthday": "Число рождения",
-        "expression": "Число выражения",
-        "soul": "Число души",
-        "personality": "Число личности",
-    }
+def _component_values(profile: dict | CoreProfile) -> tuple:
+    if isinstance(profile, CoreProfile):
+        return tuple(str(value) for value in profile.values())
+    return tuple(profile.get(comp) for comp in CORE_COMPONENTS)
+
+
+def compare_core_profiles(
+    profile_a: dict | CoreProfile, profile_b: dict | CoreProfile
+) -> list[dict]:
+    """Создаёт таблицу сопоставления двух базовых профилей."""
 
     table = []
-    for comp in components:
-        val_a = profile_a.get(comp)
-        val_b = profile_b.get(comp)
+    for comp, val_a, val_b in zip(
+        CORE_COMPONENTS, _component_values(profile_a), _component_values(profile_b)
+    ):
         base_a = extract_base(val_a)
         base_b = extract_base(val_b)
-        match = base_a == base_b
-        bridge = calculate_bridge(val_a, val_b)
-
         table.append(
             {
                 "component": comp,
-                "label": labels[comp],
+                "label": COMPONENT_LABELS[comp],
                 "value_a": val_a,
                 "value_b": val_b,
-                "match": match,
-                "bridge": bridge,
+                "match": base_a == base_b,
+                "bridge": abs(base_a - base_b),
             }
         )
     return table
@@ -56,7 +63,89 @@ def format_comparison_text(table: list[dict]) -> str:
         "|-----------|-----------|-----------|------------|------|",
     ]
     for row in table:
+        match = "Да" if row["match"] else "Нет"
         lines.append(
-            f"| {row['label']} | {row['value_a']} | {row['value_b']} | {'Да' if row['match'] else 'Нет'} | {row['bridge']} |"
+            f"| {row['label']} | {row['value_a']} | {row['value_b']} | {match} | {row['bridge']} |"
         )
     return "\n".join(lines)
+
+
+def component_score(base_a: int, base_b: int) -> int:
+    """Вклад одного показателя в балл: 2 за совпадение, 1 за мост не больше 1."""
+
+    if base_a == base_b:
+        return 2
+    return 1 if abs(base_a - base_b) <= 1 else 0
+
+
+def profile_bases(profile: dict | CoreProfile) -> tuple[int, ...]:
+    """Базовые значения показателей профиля в порядке CORE_COMPONENTS."""
+
+    return tuple(extract_base(value) for value in _component_values(profile))
+
+
+@dataclass
+class CompatibilityMatrix:
+    """Баллы совместимости всех пар и, по запросу, совпадения и мосты по показателям.
+
+    ``scores[i][j]`` совпадает с ``score_compatibility(compare_core_profiles(a[i], b[j]))``;
+    ``matches``/``bridges`` имеют форму N×M×5 в порядке CORE_COMPONENTS. При наличии
+    NumPy поля — массивы ``numpy.ndarray``, иначе вложенные списки.
+    """
+
+    scores: Any
+    matches: Any = None
+    bridges: Any = None
+
+    def to_dict(self) -> dict:
+        result = {"components": list(CORE_COMPONENTS), "scores": _as_list(self.scores)}
+        if self.matches is not None:
+            result["matches"] = _as_list(self.matches)
+            result["bridges"] = _as_list(self.bridges)
+        return result
+
+
+def _as_list(value: Any) -> list:
+    return value.tolist() if hasattr(value, "tolist") else value
+
+
+def compatibility_matrix(
+    profiles_a: Sequence[dict | CoreProfile],
+    profiles_b: Sequence[dict | CoreProfile] | None = None,
+    details: bool = False,
+) -> CompatibilityMatrix:
+    """Считает совместимость всех пар N×M (без ``profiles_b`` — N×N внутри группы)."""
+
+    bases_a = [profile_bases(profile) for profile in profiles_a]
+    bases_b = bases_a if profiles_b is None else [profile_bases(p) for p in profiles_b]
+    return compatibility_matrix_from_bases(bases_a, bases_b, details)
+
+
+def compatibility_matrix_from_bases(
+    bases_a: Sequence[tuple[int, ...]],
+    bases_b: Sequence[tuple[int, ...]],
+    details: bool = False,
+) -> CompatibilityMatrix:
+    """Как compatibility_matrix, но по готовым базовым значениям из profile_bases."""
+
+    from .vectorized import np
+
+    if np is not None:
+        from .vectorized import compatibility_matrix_columnar
+
+        return CompatibilityMatrix(*compatibility_matrix_columnar(bases_a, bases_b, details))
+
+    rows_by_signature: dict[tuple[int, ...], list[int]] = {}
+    scores = []
+    for signature in bases_a:
+        row = rows_by_signature.get(signature)
+        if row is None:
+            row = rows_by_signature[signature] = [
+                sum(component_score(a, b) for a, b in zip(signature, other)) for other in bases_b
+            ]
+        scores.append(row)
+    if not details:
+        return CompatibilityMatrix(scores)
+    matches = [[[a == b for a, b in zip(sa, sb)] for sb in bases_b] for sa in bases_a]
+    bridges = [[[abs(a - b) for a, b in zip(sa, sb)] for sb in bases_b] for sa in bases_a]
+    return CompatibilityMatrix(scores, matches, bridges)
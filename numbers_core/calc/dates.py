@@ -0,0 +1,30 @@
+from typing import NamedTuple
+
+
+class BirthDate(NamedTuple):
+    """Дата рождения, уже разобранная на день, месяц и год."""
+
+    day: int
+    month: int
+    year: int
+
+    def __str__(self) -> str:
+        # Как strftime("%d.%m.%Y"): год без ведущих нулей
+        return f"{self.day:02d}.{self.month:02d}.{self.year}"
+
+
+def date_parts(value: "str | BirthDate") -> BirthDate:
+    """День, месяц и год из BirthDate или строки формата DD.MM.YYYY."""
+
+    if isinstance(value, BirthDate):
+        return value
+    day, month, year = value.strip().split(".")
+    return BirthDate(int(day), int(month), int(year))
+
+
+def date_field(value: "str | BirthDate", index: int) -> int:
+    """Один компонент даты (0 — день, 1 — месяц, 2 — год) без разбора остальных."""
+
+    if isinstance(value, BirthDate):
+        return value[index]
+    return int(value.split(".")[index])
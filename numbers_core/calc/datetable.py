@@ -0,0 +1,171 @@
+"""Предрасчитанная таблица чисел, зависящих только от даты рождения.
+
+Для каждой даты 1900–2100 хранится запись из ``RECORD_SIZE`` байт: исходные суммы,
+из которых ``reduce_value`` восстанавливает показатели с пометками мастеров и кармы,
+и флаги. Файл генерируется один раз в каталог кэша и отображается в память только
+для чтения, поэтому несколько процессов (воркеров uvicorn) делят одни и те же
+страницы. Индекс записи — «слот» (год, месяц, день) с 31 днём в каждом месяце;
+слоты несуществующих дат заполнены нулями.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from .math import KARMIC_NUMBERS, MASTER_NUMBERS, reduce_value
+
+FIRST_YEAR = 1900
+LAST_YEAR = 2100
+TABLE_VERSION = 2
+
+# Поля записи
+LIFE_PATH = 0  # сумма редуцированных дня, месяца и года (исходное число пути)
+DAY = 1  # день — исходное число дня рождения и части числа разума
+MONTH = 2  # месяц — исходное число роста
+DAY_BASE = 3
+MONTH_BASE = 4
+FLAGS = 5
+RECORD_SIZE = 6
+
+# Флаги
+FLAG_VALID = 0x80
+FLAG_LIFE_PATH_MASTER = 0x01
+FLAG_LIFE_PATH_KARMIC = 0x02
+FLAG_BIRTHDAY_MASTER = 0x04
+FLAG_BIRTHDAY_KARMIC = 0x08
+
+_HEADER = struct.Struct("<4sHHHH4x")
+HEADER_SIZE = _HEADER.size
+_MAGIC = b"NCDT"
+_SLOTS = (LAST_YEAR - FIRST_YEAR + 1) * 12 * 31
+
+
+def slot_index(day: int, month: int, year: int) -> int | None:
+    """Номер слота даты в таблице или None, если дата вне диапазона."""
+
+    if FIRST_YEAR <= year <= LAST_YEAR and 1 <= month <= 12 and 1 <= day <= 31:
+        return ((year - FIRST_YEAR) * 12 + month - 1) * 31 + day - 1
+    return None
+
+
+def build_record(day: int, month: int, year: int) -> bytes:
+    """Запись таблицы для одной даты (нули — для несуществующей даты)."""
+
+    try:
+        date(year, month, day)
+    except ValueError:
+        return bytes(RECORD_SIZE)
+    day_base, month_base = reduce_value(day).base, reduce_value(month).base
+    life_path = day_base + month_base + reduce_value(year).base
+    flags = FLAG_VALID
+    if life_path in MASTER_NUMBERS:
+        flags |= FLAG_LIFE_PATH_MASTER
+    if life_path in KARMIC_NUMBERS:
+        flags |= FLAG_LIFE_PATH_KARMIC
+    if day in MASTER_NUMBERS:
+        flags |= FLAG_BIRTHDAY_MASTER
+    if day in KARMIC_NUMBERS:
+        flags |= FLAG_BIRTHDAY_KARMIC
+    return bytes((life_path, day, month, day_base, month_base, flags))
+
+
+def build_table() -> bytes:
+    """Содержимое файла таблицы: заголовок и записи всех слотов."""
+
+    header = _HEADER.pack(_MAGIC, TABLE_VERSION, FIRST_YEAR, LAST_YEAR, RECORD_SIZE)
+    records = bytearray(_SLOTS * RECORD_SIZE)
+    for year in range(FIRST_YEAR, LAST_YEAR + 1):
+        for month in range(1, 13):
+            for day in range(1, 32):
+                offset = slot_index(day, month, year) * RECORD_SIZE
+                records[offset : offset + RECORD_SIZE] = build_record(day, month, year)
+    return header + bytes(records)
+
+
+def default_path() -> Path:
+    """Путь файла таблицы: ``NUMBERS_DATE_TABLE_PATH`` или каталог кэша пользователя."""
+
+    configured = os.getenv("NUMBERS_DATE_TABLE_PATH")
+    if configured:
+        return Path(configured)
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "numbers_core" / f"dates-v{TABLE_VERSION}.bin"
+
+
+def write_table(path: Path) -> None:
+    """Атомарно записывает таблицу: параллельные процессы не увидят половину файла."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(build_table())
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _valid_header(data) -> bool:
+    if len(data) != HEADER_SIZE + _SLOTS * RECORD_SIZE:
+        return False
+    magic, version, first, last, size = _HEADER.unpack_from(data)
+    return (magic, version, first, last, size) == (
+        _MAGIC,
+        TABLE_VERSION,
+        FIRST_YEAR,
+        LAST_YEAR,
+        RECORD_SIZE,
+    )
+
+
+def open_table(path: Path | None = None) -> mmap.mmap:
+    """Отображает файл таблицы в память, при необходимости сгенерировав его."""
+
+    path = Path(path) if path is not None else default_path()
+    for _ in range(2):
+        try:
+            with open(path, "rb") as fh:
+                table = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):  # нет файла или он пустой
+            table = None
+        if table is not None and _valid_header(table):
+            return table
+        if table is not None:
+            table.close()
+        write_table(path)
+    raise OSError(f"date table at {path} is unusable")
+
+
+_UNLOADED = object()
+_table_data = _UNLOADED
+
+
+def load_table():
+    """Таблица текущего процесса (открывается при первом обращении) или None.
+
+    ``NUMBERS_DATE_TABLE=off`` выключает таблицу: все даты считаются напрямую.
+    """
+
+    global _table_data
+    if _table_data is _UNLOADED:
+        if os.getenv("NUMBERS_DATE_TABLE", "").lower() in ("0", "off", "false"):
+            _table_data = None
+        else:
+            try:
+                _table_data = open_table()
+            except OSError:
+                # Каталог кэша недоступен для записи — держим таблицу в памяти процесса.
+                _table_data = build_table()
+    return _table_data
+
+
+if __name__ == "__main__":  # pragma: no cover
+    target = default_path()
+    write_table(target)
+    print(f"date table written to {target}")
@@ -1,30 +1,96 @@
 ﻿from calendar import monthrange
+from dataclasses import dataclass
 from datetime import date
 
-from .math import extract_base, reduce_number
-from .years import calculate_personal_year
+from .dates import BirthDate
+from .math import ReducedNumber, reduce_value
+from .years import parse_components, personal_year_value
 
+# Личные дни месяца зависят только от базы личного месяца: строка на каждую базу,
+# обрезаемая до длины месяца.
+_DAY_ROWS = tuple(
+    tuple(reduce_value(personal_month + reduce_value(day).base).base for day in range(1, 32))
+    for personal_month in range(10)
+)
 
-def calculate_personal_day_base(birthdate: str, target_date: date) -> int:
+
+def calculate_personal_day_base(birthdate: str | BirthDate, target_date: date) -> int:
     """Рассчитывает базовое личное число дня для конкретной даты."""
 
-    personal_year = extract_base(calculate_personal_year(birthdate, target_date.year))
-    personal_month = extract_base(reduce_number(personal_year + target_date.month))
-    calendar_day = extract_base(reduce_number(target_date.day))
-    return extract_base(reduce_number(personal_month + calendar_day))
+    personal_year = personal_year_value(birthdate, target_date.year).base
+    personal_month = reduce_value(personal_year + target_date.month).base
+    calendar_day = reduce_value(target_date.day).base
+    return reduce_value(personal_month + calendar_day).base
+
+
+@dataclass(frozen=True, slots=True)
+class CalendarMonth:
+    """Личные числа одного календарного месяца."""
+
+    year: int
+    month: int
+    personal_year: ReducedNumber
+    personal_month: ReducedNumber
+    start_weekday: int
+    days: tuple[int, ...]
+
+    def to_dict(self) -> dict:
+        return {
+            "year": self.year,
+            "month": self.month,
+            "personal_year": str(self.personal_year),
+            "personal_month": str(self.personal_month),
+            "start_weekday": self.start_weekday,
+            "days": list(self.days),
+        }
+
+
+def calendar_month(year: int, month: int, personal_year: ReducedNumber) -> CalendarMonth:
+    """Личные числа месяца при уже известном личном годе."""
+
+    personal_month = reduce_value(personal_year.base + month)
+    start_weekday, last_day = monthrange(year, month)
+    return CalendarMonth(
+        year=year,
+        month=month,
+        personal_year=personal_year,
+        personal_month=personal_month,
+        start_weekday=start_weekday,
+        days=_DAY_ROWS[personal_month.base][:last_day],
+    )
+
+
+def generate_personal_days(
+    birthdate: str | BirthDate, year: int, months: int = 12, start_month: int = 1
+) -> list[CalendarMonth]:
+    """Личные дни для ``months`` месяцев подряд, начиная с ``start_month`` года ``year``.
+
+    Дата рождения разбирается один раз, личный год считается один раз на год,
+    личный месяц — один раз на месяц; дни берутся готовой строкой из таблицы.
+    """
+
+    if not 1 <= start_month <= 12:
+        raise ValueError(f"month must be within 1..12: {start_month}")
+    day, month, _ = parse_components(birthdate)
+    date_part = reduce_value(day).base + reduce_value(month).base
+
+    result: list[CalendarMonth] = []
+    personal_year = None
+    for index in range(start_month - 1, start_month - 1 + months):
+        current_year, current_month = year + index // 12, index % 12 + 1
+        if personal_year is None or current_month == 1:
+            personal_year = reduce_value(date_part + reduce_value(current_year).base)
+        result.append(calendar_month(current_year, current_month, personal_year))
+    return result
 
 
-def generate_calendar_matrix(birthdate: str, year: int, month: int) -> list[list[dict]]:
+def generate_calendar_matrix(birthdate: str | BirthDate, year: int, month: int) -> list[list[dict]]:
     """Формирует календарь месяца с подписями личных чисел дня."""
 
-    _, last_day = monthrange(year, month)
-    start_date = date(year, month, 1)
-    start_weekday = start_date.weekday()
+    (calendar_month,) = generate_personal_days(birthdate, year, months=1, start_month=month)
 
-    weeks, week = [], [None] * start_weekday
-    for day in range(1, last_day + 1):
-        date_obj = date(year, month, day)
-        p_day = calculate_personal_day_base(birthdate, date_obj)
+    weeks, week = [], [None] * calendar_month.start_weekday
+    for day, p_day in enumerate(calendar_month.days, start=1):
         week.append({"label": f"{day}\n{p_day}", "number": p_day})
         if len(week) == 7:
             weeks.append(week)
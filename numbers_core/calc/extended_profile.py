@@ -1,56 +1,109 @@
-﻿from .math import extract_base, reduce_number
-from .mapping import name_to_numbers
-from .profile import (
-    calculate_expression_number,
-    calculate_life_path_number,
-)
+﻿from dataclasses import dataclass
+
+from .dates import BirthDate, date_field
+from .names import score_name
+from .math import ReducedNumber, parse_reduced, reduce_value
+from .profile import CoreProfile, expression_value, life_path_value
+
+EXTENDED_COMPONENTS = ("balance", "growth", "realization", "mind")
+
+
+def balance_value(name: str) -> ReducedNumber:
+    """Число баланса по инициалам в имени."""
+
+    return reduce_value(score_name(name).initials)
+
+
+def growth_value(birthdate: str | BirthDate) -> ReducedNumber:
+    """Число роста (по месяцу рождения)."""
+
+    return reduce_value(date_field(birthdate, 1))
+
+
+def realization_value(name: str, birthdate: str | BirthDate) -> ReducedNumber:
+    """Число реализации как сумма выражения и жизненного пути."""
+
+    return reduce_value(expression_value(name).base + life_path_value(birthdate).base)
+
+
+def mind_value(name: str, birthdate: str | BirthDate) -> ReducedNumber:
+    """Число разума: первое имя + день рождения."""
+
+    name_value = reduce_value(score_name(name).first_name)
+    birth_value = reduce_value(date_field(birthdate, 0))
+    return reduce_value(name_value.base + birth_value.base)
 
 
 def calculate_balance(name: str) -> str:
     """Число баланса по инициалам в имени."""
 
-    parts = name.upper().split()
-    initials = [part[0] for part in parts if part]
-    values = []
-    for ch in initials:
-        numbers = name_to_numbers(ch)
-        if numbers:
-            values.append(numbers[0])
-    return reduce_number(sum(values)) if values else "0"
+    return str(balance_value(name))
 
 
-def calculate_growth(birthdate: str) -> str:
+def calculate_growth(birthdate: str | BirthDate) -> str:
     """Число роста (по месяцу рождения)."""
 
-    month = int(birthdate.split(".")[1])
-    return reduce_number(month)
+    return str(growth_value(birthdate))
 
 
-def calculate_realization(name: str, birthdate: str) -> str:
+def calculate_realization(name: str, birthdate: str | BirthDate) -> str:
     """Число реализации как сумма выражения и жизненного пути."""
 
-    expression = calculate_expression_number(name)
-    life_path = calculate_life_path_number(birthdate)
-    return reduce_number(extract_base(expression) + extract_base(life_path))
+    return str(realization_value(name, birthdate))
 
 
-def calculate_mind(name: str, birthdate: str) -> str:
+def calculate_mind(name: str, birthdate: str | BirthDate) -> str:
     """Число разума: первое имя + день рождения."""
 
-    parts = name.strip().split()
-    first_name = parts[1] if len(parts) > 1 else parts[0]
-    name_value = reduce_number(sum(name_to_numbers(first_name)))
-    day = int(birthdate.split(".")[0])
-    birth_value = reduce_number(day)
-    return reduce_number(extract_base(name_value) + extract_base(birth_value))
+    return str(mind_value(name, birthdate))
+
+
+@dataclass(frozen=True, slots=True)
+class ExtendedProfile:
+    """Расширенный профиль: баланс, рост, реализация и разум."""
+
+    balance: ReducedNumber
+    growth: ReducedNumber
+    realization: ReducedNumber
+    mind: ReducedNumber
+
+    @classmethod
+    def calculate(
+        cls, name: str, birthdate: str | BirthDate, core: CoreProfile | None = None
+    ) -> "ExtendedProfile":
+        """Рассчитывает профиль; готовый базовый профиль избавляет от повторных расчётов."""
+
+        score = score_name(name)
+        if core is None:
+            expression, life_path = reduce_value(score.total), life_path_value(birthdate)
+        else:
+            expression, life_path = core.expression, core.life_path
+        birth_value = reduce_value(date_field(birthdate, 0))
+        return cls(
+            reduce_value(score.initials),
+            growth_value(birthdate),
+            reduce_value(expression.base + life_path.base),
+            reduce_value(reduce_value(score.first_name).base + birth_value.base),
+        )
+
+    @classmethod
+    def from_dict(cls, profile: dict) -> "ExtendedProfile":
+        """Восстанавливает профиль из словаря формата calculate_extended_profile."""
+
+        return cls(*(parse_reduced(profile[key]) for key in EXTENDED_COMPONENTS))
+
+    def to_dict(self) -> dict[str, str]:
+        """Словарь со строками формата reduce_number для API."""
+
+        return {
+            "balance": str(self.balance),
+            "growth": str(self.growth),
+            "realization": str(self.realization),
+            "mind": str(self.mind),
+        }
 
 
-def calculate_extended_profile(name: str, birthdate: str) -> dict[str, str]:
+def calculate_extended_profile(name: str, birthdate: str | BirthDate) -> dict[str, str]:
     """Формирует расширенный профиль на основе дополнительных чисел."""
 
-    return {
-        "balance": calculate_balance(name),
-        "growth": calculate_growth(birthdate),
-        "realization": calculate_realization(name, birthdate),
-        "mind": calculate_mind(name, birthdate),
-    }
+    return ExtendedProfile.calculate(name, birthdate).to_dict()
@@ -0,0 +1,285 @@
+"""Граф зависимостей показателей профиля.
+
+Каждый показатель — узел с явным списком входов. ``ProfileGraph`` вычисляет узлы
+лениво и запоминает результат, поэтому при запросе любого набора разделов каждый
+показатель считается не больше одного раза, а ненужные узлы не считаются вовсе:
+имя оценивается одним проходом ``score_name``, дата рождения редуцируется один раз,
+а расширенный профиль, мосты и личные циклы берут готовые значения из базового.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from functools import cache
+from operator import itemgetter
+from typing import Any, Callable, Iterable
+
+from .bridges import calculate_bridges
+from .dates import BirthDate, date_parts
+from .days import calendar_month
+from .extended_profile import ExtendedProfile
+from .math import ReducedNumber, reduce_value
+from .months import personal_months
+from .names import score_name
+from .profile import CoreProfile
+
+# Разделы, которые можно запросить, в порядке вывода
+PROFILE_FIELDS = (
+    "core",
+    "extended",
+    "bridges",
+    "personal_years",
+    "personal_months",
+    "personal_days",
+)
+# Версия алгоритмов расчёта: увеличивается при любом изменении результатов, чтобы
+# производные от них кэши (ETag ответов API) перестали совпадать со старыми
+ALGORITHM_VERSION = 1
+INPUTS = ("name", "birthdate", "years_count")
+# Входы со значением по умолчанию: без них они вычисляются узлами от текущей даты
+OPTIONAL_INPUTS = ("year", "month")
+
+_NODES: dict[str, tuple[tuple[str, ...], Callable[..., Any]]] = {}
+
+
+def node(*inputs: str):
+    """Регистрирует функцию ``_node_<имя>`` как узел графа ``<имя>`` с входами ``inputs``."""
+
+    def register(func):
+        _NODES[func.__name__.removeprefix("_node_")] = (inputs, func)
+        return func
+
+    return register
+
+
+@node()
+def _node_today() -> date:
+    return date.today()
+
+
+@node("today")
+def _node_year(today) -> int:
+    return today.year
+
+
+@node("today")
+def _node_month(today) -> int:
+    return today.month
+
+
+@node("name")
+def _node_name_score(name):
+    return score_name(name)
+
+
+@node("birthdate")
+def _node_date_values(birthdate) -> tuple[ReducedNumber, ReducedNumber, ReducedNumber]:
+    """Редуцированные день и месяц рождения и число жизненного пути."""
+
+    day, month = reduce_value(birthdate.day), reduce_value(birthdate.month)
+    return day, month, reduce_value(day.base + month.base + reduce_value(birthdate.year).base)
+
+
+@node("date_values", "name_score")
+def _node_core(dates, score) -> CoreProfile:
+    day, _, life_path = dates
+    return CoreProfile(
+        life_path,
+        day,
+        reduce_value(score.total),
+        reduce_value(score.vowels),
+        reduce_value(score.consonants),
+    )
+
+
+@node("name_score", "date_values", "core")
+def _node_extended(score, dates, core) -> ExtendedProfile:
+    day, month, _ = dates
+    return ExtendedProfile(
+        reduce_value(score.initials),
+        month,
+        reduce_value(core.expression.base + core.life_path.base),
+        reduce_value(reduce_value(score.first_name).base + day.base),
+    )
+
+
+@node("core")
+def _node_bridges(core) -> dict:
+    return calculate_bridges(core)
+
+
+@node("date_values")
+def _node_date_part(dates) -> int:
+    return dates[0].base + dates[1].base
+
+
+@node("date_part", "year")
+def _node_personal_year(date_part, year) -> ReducedNumber:
+    return reduce_value(date_part + reduce_value(year).base)
+
+
+@node("date_part", "year", "years_count", "personal_year")
+def _node_personal_years(date_part, year, years_count, first) -> list[str]:
+    years = [str(first)] if years_count > 0 else []
+    years.extend(
+        str(reduce_value(date_part + reduce_value(year + offset).base))
+        for offset in range(1, years_count)
+    )
+    return years
+
+
+@node("personal_year")
+def _node_personal_months_of_year(personal_year) -> dict[str, str]:
+    return personal_months(personal_year.base)
+
+
+@node("year", "month", "personal_year")
+def _node_personal_days(year, month, personal_year) -> dict:
+    return calendar_month(year, month, personal_year).to_dict()
+
+
+# Узел, из которого берётся каждый раздел, и его преобразование в формат API
+_SECTIONS: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    "core": ("core", CoreProfile.to_dict),
+    "extended": ("extended", ExtendedProfile.to_dict),
+    "bridges": ("bridges", dict),
+    "personal_years": ("personal_years", list),
+    "personal_months": ("personal_months_of_year", dict),
+    "personal_days": ("personal_days", dict),
+}
+
+
+def parse_profile_fields(fields: str | Iterable[str] | None) -> tuple[str, ...]:
+    """Проверяет набор разделов (строку через запятую или список) и упорядочивает его.
+
+    ``None`` означает только базовый профиль.
+    """
+
+    if fields is None:
+        return ("core",)
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    requested = {field.strip() for field in fields if field.strip()}
+    unknown = requested.difference(PROFILE_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"unknown profile fields: {', '.join(sorted(unknown))}; "
+            f"expected any of {', '.join(PROFILE_FIELDS)}"
+        )
+    if not requested:
+        raise ValueError("at least one profile field must be requested")
+    return tuple(field for field in PROFILE_FIELDS if field in requested)
+
+
+@cache
+def evaluation_plan(
+    targets: tuple[str, ...], given: tuple[str, ...] = ()
+) -> tuple[tuple[str, Callable[[dict], Any]], ...]:
+    """Узлы, нужные для ``targets``, в порядке зависимостей: пары (имя, вызов от значений).
+
+    ``given`` — переданные необязательные входы; их узлы в план не попадают.
+    """
+
+    order: list[str] = []
+
+    def visit(key: str) -> None:
+        if key in order or key in INPUTS or key in given:
+            return
+        inputs, _ = _NODES[key]
+        for name in inputs:
+            visit(name)
+        order.append(key)
+
+    for target in targets:
+        visit(target)
+    return tuple((key, _call_node(*_NODES[key])) for key in order)
+
+
+def _call_node(inputs: tuple[str, ...], func: Callable[..., Any]) -> Callable[[dict], Any]:
+    """Вызов узла по словарю уже вычисленных значений."""
+
+    if not inputs:
+        return lambda values: func()
+    getter = itemgetter(*inputs)
+    if len(inputs) == 1:
+        return lambda values: func(getter(values))
+    return lambda values: func(*getter(values))
+
+
+class ProfileGraph:
+    """Показатели одного человека, вычисляемые по требованию и не более одного раза.
+
+    ``year`` и ``month`` задают период личных циклов (по умолчанию — текущие),
+    ``years_count`` — число личных лет начиная с ``year``.
+    """
+
+    __slots__ = ("_values", "_given")
+
+    def __init__(
+        self,
+        name: str,
+        birthdate: str | BirthDate,
+        year: int | None = None,
+        month: int | None = None,
+        years_count: int = 10,
+    ) -> None:
+        if month is not None and not 1 <= month <= 12:
+            raise ValueError(f"month must be within 1..12: {month}")
+        values: dict[str, Any] = {
+            "name": name,
+            "birthdate": date_parts(birthdate),
+            "years_count": years_count,
+        }
+        if year is not None:
+            values["year"] = year
+        if month is not None:
+            values["month"] = month
+        self._values = values
+        self._given = tuple(key for key in OPTIONAL_INPUTS if key in values)
+
+    def __getitem__(self, key: str) -> Any:
+        values = self._values
+        if key not in values:
+            self._evaluate(evaluation_plan((key,), self._given))
+        return values[key]
+
+    def _evaluate(self, plan) -> None:
+        values = self._values
+        for key, call in plan:
+            if key not in values:
+                values[key] = call(values)
+
+    def computed(self) -> frozenset[str]:
+        """Имена уже вычисленных узлов (без входных данных)."""
+
+        return frozenset(self._values).difference(INPUTS, self._given)
+
+    def sections(self, fields: str | Iterable[str] | None = None) -> dict[str, Any]:
+        """Запрошенные разделы профиля в формате API."""
+
+        fields = parse_profile_fields(fields)
+        self._evaluate(_section_plan(fields, self._given))
+        values = self._values
+        result = {}
+        for field in fields:
+            key, convert = _SECTIONS[field]
+            result[field] = convert(values[key])
+        return result
+
+
+@cache
+def _section_plan(fields: tuple[str, ...], given: tuple[str, ...]):
+    return evaluation_plan(tuple(_SECTIONS[field][0] for field in fields), given)
+
+
+def calculate_profile_sections(
+    name: str,
+    birthdate: str | BirthDate,
+    fields: str | Iterable[str] | None = None,
+    year: int | None = None,
+    month: int | None = None,
+    years_count: int = 10,
+) -> dict[str, Any]:
+    """Разделы профиля по нормализованным Ф.И.О. и дате за один проход графа."""
+
+    return ProfileGraph(name, birthdate, year, month, years_count).sections(fields)
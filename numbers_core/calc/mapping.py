@@ -33,13 +33,20 @@
     "Щ": 9,
 }
 
-VOWELS = set("АЕЁИОУЫЭЮЯ")
+RUSSIAN_VOWELS = frozenset("АЕЁИОУЫЭЮЯ")
+
+# Латинский алфавит по Пифагору: A–I = 1–9, J–R = 1–9, S–Z = 1–8
+LATIN_TABLE = {chr(ord("A") + index): index % 9 + 1 for index in range(26)}
+LATIN_VOWELS = frozenset("AEIOU")
+
+LETTER_VALUES = {**PIFAGOR_TABLE, **LATIN_TABLE}
+VOWELS = set(RUSSIAN_VOWELS | LATIN_VOWELS)
 
 
 def name_to_numbers(name: str) -> list[int]:
     """Преобразует имя в последовательность чисел по таблице Пифагора."""
 
-    return [PIFAGOR_TABLE[ch] for ch in name.upper() if ch in PIFAGOR_TABLE]
+    return [LETTER_VALUES[ch] for ch in name.upper() if ch in LETTER_VALUES]
 
 
 def calculate_sum_by_letters(name: str, filter_func=None) -> int:
@@ -47,7 +54,7 @@ def calculate_sum_by_letters(name: str, filter_func=None) -> int:
 
     letters = name.upper()
     return sum(
-        PIFAGOR_TABLE[ch]
+        LETTER_VALUES[ch]
         for ch in letters
-        if ch in PIFAGOR_TABLE and (filter_func(ch) if filter_func else True)
+        if ch in LETTER_VALUES and (filter_func(ch) if filter_func else True)
     )
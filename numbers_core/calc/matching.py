@@ -0,0 +1,100 @@
+import threading
+from collections.abc import Hashable, Iterator
+from itertools import product
+
+from .compatibility import profile_bases
+from .profile import CORE_COMPONENTS, CoreProfile
+
+BASE_VALUES = range(10)
+
+# Шаблоны вкладов по показателям (2 — совпадение, 1 — мост 1, 0 — прочее),
+# сгруппированные по итоговому баллу от лучшего к худшему.
+_PATTERNS_BY_SCORE = sorted(
+    ((sum(pattern), pattern) for pattern in product((2, 1, 0), repeat=len(CORE_COMPONENTS))),
+    key=lambda item: -item[0],
+)
+
+
+def _values_by_level(base: int) -> dict[int, list[int]]:
+    return {
+        2: [base],
+        1: [value for value in (base - 1, base + 1) if value in BASE_VALUES],
+        0: [value for value in BASE_VALUES if abs(value - base) > 1],
+    }
+
+
+class MatchIndex:
+    """Индекс для поиска самых совместимых профилей в сохранённой популяции.
+
+    Балл совместимости зависит только от сигнатуры — базовых значений пяти
+    показателей, — поэтому профили группируются по сигнатуре. Запрос перебирает
+    возможные сигнатуры партнёров в порядке убывания балла и останавливается,
+    набрав ``k`` результатов: стоимость ограничена размером пространства сигнатур
+    (10⁵), а не числом сохранённых профилей.
+
+    Индекс можно менять из одних потоков, пока другие выполняют запросы: все
+    операции проходят под общей блокировкой.
+    """
+
+    def __init__(self) -> None:
+        self._groups: dict[tuple[int, ...], dict[Hashable, None]] = {}
+        self._signatures: dict[Hashable, tuple[int, ...]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, item_id: Hashable) -> bool:
+        return item_id in self._signatures
+
+    def add(self, item_id: Hashable, profile: dict | CoreProfile) -> None:
+        """Добавляет профиль; существующий идентификатор перезаписывается."""
+
+        signature = profile_bases(profile)
+        if any(base not in BASE_VALUES for base in signature):
+            raise ValueError(f"profile bases must be within 0..9: {signature}")
+        with self._lock:
+            self.remove(item_id)
+            self._signatures[item_id] = signature
+            self._groups.setdefault(signature, {})[item_id] = None
+
+    def remove(self, item_id: Hashable) -> bool:
+        """Удаляет профиль; возвращает False, если его не было."""
+
+        with self._lock:
+            signature = self._signatures.pop(item_id, None)
+            if signature is None:
+                return False
+            group = self._groups[signature]
+            del group[item_id]
+            if not group:
+                del self._groups[signature]
+            return True
+
+    def top(
+        self, profile: dict | CoreProfile, k: int = 10, exclude: Hashable | None = None
+    ) -> list[tuple[Hashable, int]]:
+        """До ``k`` пар (идентификатор, балл) по убыванию балла совместимости."""
+
+        result: list[tuple[Hashable, int]] = []
+        if k <= 0:
+            return result
+        query = profile_bases(profile)
+        with self._lock:
+            for item_id, score in self._ranked(query):
+                if item_id == exclude:
+                    continue
+                result.append((item_id, score))
+                if len(result) == k:
+                    break
+        return result
+
+    def _ranked(self, query: tuple[int, ...]) -> Iterator[tuple[Hashable, int]]:
+        levels = [_values_by_level(base) for base in query]
+        for score, pattern in _PATTERNS_BY_SCORE:
+            choices = [levels[comp][level] for comp, level in enumerate(pattern)]
+            for signature in product(*choices):
+                group = self._groups.get(signature)
+                if group:
+                    for item_id in group:
+                        yield item_id, score
@@ -1,25 +1,113 @@
-﻿# Наборы «особых» чисел, которые важно сохранять без полной редукции
+﻿from dataclasses import dataclass
+
+# Наборы «особых» чисел, которые важно сохранять без полной редукции
 MASTER_NUMBERS = {11, 22, 33, 44, 55, 66, 77, 88, 99}
 KARMIC_NUMBERS = {13, 14, 16, 19}
 
+# Редукции чисел из этого диапазона (суммы букв, годы, даты) берутся из таблицы
+REDUCTION_TABLE_SIZE = 10_000
 
-def reduce_number(n: int) -> str:
-    """Последовательно редуцирует число до одной цифры, сохраняя мастеров и кармику."""
 
+@dataclass(frozen=True, slots=True)
+class ReducedNumber:
+    """Результат редукции: базовая цифра и исходное число."""
+
+    base: int
+    original: int
+
+    @property
+    def is_master(self) -> bool:
+        return self.original in MASTER_NUMBERS
+
+    @property
+    def is_karmic(self) -> bool:
+        return self.original in KARMIC_NUMBERS
+
+    def __int__(self) -> int:
+        return self.base
+
+    def __str__(self) -> str:
+        if 0 <= self.original < REDUCTION_TABLE_SIZE:
+            return _LEGACY_STRINGS[self.original]
+        return _format(self)
+
+
+def _format(value: ReducedNumber) -> str:
+    if value.is_master or value.is_karmic:
+        return f"{value.base}({value.original})"
+    return str(value.base)
+
+
+def _reduce(n: int) -> ReducedNumber:
     original = n
     while n > 9:
         n = sum(int(d) for d in str(n))
-    if original in MASTER_NUMBERS or original in KARMIC_NUMBERS:
-        return f"{n}({original})"
-    return str(n)
+    return ReducedNumber(n, original)
+
+
+def _reduction_table(size: int) -> tuple[ReducedNumber, ...]:
+    # Сумма цифр n — это сумма цифр n // 10 плюс последняя цифра, а она меньше n,
+    # поэтому базу каждого числа можно взять из уже заполненной части таблицы
+    digit_sums = [0] * size
+    bases = [0] * size
+    for n in range(1, size):
+        digit_sum = digit_sums[n // 10] + n % 10
+        digit_sums[n] = digit_sum
+        bases[n] = n if n < 10 else bases[digit_sum]
+    return tuple(map(ReducedNumber, bases, range(size)))
+
+
+_REDUCTIONS = _reduction_table(REDUCTION_TABLE_SIZE)
+_LEGACY_STRINGS = tuple(_format(value) for value in _REDUCTIONS)
+# Строка без пометки не хранит исходное число, поэтому берётся первое (original == base)
+_PARSED_STRINGS = {
+    text: value for text, value in reversed(tuple(zip(_LEGACY_STRINGS, _REDUCTIONS)))
+}
+
+
+def reduce_value(n: int) -> ReducedNumber:
+    """Редуцирует число, возвращая компактный ReducedNumber (через таблицу)."""
+
+    if 0 <= n < REDUCTION_TABLE_SIZE:
+        return _REDUCTIONS[n]
+    return _reduce(n)
+
+
+def reduce_number(n: int) -> str:
+    """Последовательно редуцирует число до одной цифры, сохраняя мастеров и кармику."""
+
+    if 0 <= n < REDUCTION_TABLE_SIZE:
+        return _LEGACY_STRINGS[n]
+    return str(_reduce(n))
+
+
+def parse_reduced(value: str | int | ReducedNumber) -> ReducedNumber:
+    """Восстанавливает ReducedNumber из строки формата ``reduce_number``."""
+
+    if isinstance(value, ReducedNumber):
+        return value
+    if isinstance(value, str):
+        parsed = _PARSED_STRINGS.get(value)
+        if parsed is not None:
+            return parsed
+        if "(" in value:
+            base, original = value.strip().rstrip(")").split("(")
+            return ReducedNumber(int(base.strip()), int(original))
+    base = extract_base(value)
+    return ReducedNumber(base, base)
 
 
-def extract_base(value: str | int) -> int:
+def extract_base(value: str | int | ReducedNumber) -> int:
     """Возвращает базовое (редуцированное) значение как целое число."""
 
+    if isinstance(value, ReducedNumber):
+        return value.base
     if isinstance(value, int):
         return value
     if isinstance(value, str):
+        parsed = _PARSED_STRINGS.get(value)
+        if parsed is not None:
+            return parsed.base
         if "(" in value:
             return int(value.split("(")[0].strip())
         return int(value.strip())
@@ -1,6 +1,7 @@
-from functools import lru_cache
+from array import array
 
-from .math import extract_base, reduce_number
+from .dates import BirthDate, date_parts
+from .math import reduce_number, reduce_value
 
 MONTH_NAMES = [
     "Январь",
@@ -24,40 +25,59 @@ def digit_sum(n: int) -> int:
     return sum(int(d) for d in str(n))
 
 
-@lru_cache(maxsize=64)
-def generate_personal_month_matrix(birthdate: str) -> dict[int, dict[str, str]]:
-    """Строит матрицу личных месяцев на 100 лет вперёд."""
+# Личный год зависит только от класса даты рождения (редукции дня и месяца) и
+# редукции года, личный месяц — от базы личного года и месяца. Обе таблицы общие
+# для всех дат рождения; индекс 0 по каждой оси не используется.
+_PERSONAL_YEAR_BASES = array(
+    "B", (reduce_value(cls + year_root).base for cls in range(10) for year_root in range(10))
+)
+_PERSONAL_MONTHS = tuple(reduce_number(py + month) for py in range(10) for month in range(13))
 
-    d, m, y = map(int, birthdate.strip().split("."))
-    red_day = extract_base(reduce_number(d))
-    red_month = extract_base(reduce_number(m))
-    base_year = y
 
-    matrix: dict[int, dict[str, str]] = {}
-    for year in range(base_year, base_year + 100):
-        red_year = extract_base(reduce_number(digit_sum(year)))
-        personal_year = extract_base(reduce_number(red_day + red_month + red_year))
-        month_row = {
-            MONTH_NAMES[i]: reduce_number(personal_year + i + 1)
-            for i in range(12)
-        }
-        matrix[year] = month_row
-    return matrix
+def reduction_class(birthdate: str | BirthDate) -> int:
+    """Класс даты рождения: редукция суммы редуцированных дня и месяца (1–9)."""
+
+    day, month, _ = date_parts(birthdate)
+    return reduce_value(reduce_value(day).base + reduce_value(month).base).base
+
+
+def personal_year_base(cls: int, year: int) -> int:
+    """База личного года для класса даты рождения и календарного года."""
+
+    return _PERSONAL_YEAR_BASES[cls * 10 + reduce_value(year).base]
+
+
+def personal_months(year_base: int) -> dict[str, str]:
+    """Личные месяцы года с базой личного года ``year_base`` по названиям месяцев."""
+
+    offset = year_base * 13
+    return dict(zip(MONTH_NAMES, _PERSONAL_MONTHS[offset + 1 : offset + 13]))
+
+
+def generate_personal_month_matrix(
+    birthdate: str | BirthDate, start_year: int | None = None, years: int = 100
+) -> dict[int, dict[str, str]]:
+    """Строит матрицу личных месяцев на ``years`` лет (по умолчанию — 100 лет от рождения)."""
+
+    cls = reduction_class(birthdate)
+    if start_year is None:
+        start_year = date_parts(birthdate).year
+
+    return {
+        year: personal_months(personal_year_base(cls, year))
+        for year in range(start_year, start_year + years)
+    }
 
 
 def generate_personal_month_cycle_table() -> dict[int, dict[str, str]]:
     """Готовит таблицу переходов личных месяцев для каждого личного года."""
 
-    table: dict[int, dict[str, str]] = {}
-    for py in range(1, 10):
-        row = {MONTH_NAMES[i]: reduce_number(py + i + 1) for i in range(12)}
-        table[py] = row
-    return table
+    return {py: personal_months(py) for py in range(1, 10)}
 
 
-def get_personal_month(birthdate: str, year: int, month: int) -> str:
+def get_personal_month(birthdate: str | BirthDate, year: int, month: int) -> str:
     """Возвращает личное число месяца для заданной даты."""
 
-    matrix = generate_personal_month_matrix(birthdate)
-    month_name = MONTH_NAMES[month - 1]
-    return matrix[year][month_name]
+    if not 1 <= month <= 12:
+        raise ValueError(f"month must be within 1..12: {month}")
+    return _PERSONAL_MONTHS[personal_year_base(reduction_class(birthdate), year) * 13 + month]
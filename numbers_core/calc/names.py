@@ -0,0 +1,130 @@
+"""Однопроходный подсчёт числовых сумм имени по скомпилированным таблицам алфавитов."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Mapping
+
+from .mapping import LATIN_TABLE, LATIN_VOWELS, PIFAGOR_TABLE, RUSSIAN_VOWELS
+
+# Символы ниже этой границы раскладываются при компиляции, более старшие —
+# при первой встрече.
+PRECOMPILED_CODEPOINTS = 0x2000
+
+
+@dataclass(frozen=True)
+class Alphabet:
+    """Алфавит: значения заглавных букв и набор гласных."""
+
+    name: str
+    values: Mapping[str, int]
+    vowels: frozenset[str]
+
+
+RUSSIAN = Alphabet("ru", PIFAGOR_TABLE, RUSSIAN_VOWELS)
+LATIN = Alphabet("latin", LATIN_TABLE, LATIN_VOWELS)
+ALPHABETS = {alphabet.name: alphabet for alphabet in (RUSSIAN, LATIN)}
+
+
+@dataclass(frozen=True, slots=True)
+class NameScore:
+    """Суммы букв имени до редукции.
+
+    ``initials`` — сумма первых букв слов, ``first_name`` — сумма второго слова
+    (имени в порядке «Фамилия Имя Отчество») или единственного слова.
+    """
+
+    total: int
+    vowels: int
+    consonants: int
+    initials: int
+    first_name: int
+    words: int
+
+
+# Вклад символа: (сумма, сумма гласных, значение как первой буквы слова)
+_SPACE = ()
+_NOT_A_LETTER = (0, 0, 0)
+
+
+class NameScorer:
+    """Считает все суммы имени за один проход по строке.
+
+    Для каждой кодовой точки заранее вычислен вклад с учётом ``str.upper()``
+    (в том числе раскрытия вроде «ß» → «SS»), поэтому результат совпадает с
+    посимвольным подсчётом по верхнему регистру. Алфавиты подключаются списком;
+    при совпадении букв побеждает последний.
+    """
+
+    def __init__(self, *alphabets: Alphabet) -> None:
+        if not alphabets:
+            raise ValueError("at least one alphabet is required")
+        self.alphabets = alphabets
+        self._values: dict[str, int] = {}
+        self._vowels: set[str] = set()
+        for alphabet in alphabets:
+            self._values.update(alphabet.values)
+            self._vowels.update(alphabet.vowels)
+        self._table: dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._compiled = False
+
+    def contribution(self, ch: str) -> tuple:
+        """Вклад одного символа: (сумма, гласные, первая буква) или ``()`` для пробела."""
+
+        if ch.isspace():
+            return _SPACE
+        upper = ch.upper()
+        total = vowels = 0
+        for letter in upper:
+            value = self._values.get(letter, 0)
+            total += value
+            if letter in self._vowels:
+                vowels += value
+        if not total:
+            return _NOT_A_LETTER
+        return (total, vowels, self._values.get(upper[0], 0))
+
+    def score(self, name: str) -> NameScore:
+        lookup = (self._table if self._compiled else self._compile()).get
+        total = vowels = initials = first_word = second_word = words = 0
+        in_word = False
+        for ch in name:
+            entry = lookup(ch)
+            if entry is None:
+                entry = self._table[ch] = self.contribution(ch)
+            if entry is _SPACE:
+                in_word = False
+                continue
+            value, vowel, initial = entry
+            if not in_word:
+                in_word = True
+                words += 1
+                initials += initial
+            total += value
+            vowels += vowel
+            if words == 1:
+                first_word += value
+            elif words == 2:
+                second_word += value
+        first_name = second_word if words > 1 else first_word
+        return NameScore(total, vowels, total - vowels, initials, first_name, words)
+
+    def _compile(self) -> dict[str, tuple]:
+        with self._lock:
+            if not self._compiled:
+                for cp in range(PRECOMPILED_CODEPOINTS):
+                    ch = chr(cp)
+                    self._table[ch] = self.contribution(ch)
+                self._compiled = True
+        return self._table
+
+
+default_scorer = NameScorer(RUSSIAN, LATIN)
+
+
+def score_name(name: str) -> NameScore:
+    """Суммы имени по русскому и латинскому алфавитам Пифагора."""
+
+    return default_scorer.score(name)
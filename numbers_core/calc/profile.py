@@ -1,55 +1,140 @@
-﻿from .mapping import VOWELS, calculate_sum_by_letters, name_to_numbers
-from .math import reduce_number
+﻿from dataclasses import dataclass
 
+from .dates import BirthDate, date_field, date_parts
+from .names import score_name
+from .math import ReducedNumber, parse_reduced, reduce_value
 
-def calculate_life_path_number(date_str: str) -> str:
+CORE_COMPONENTS = ("life_path", "birthday", "expression", "soul", "personality")
+
+
+def life_path_value(date_str: str | BirthDate) -> ReducedNumber:
+    """Число жизненного пути из даты формата DD.MM.YYYY."""
+
+    day, month, year = date_parts(date_str)
+    return reduce_value(reduce_value(day).base + reduce_value(month).base + reduce_value(year).base)
+
+
+def birthday_value(date_str: str | BirthDate) -> ReducedNumber:
+    """Редуцированное число дня рождения."""
+
+    return reduce_value(date_field(date_str, 0))
+
+
+def expression_value(full_name: str) -> ReducedNumber:
+    """Число выражения по всем буквам Ф.И.О."""
+
+    return reduce_value(score_name(full_name).total)
+
+
+def soul_value(full_name: str) -> ReducedNumber:
+    """Число души по гласным."""
+
+    return reduce_value(score_name(full_name).vowels)
+
+
+def personality_value(full_name: str) -> ReducedNumber:
+    """Число личности по согласным."""
+
+    return reduce_value(score_name(full_name).consonants)
+
+
+def calculate_life_path_number(date_str: str | BirthDate) -> str:
     """Вычисляет число жизненного пути из даты формата DD.MM.YYYY."""
 
-    parts = date_str.strip().split(".")
-    day = reduce_number(int(parts[0]))
-    month = reduce_number(int(parts[1]))
-    year = reduce_number(int(parts[2]))
-    total = sum(int(x.split("(")[0]) for x in [day, month, year])
-    return reduce_number(total)
+    return str(life_path_value(date_str))
 
 
-def calculate_birthday_number(date_str: str) -> str:
+def calculate_birthday_number(date_str: str | BirthDate) -> str:
     """Возвращает редуцированное число дня рождения."""
 
-    return reduce_number(int(date_str.strip().split(".")[0]))
+    return str(birthday_value(date_str))
 
 
 def calculate_expression_number(full_name: str) -> str:
     """Подсчитывает число выражения по всем буквам Ф.И.О."""
 
-    return reduce_number(sum(name_to_numbers(full_name)))
+    return str(expression_value(full_name))
 
 
 def calculate_soul_number(full_name: str) -> str:
     """Определяет число души по гласным."""
 
-    return reduce_number(calculate_sum_by_letters(full_name, lambda ch: ch in VOWELS))
+    return str(soul_value(full_name))
 
 
 def calculate_personality_number(full_name: str) -> str:
     """Определяет число личности по согласным."""
 
-    return reduce_number(calculate_sum_by_letters(full_name, lambda ch: ch not in VOWELS))
+    return str(personality_value(full_name))
 
 
-def calculate_core_profile(full_name: str, birthdate: str) -> dict[str, str]:
-    """Собирает базовый числовой профиль из ключевых показателей."""
+@dataclass(frozen=True, slots=True)
+class CoreProfile:
+    """Базовый профиль: пять редуцированных показателей с пометками мастеров и кармы."""
+
+    life_path: ReducedNumber
+    birthday: ReducedNumber
+    expression: ReducedNumber
+    soul: ReducedNumber
+    personality: ReducedNumber
 
-    life_path = calculate_life_path_number(birthdate)
-    birthday = calculate_birthday_number(birthdate)
-    expression = calculate_expression_number(full_name)
-    soul = calculate_soul_number(full_name)
-    personality = calculate_personality_number(full_name)
+    @classmethod
+    def calculate(cls, full_name: str, birthdate: str | BirthDate) -> "CoreProfile":
+        """Рассчитывает профиль по нормализованным Ф.И.О. и дате (BirthDate или DD.MM.YYYY)."""
+
+        score = score_name(full_name)
+        return cls(
+            life_path_value(birthdate),
+            birthday_value(birthdate),
+            reduce_value(score.total),
+            reduce_value(score.vowels),
+            reduce_value(score.consonants),
+        )
+
+    @classmethod
+    def from_dict(cls, profile: dict) -> "CoreProfile":
+        """Восстанавливает профиль из словаря формата calculate_core_profile."""
+
+        return cls(*(parse_reduced(profile[key]) for key in CORE_COMPONENTS))
+
+    def values(self) -> tuple[ReducedNumber, ...]:
+        """Показатели в порядке CORE_COMPONENTS."""
+
+        return (self.life_path, self.birthday, self.expression, self.soul, self.personality)
+
+    def to_dict(self) -> dict[str, str]:
+        """Словарь со строками формата reduce_number для API."""
+
+        return {
+            "life_path": str(self.life_path),
+            "birthday": str(self.birthday),
+            "expression": str(self.expression),
+            "soul": str(self.soul),
+            "personality": str(self.personality),
+        }
+
+
+def calculate_date_numbers(birthdate: str | BirthDate) -> dict[str, str]:
+    """Показатели профиля, зависящие только от даты рождения."""
 
     return {
-        "life_path": life_path,
-        "birthday": birthday,
-        "expression": expression,
-        "soul": soul,
-        "personality": personality,
+        "life_path": calculate_life_path_number(birthdate),
+        "birthday": calculate_birthday_number(birthdate),
     }
+
+
+def calculate_name_numbers(full_name: str) -> dict[str, str]:
+    """Показатели профиля, зависящие только от Ф.И.О."""
+
+    score = score_name(full_name)
+    return {
+        "expression": str(reduce_value(score.total)),
+        "soul": str(reduce_value(score.vowels)),
+        "personality": str(reduce_value(score.consonants)),
+    }
+
+
+def calculate_core_profile(full_name: str, birthdate: str | BirthDate) -> dict[str, str]:
+    """Собирает базовый числовой профиль из ключевых показателей."""
+
+    return CoreProfile.calculate(full_name, birthdate).to_dict()
@@ -0,0 +1,196 @@
+"""Колоночный (NumPy) расчёт базового профиля для больших массивов людей.
+
+Результаты совпадают с :func:`numbers_core.calc.profile.calculate_core_profile`
+бит в бит; NumPy — необязательная зависимость (``pip install numbers-core[fast]``).
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Sequence
+
+from . import datetable
+from .names import default_scorer, score_name
+from .math import KARMIC_NUMBERS, MASTER_NUMBERS
+
+try:  # pragma: no cover - зависит от окружения
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Кодовые точки ниже этой границы обслуживаются таблицами; строки с более
+# старшими символами пересчитываются скалярным путём.
+CODEPOINT_LIMIT = 0x2000
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "numpy is required for columnar calculations: pip install numbers-core[fast]"
+        )
+    return np
+
+
+@lru_cache(maxsize=1)
+def _letter_tables():
+    """Таблицы «кодовая точка → сумма букв / гласных» с учётом str.upper()."""
+
+    numpy = _require_numpy()
+    totals = numpy.zeros(CODEPOINT_LIMIT, dtype=numpy.int16)
+    vowels = numpy.zeros(CODEPOINT_LIMIT, dtype=numpy.int16)
+    for cp in range(CODEPOINT_LIMIT):
+        contribution = default_scorer.contribution(chr(cp))
+        if contribution:
+            totals[cp], vowels[cp], _ = contribution
+    return totals, vowels
+
+
+def _digit_sum(values):
+    total = np.zeros_like(values)
+    while values.any():
+        total += values % 10
+        values = values // 10
+    return total
+
+
+def reduce_array(values) -> dict:
+    """Векторный аналог ``reduce_number``: база, исходное число и флаги."""
+
+    numpy = _require_numpy()
+    original = numpy.asarray(values, dtype=numpy.int64)
+    base = original.copy()
+    mask = base > 9
+    while mask.any():
+        base[mask] = _digit_sum(base[mask])
+        mask = base > 9
+    return {
+        "base": base.astype(numpy.int8),
+        "original": original,
+        "master": numpy.isin(original, sorted(MASTER_NUMBERS)),
+        "karmic": numpy.isin(original, sorted(KARMIC_NUMBERS)),
+    }
+
+
+def format_reduced(column: dict) -> list[str]:
+    """Переводит колонку из ``reduce_array`` в строки формата ``reduce_number``."""
+
+    flagged = column["master"] | column["karmic"]
+    return [
+        f"{base}({original})" if marked else str(base)
+        for base, original, marked in zip(
+            column["base"].tolist(), column["original"].tolist(), flagged.tolist()
+        )
+    ]
+
+
+@lru_cache(maxsize=1)
+def _date_table():
+    """Записи таблицы дат как массив (слот × поле) поверх отображения файла, без копии."""
+
+    data = datetable.load_table()
+    if data is None:
+        return None
+    return np.frombuffer(data, dtype=np.uint8, offset=datetable.HEADER_SIZE).reshape(
+        -1, datetable.RECORD_SIZE
+    )
+
+
+def _life_path_totals(days, months, years):
+    """Суммы редуцированных дня, месяца и года: из таблицы дат, вне её — расчётом."""
+
+    numpy = _require_numpy()
+    table = _date_table()
+    if table is None:
+        fallback = numpy.ones(len(days), dtype=bool)
+        totals = numpy.zeros(len(days), dtype=numpy.int64)
+    else:
+        in_range = (
+            (years >= datetable.FIRST_YEAR)
+            & (years <= datetable.LAST_YEAR)
+            & (months >= 1)
+            & (months <= 12)
+            & (days >= 1)
+            & (days <= 31)
+        )
+        slots = ((years - datetable.FIRST_YEAR) * 12 + months - 1) * 31 + days - 1
+        records = table[numpy.where(in_range, slots, 0)]
+        fallback = ~in_range | (records[:, datetable.FLAGS] == 0)
+        totals = records[:, datetable.LIFE_PATH].astype(numpy.int64)
+    if fallback.any():
+        totals[fallback] = (
+            reduce_array(days[fallback])["base"].astype(numpy.int64)
+            + reduce_array(months[fallback])["base"]
+            + reduce_array(years[fallback])["base"]
+        )
+    return totals
+
+
+def _name_sums(names: Sequence[str]):
+    numpy = _require_numpy()
+    totals_table, vowels_table = _letter_tables()
+    encoded = numpy.asarray(names, dtype=numpy.str_)
+    width = max(encoded.dtype.itemsize // 4, 1)
+    codes = numpy.ascontiguousarray(encoded).view(numpy.uint32).reshape(len(encoded), width)
+
+    outside = codes >= CODEPOINT_LIMIT
+    codes = numpy.where(outside, 0, codes)
+    totals = totals_table[codes].sum(axis=1, dtype=numpy.int64)
+    vowels = vowels_table[codes].sum(axis=1, dtype=numpy.int64)
+
+    for row in numpy.flatnonzero(outside.any(axis=1)).tolist():
+        score = score_name(names[row])
+        totals[row] = score.total
+        vowels[row] = score.vowels
+    return totals, vowels, totals - vowels
+
+
+def calculate_core_profiles_columnar(
+    names: Sequence[str],
+    days: Sequence[int],
+    months: Sequence[int],
+    years: Sequence[int],
+) -> dict[str, dict]:
+    """Считает базовый профиль для колонок имён и компонентов даты рождения.
+
+    Для каждого показателя возвращаются массивы ``base``, ``original``,
+    ``master`` и ``karmic`` (см. :func:`reduce_array`).
+    """
+
+    numpy = _require_numpy()
+    days = numpy.asarray(days, dtype=numpy.int64)
+    months = numpy.asarray(months, dtype=numpy.int64)
+    years = numpy.asarray(years, dtype=numpy.int64)
+    if not len(names) == len(days) == len(months) == len(years):
+        raise ValueError("all columns must have the same length")
+
+    birthday = reduce_array(days)
+    life_total = _life_path_totals(days, months, years)
+    expression, soul, personality = _name_sums(names)
+
+    return {
+        "life_path": reduce_array(life_total),
+        "birthday": birthday,
+        "expression": reduce_array(expression),
+        "soul": reduce_array(soul),
+        "personality": reduce_array(personality),
+    }
+
+
+def compatibility_matrix_columnar(bases_a, bases_b, details: bool = False) -> tuple:
+    """Матрицы совместимости по массивам базовых значений формы N×5 и M×5.
+
+    Возвращает ``(scores, matches, bridges)``; последние два — ``None`` без ``details``.
+    """
+
+    numpy = _require_numpy()
+    a = numpy.asarray(bases_a, dtype=numpy.int8).reshape(-1, 5)
+    b = numpy.asarray(bases_b, dtype=numpy.int8).reshape(-1, 5)
+    scores = numpy.zeros((len(a), len(b)), dtype=numpy.int8)
+    for comp in range(a.shape[1]):
+        diff = numpy.abs(numpy.subtract.outer(a[:, comp], b[:, comp]))
+        scores += diff == 0  # совпадение даёт 2 балла: оба условия истинны
+        scores += diff <= 1
+    if not details:
+        return scores, None, None
+    bridges = numpy.abs(a[:, None, :] - b[None, :, :])
+    return scores, bridges == 0, bridges
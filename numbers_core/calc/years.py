@@ -1,6 +1,7 @@
 ﻿from datetime import datetime
 
-from .math import extract_base, reduce_number
+from .dates import BirthDate, date_parts
+from .math import ReducedNumber, reduce_value
 
 
 def digit_sum(n: int) -> int:
@@ -9,40 +10,40 @@ def digit_sum(n: int) -> int:
     return sum(int(d) for d in str(n))
 
 
-def parse_components(birthdate: str) -> tuple[int, int, int]:
+def parse_components(birthdate: str | BirthDate) -> tuple[int, int, int]:
     """Разбивает дату рождения на день, месяц и год."""
 
-    d, m, y = birthdate.strip().split(".")
-    return int(d), int(m), int(y)
+    return date_parts(birthdate)
 
 
-def calculate_personal_year(birthdate: str, target_year: int | None = None) -> str:
-    """Вычисляет личный год для заданного календарного года."""
+def personal_year_value(
+    birthdate: str | BirthDate, target_year: int | None = None
+) -> ReducedNumber:
+    """Личный год для заданного календарного года в виде ReducedNumber."""
 
     if target_year is None:
         target_year = datetime.today().year
 
     day, month, _ = parse_components(birthdate)
-    return reduce_number(
-        extract_base(reduce_number(day))
-        + extract_base(reduce_number(month))
-        + extract_base(reduce_number(target_year))
+    return reduce_value(
+        reduce_value(day).base + reduce_value(month).base + reduce_value(target_year).base
     )
 
 
-def get_personal_years(birthdate: str, years_count: int = 10) -> list[str]:
+def calculate_personal_year(birthdate: str | BirthDate, target_year: int | None = None) -> str:
+    """Вычисляет личный год для заданного календарного года."""
+
+    return str(personal_year_value(birthdate, target_year))
+
+
+def get_personal_years(birthdate: str | BirthDate, years_count: int = 10) -> list[str]:
     """Возвращает список личных годов на несколько лет вперёд."""
 
     day, month, _ = parse_components(birthdate)
     start_year = datetime.today().year
+    date_part = reduce_value(day).base + reduce_value(month).base
 
-    personal_years = []
-    for offset in range(years_count):
-        year = start_year + offset
-        personal_year = reduce_number(
-            extract_base(reduce_number(day))
-            + extract_base(reduce_number(month))
-            + extract_base(reduce_number(year))
-        )
-        personal_years.append(personal_year)
-    return personal_years
+    return [
+        str(reduce_value(date_part + reduce_value(start_year + offset).base))
+        for offset in range(years_count)
+    ]
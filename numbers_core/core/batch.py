@@ -0,0 +1,264 @@
+"""Streaming batch processing of (name, birthdate) rows from CSV or JSONL.
+
+Rows are read, profiled and written one at a time, so memory use does not grow
+with the input: only the normalization and half-profile memos are kept, and they
+are cleared once they reach ``MEMO_SIZE`` entries. Results and per-row errors go
+to separate streams as JSON lines carrying the 1-based row number (and the row
+``id`` when the input has one).
+"""
+
+import csv
+import json
+import time
+from dataclasses import dataclass
+from functools import partial
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from numbers_core.calc.graph import ProfileGraph
+from numbers_core.calc.profile import calculate_date_numbers, calculate_name_numbers
+
+from .orchestrator import normalize_birthdate, normalize_cached, normalize_name
+from .parallel import DEFAULT_CHUNK_SIZE, parallel_map
+
+FORMATS = ("csv", "jsonl")
+NAME_FIELDS = ("full_name", "name")
+MEMO_SIZE = 65_536
+
+# Raw name -> name, raw birthdate -> BirthDate, then their halves of the core profile.
+_Memos = Tuple[Dict[Any, Any], Dict[Any, Any], Dict[str, Dict[str, str]], Dict[Any, Dict[str, str]]]
+
+
+class BatchRow(NamedTuple):
+    """One input row; ``error`` is set when the row itself could not be read."""
+
+    number: int
+    name: Any = None
+    birthdate: Any = None
+    id: Any = None
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class BatchOptions:
+    """What to compute for every row besides the core profile."""
+
+    extended: bool = False
+    bridges: bool = False
+    personal_years: int = 0
+    name_field: Optional[str] = None
+    birthdate_field: str = "birthdate"
+    id_field: str = "id"
+
+    def __post_init__(self) -> None:
+        if self.personal_years < 0:
+            raise ValueError(f"personal_years must be >= 0, got {self.personal_years}")
+
+    @property
+    def extras(self) -> tuple:
+        """Profile sections requested on top of the core profile."""
+
+        flags = (
+            ("extended", self.extended),
+            ("bridges", self.bridges),
+            ("personal_years", self.personal_years),
+        )
+        return tuple(field for field, wanted in flags if wanted)
+
+
+@dataclass
+class BatchStats:
+    rows: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.rows} rows, {self.errors} errors in {self.seconds:.2f}s "
+            f"({self.rate:,.0f} rows/s)"
+        )
+
+
+def detect_format(path: Optional[str]) -> str:
+    """Input format from the file extension; stdin and unknown extensions read as JSONL."""
+
+    if path and path.lower().endswith(".csv"):
+        return "csv"
+    return "jsonl"
+
+
+def _row_from_mapping(number: int, record: Any, options: BatchOptions) -> BatchRow:
+    if not isinstance(record, dict):
+        return BatchRow(number, error="row must be an object")
+    fields = (options.name_field,) if options.name_field else NAME_FIELDS
+    name = next((record[field] for field in fields if field in record), None)
+    return BatchRow(number, name, record.get(options.birthdate_field), record.get(options.id_field))
+
+
+def read_rows(
+    stream: IO[str], fmt: str, options: Optional[BatchOptions] = None
+) -> Iterator[BatchRow]:
+    """Lazily parse ``stream`` as CSV (with a header row) or JSON lines.
+
+    Blank JSONL lines are skipped; lines that are not valid JSON become rows with
+    ``error`` set instead of stopping the batch.
+    """
+
+    if options is None:
+        options = BatchOptions()
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown input format {fmt!r}, expected one of {', '.join(FORMATS)}")
+    if fmt == "csv":
+        for number, record in enumerate(csv.DictReader(stream), start=1):
+            yield _row_from_mapping(number, record, options)
+        return
+    for number, line in _numbered_lines(stream):
+        yield _parse_line(number, line, options)
+
+
+def _numbered_lines(stream: IO[str]) -> Iterator[tuple]:
+    number = 0
+    for line in stream:
+        if line.strip():
+            number += 1
+            yield number, line
+
+
+def _parse_line(number: int, line: str, options: BatchOptions) -> BatchRow:
+    try:
+        record = json.loads(line)
+    except ValueError as exc:
+        return BatchRow(number, error=f"invalid JSON: {exc}")
+    return _row_from_mapping(number, record, options)
+
+
+def process_rows(
+    rows: Iterable[BatchRow], options: Optional[BatchOptions] = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield one result per row, in input order.
+
+    Each result has ``row`` (and ``id`` if present) plus either ``profile`` and
+    the requested extras (``extended``, ``bridges``, ``personal_years``) or
+    ``error``. Repeated names and birthdates reuse their memoized numbers; rows
+    with extras go through one :class:`ProfileGraph`, so the core numbers the
+    extras depend on are not computed twice.
+    """
+
+    if options is None:
+        options = BatchOptions()
+    sections = ("core", *options.extras)
+    memos: _Memos = ({}, {}, {}, {})
+    names, birthdates = memos[0], memos[1]
+    for row in rows:
+        if len(names) >= MEMO_SIZE or len(birthdates) >= MEMO_SIZE:
+            for memo in memos:
+                memo.clear()
+        yield _process_row(row, options, sections, memos)
+
+
+def _process_row(
+    row: BatchRow, options: BatchOptions, sections: tuple, memos: _Memos
+) -> Dict[str, Any]:
+    names, birthdates, name_numbers, date_numbers = memos
+    result: Dict[str, Any] = {"row": row.number}
+    if row.id is not None:
+        result["id"] = row.id
+    if row.error is not None:
+        result["error"] = row.error
+        return result
+    try:
+        if not isinstance(row.name, str):
+            raise ValueError("full name must be provided")
+        if not isinstance(row.birthdate, str):
+            raise ValueError("birthdate must be provided")
+        name = normalize_cached(names, row.name, normalize_name)
+        birthdate = normalize_cached(birthdates, row.birthdate, normalize_birthdate)
+    except ValueError as exc:
+        result["error"] = str(exc)
+        return result
+    if len(sections) > 1:
+        graph = ProfileGraph(name, birthdate, years_count=options.personal_years)
+        profile = graph.sections(sections)
+        result["profile"] = profile.pop("core")
+        result.update(profile)
+        return result
+    if birthdate not in date_numbers:
+        date_numbers[birthdate] = calculate_date_numbers(birthdate)
+    if name not in name_numbers:
+        name_numbers[name] = calculate_name_numbers(name)
+    result["profile"] = {**date_numbers[birthdate], **name_numbers[name]}
+    return result
+
+
+def _encode(result: Dict[str, Any]) -> tuple:
+    return "error" in result, json.dumps(result, ensure_ascii=False) + "\n"
+
+
+def _encode_chunk(options: BatchOptions, rows: list) -> list:
+    """Profile one chunk in a worker and return it as ``[(rows, errors, output, error_text)]``.
+
+    Sending back two joined strings instead of result dicts keeps pickling and the
+    parent's share of the work small, and serialization runs in the workers too.
+    """
+
+    output, failed = [], []
+    for result in process_rows(rows, options):
+        (failed if "error" in result else output).append(
+            json.dumps(result, ensure_ascii=False) + "\n"
+        )
+    return [(len(rows), len(failed), "".join(output), "".join(failed))]
+
+
+def _encode_lines(options: BatchOptions, lines: list) -> list:
+    # JSONL is parsed in the workers as well, leaving the parent only raw I/O.
+    return _encode_chunk(options, [_parse_line(number, line, options) for number, line in lines])
+
+
+def run_batch(
+    source: IO[str],
+    output: IO[str],
+    errors: IO[str],
+    fmt: str = "jsonl",
+    options: Optional[BatchOptions] = None,
+    progress: Optional[Callable[[BatchStats], None]] = None,
+    progress_every: int = 100_000,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> BatchStats:
+    """Stream ``source`` through :func:`process_rows` into ``output`` and ``errors``.
+
+    ``progress`` is called with the running totals every ``progress_every`` rows.
+    With ``workers`` > 1 rows are profiled by a process pool in chunks of
+    ``chunk_size``; the output order stays the input order.
+    """
+
+    if options is None:
+        options = BatchOptions()
+    stats = BatchStats()
+    start = time.perf_counter()
+    if workers == 1:
+        chunks = (
+            (1, int(failed), "" if failed else line, line if failed else "")
+            for failed, line in map(_encode, process_rows(read_rows(source, fmt, options), options))
+        )
+    elif fmt == "jsonl":
+        task = partial(_encode_lines, options)
+        chunks = parallel_map(task, _numbered_lines(source), workers, chunk_size)
+    else:
+        task = partial(_encode_chunk, options)
+        chunks = parallel_map(task, read_rows(source, fmt, options), workers, chunk_size)
+    reported = 0
+    for rows, failed, text, error_text in chunks:
+        stats.rows += rows
+        stats.errors += failed
+        output.write(text)
+        errors.write(error_text)
+        if progress is not None and stats.rows - reported >= progress_every:
+            reported = stats.rows - stats.rows % progress_every
+            stats.seconds = time.perf_counter() - start
+            progress(stats)
+    stats.seconds = time.perf_counter() - start
+    return stats
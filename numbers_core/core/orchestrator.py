@@ -1,11 +1,40 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, Optional
+from datetime import date
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
-from numbers_core.calc.profile import calculate_core_profile
-from numbers_core.intelligence.analysis import analyze_profile as run_ai_analysis
+from numbers_core.calc.dates import BirthDate
+from numbers_core.calc.days import generate_personal_days
+from numbers_core.calc.graph import calculate_profile_sections, parse_profile_fields
+from numbers_core.calc.months import generate_personal_month_matrix
+from numbers_core.calc.profile import (
+    calculate_core_profile,
+    calculate_date_numbers,
+    calculate_name_numbers,
+)
+from numbers_core.helpers.metrics import stage
 from numbers_core.intelligence.engine import AIClient, MockAIClient
 
+if TYPE_CHECKING:
+    from numbers_core.intelligence.cache import AnalysisCache
+    from numbers_core.intelligence.limiter import ConcurrencyLimiter
+    from numbers_core.intelligence.singleflight import SingleFlight
+
+# The AI pipeline (HTTP clients, jinja2 templates) is imported by the analyze_*
+# functions on first use, so profile-only callers start without it.
+
 
 @dataclass
 class ProfileInput:
@@ -15,25 +44,240 @@ class ProfileInput:
     birthdate: str
 
 
+_DATE_SEPARATORS = ".-/"
+_Normalized = TypeVar("_Normalized", str, BirthDate)
+
+
+
+def normalize_input(inp: ProfileInput) -> Tuple[str, BirthDate]:
+    """Validate ``inp`` and return its normalized name and birthdate.
+
+    Inputs that normalize to the same pair have the same profile, so the pair can key
+    caches of anything derived from it.
+    """
+
+    with stage("normalize"):
+        return _normalize_name(inp.name), _normalize_birthdate(inp.birthdate)
+
+
+
+def normalize_birthdate(value: str) -> BirthDate:
+    """Validate a birthdate in any supported format, like :func:`normalize_input` does."""
+
+    with stage("normalize"):
+        return _normalize_birthdate(value)
+
+
+
+def normalize_name(value: str) -> str:
+    """Validate a full name and collapse its whitespace, like :func:`normalize_input` does."""
+
+    with stage("normalize"):
+        return _normalize_name(value)
+
+
+
+def normalize_cached(
+    cache: Dict[str, _Normalized | ValueError], value: str, normalize: Callable[[str], _Normalized]
+) -> _Normalized:
+    """Run ``normalize`` once per distinct raw value, replaying cached errors.
+
+    ``cache`` belongs to the caller, which decides how long it lives and when to clear it.
+    """
+
+    if value not in cache:
+        try:
+            cache[value] = normalize(value)
+        except ValueError as exc:
+            cache[value] = exc
+    cached = cache[value]
+    if isinstance(cached, ValueError):
+        raise cached
+    return cached
+
+
+
+def build_normalized_profile(
+    name: str,
+    birthdate: BirthDate,
+    fields: Optional[Iterable[str]] = None,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Profile of a pair from :func:`normalize_input`.
+
+    Without ``fields`` this is the flat core profile of :func:`build_profile`,
+    otherwise the sections of :func:`build_profile_fields`.
+    """
+
+    with stage("calc"):
+        if fields is None:
+            return calculate_core_profile(name, birthdate)
+        return calculate_profile_sections(name, birthdate, fields, year, month)
+
+
 
 def build_profile(inp: ProfileInput) -> Dict[str, Any]:
     """Return a numerology profile built from validated input."""
 
-    normalized_name = _normalize_name(inp.name)
-    normalized_birthdate = _normalize_birthdate(inp.birthdate)
-    return calculate_core_profile(normalized_name, normalized_birthdate)
+    normalized_name, normalized_birthdate = normalize_input(inp)
+    with stage("calc"):
+        return calculate_core_profile(normalized_name, normalized_birthdate)
+
+
+
+def build_profile_fields(
+    inp: ProfileInput,
+    fields: Optional[Iterable[str]] = None,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Return the requested profile sections (any of ``PROFILE_FIELDS``) for validated input.
+
+    Sections share intermediate numbers, so every quantity is computed at most once
+    and only the nodes the requested sections depend on are evaluated. ``year`` and
+    ``month`` select the period of the personal cycles (the current one by default).
+    """
+
+    normalized_name, normalized_birthdate = normalize_input(inp)
+    return build_normalized_profile(normalized_name, normalized_birthdate, fields, year, month)
+
+
+
+def build_profiles(
+    inputs: Iterable[ProfileInput],
+    fields: Optional[Iterable[str]] = None,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Build profiles for many inputs, isolating validation errors per item.
+
+    Every entry of the result is either ``{"profile": {...}}`` or ``{"error": "..."}``
+    and keeps the position of the corresponding input. Normalization and the
+    name/date halves of the profile are memoized for the duration of the call, so
+    repeated names and birthdates inside one batch are processed only once. With
+    ``fields`` every profile holds the sections of :func:`build_profile_fields`.
+    """
+
+    sections = parse_profile_fields(fields) if fields is not None else None
+    names: Dict[str, str | ValueError] = {}
+    birthdates: Dict[str, BirthDate | ValueError] = {}
+    name_numbers: Dict[str, Dict[str, str]] = {}
+    date_numbers: Dict[BirthDate, Dict[str, str]] = {}
+    results: List[Dict[str, Any]] = []
+    with stage("batch"):
+        for inp in inputs:
+            try:
+                name = normalize_cached(names, inp.name, _normalize_name)
+                birthdate = normalize_cached(birthdates, inp.birthdate, _normalize_birthdate)
+            except ValueError as exc:
+                results.append({"error": str(exc)})
+                continue
+            if sections is not None:
+                profile = calculate_profile_sections(name, birthdate, sections, year, month)
+                results.append({"profile": profile})
+                continue
+            if birthdate not in date_numbers:
+                date_numbers[birthdate] = calculate_date_numbers(birthdate)
+            if name not in name_numbers:
+                name_numbers[name] = calculate_name_numbers(name)
+            results.append({"profile": {**date_numbers[birthdate], **name_numbers[name]}})
+    return results
 
 
 
-def analyze_profile(profile: Dict[str, Any], ai: Optional[AIClient] = None) -> Dict[str, Any]:
-    """Produce AI-generated analysis for an existing profile."""
+def build_calendar(
+    birthdate: str | BirthDate, year: int, months: int = 12, start_month: int = 1
+) -> List[Dict[str, Any]]:
+    """Return personal numbers for ``months`` consecutive calendar months.
+
+    ``birthdate`` may be raw input or an already normalized :class:`BirthDate`.
+    """
+
+    normalized_birthdate = _ensure_birthdate(birthdate)
+    with stage("calc"):
+        return [
+            month.to_dict()
+            for month in generate_personal_days(normalized_birthdate, year, months, start_month)
+        ]
+
+
+
+def build_personal_months(
+    birthdate: str | BirthDate, year: int, years: int = 1
+) -> Dict[int, Dict[str, str]]:
+    """Return personal month numbers by month name for ``years`` years from ``year``.
+
+    ``birthdate`` may be raw input or an already normalized :class:`BirthDate`.
+    """
+
+    normalized_birthdate = _ensure_birthdate(birthdate)
+    with stage("calc"):
+        return generate_personal_month_matrix(normalized_birthdate, year, years)
+
+
+
+def analyze_profile(
+    profile: Dict[str, Any],
+    ai: Optional[AIClient] = None,
+    cache: Optional[AnalysisCache] = None,
+    limiter: Optional[ConcurrencyLimiter] = None,
+    lane: str = "interactive",
+) -> Dict[str, Any]:
+    """Produce AI-generated analysis for an existing profile.
+
+    With ``limiter`` the upstream call waits for a slot in ``lane`` and a rejection
+    raises :class:`~numbers_core.intelligence.limiter.Overloaded`.
+    """
+
+    from numbers_core.intelligence.analysis import analyze_profile as run_ai_analysis
 
     client: AIClient = ai if ai is not None else MockAIClient()
-    text = run_ai_analysis(profile, client=client)
+    text = run_ai_analysis(profile, client=client, cache=cache, limiter=limiter, lane=lane)
     return {"text": text}
 
 
 
+async def analyze_profile_async(
+    profile: Dict[str, Any],
+    ai: Optional[AIClient] = None,
+    cache: Optional[AnalysisCache] = None,
+    flights: Optional[SingleFlight] = None,
+    limiter: Optional[ConcurrencyLimiter] = None,
+    lane: str = "interactive",
+) -> Dict[str, Any]:
+    """Non-blocking variant of :func:`analyze_profile` for async callers.
+
+    Passing ``flights`` coalesces concurrent requests for the same profile into one
+    upstream call.
+    """
+
+    from numbers_core.intelligence.analysis import analyze_profile_async as run_ai_analysis_async
+
+    client: AIClient = ai if ai is not None else MockAIClient()
+    text = await run_ai_analysis_async(
+        profile, client=client, cache=cache, flights=flights, limiter=limiter, lane=lane
+    )
+    return {"text": text}
+
+
+
+def analyze_profile_stream(
+    profile: Dict[str, Any],
+    ai: Optional[AIClient] = None,
+    cache: Optional[AnalysisCache] = None,
+    limiter: Optional[ConcurrencyLimiter] = None,
+    lane: str = "interactive",
+) -> AsyncIterator[str]:
+    """Stream analysis text chunks as the AI client produces them."""
+
+    from numbers_core.intelligence.analysis import stream_analysis as run_ai_analysis_stream
+
+    client: AIClient = ai if ai is not None else MockAIClient()
+    return run_ai_analysis_stream(profile, client=client, cache=cache, limiter=limiter, lane=lane)
+
+
+
 def run(inp: ProfileInput, ai: Optional[AIClient] = None) -> Dict[str, Any]:
     """Full pipeline: calculate profile and optionally run AI analysis."""
 
@@ -44,28 +288,41 @@ def run(inp: ProfileInput, ai: Optional[AIClient] = None) -> Dict[str, Any]:
 
 
 def _normalize_name(value: str) -> str:
-    """Ensure the name is present, readable and contains letters."""
+    """Ensure the name is present, readable and contains letters.
+
+    Hyphens, apostrophes and the joining spaces are stripped with C-level string
+    methods, so a valid name is checked with a single ``isalpha`` scan.
+    """
 
     if value is None:
         raise ValueError("full name must be provided")
 
-    parts = [part for part in value.strip().split() if part]
+    parts = value.split()
     if not parts:
         raise ValueError("full name must be provided")
 
     normalized = " ".join(parts)
-    if not any(ch.isalpha() for ch in normalized):
-        raise ValueError("full name must contain letters")
-
-    for part in parts:
-        if not all(ch.isalpha() or ch in "-'" for ch in part):
-            raise ValueError("full name may contain only letters, hyphen or apostrophe")
+    letters = "".join(parts).replace("-", "").replace("'", "")
+    if not letters.isalpha():
+        if not any(ch.isalpha() for ch in letters):
+            raise ValueError("full name must contain letters")
+        raise ValueError("full name may contain only letters, hyphen or apostrophe")
     return normalized
 
 
 
-def _normalize_birthdate(value: str) -> str:
-    """Normalize supported date formats or raise a descriptive error."""
+def _ensure_birthdate(value: str | BirthDate) -> BirthDate:
+    """Normalize ``value`` unless the caller already passed a :class:`BirthDate`."""
+
+    if isinstance(value, BirthDate):
+        return value
+    with stage("normalize"):
+        return _normalize_birthdate(value)
+
+
+
+def _normalize_birthdate(value: str) -> BirthDate:
+    """Parse any supported date format into a :class:`BirthDate` or raise a descriptive error."""
 
     if value is None:
         raise ValueError("birthdate must be provided")
@@ -74,14 +331,54 @@ def _normalize_birthdate(value: str) -> str:
     if not raw:
         raise ValueError("birthdate must be provided")
 
-    formats = ("%Y-%m-%d", "%d.%m.%Y", "%d/%m/%Y", "%d-%m-%Y")
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(raw, fmt)
-            return dt.strftime("%d.%m.%Y")
-        except ValueError:
-            continue
+    parsed = _parse_birthdate(raw)
+    if parsed is None:
+        raise ValueError(
+            "birthdate must be in one of the formats: "
+            "YYYY-MM-DD, DD.MM.YYYY, DD/MM/YYYY, DD-MM-YYYY"
+        )
+    return parsed
 
-    raise ValueError(
-        "birthdate must be in one of the formats: YYYY-MM-DD, DD.MM.YYYY, DD/MM/YYYY, DD-MM-YYYY"
-    )
+
+
+def _parse_birthdate(raw: str) -> Optional[BirthDate]:
+    """Recognize the format by its separators and split once, instead of trying each format.
+
+    Accepts what ``strptime`` accepts for ``%Y-%m-%d``, ``%d.%m.%Y``, ``%d/%m/%Y`` and
+    ``%d-%m-%Y``: one- or two-digit day and month, four-digit year and an existing
+    calendar date. Only ASCII digits count, while ``strptime`` takes any Unicode digit
+    in the year.
+    """
+
+    if not raw.isascii():
+        return None
+    if raw[4:5] == "-" and raw[:4].isdecimal():
+        parts = raw.split("-")
+        if len(parts) != 3:
+            return None
+        year, month, day = parts
+        if day[:1] == " " and len(day) == 2:  # strptime's %d also takes a space-padded day
+            day = day[1:]
+    else:
+        separator = raw[1:2] if raw[1:2] in _DATE_SEPARATORS else raw[2:3]
+        if not separator or separator not in _DATE_SEPARATORS:
+            return None
+        parts = raw.split(separator)
+        if len(parts) != 3:
+            return None
+        day, month, year = parts
+    if not (
+        len(year) == 4
+        and 0 < len(month) <= 2
+        and 0 < len(day) <= 2
+        and year.isdecimal()
+        and month.isdecimal()
+        and day.isdecimal()
+    ):
+        return None
+    birthdate = BirthDate(int(day), int(month), int(year))
+    try:
+        date(birthdate.year, birthdate.month, birthdate.day)
+    except ValueError:
+        return None
+    return birthdate
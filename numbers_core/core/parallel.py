@@ -0,0 +1,201 @@
+"""Process-pool execution for bulk profile and compatibility workloads.
+
+The calculations are pure Python, so threads cannot use more than one core.
+Here inputs are cut into consecutive chunks that worker processes run through the
+regular single-process functions (:func:`build_profiles`,
+:func:`compatibility_matrix`), and the results are stitched back together in input
+order. At most ``PREFETCH`` chunks per worker are in flight, so streaming inputs
+keep bounded memory. ``workers=1`` runs everything in the calling process.
+"""
+
+import os
+from array import array
+from collections import deque
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from numbers_core.calc.compatibility import (
+    CompatibilityMatrix,
+    compatibility_matrix_from_bases,
+    profile_bases,
+)
+from numbers_core.calc.profile import CORE_COMPONENTS
+
+from .orchestrator import ProfileInput, build_profiles
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CHUNK_SIZE = 2_000
+PREFETCH = 2
+
+
+def default_workers() -> int:
+    """CPUs available to this process (respects affinity masks and cgroups cpusets)."""
+
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return os.cpu_count() or 1
+
+
+def _chunks(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def parallel_map(
+    func: Callable[[List[T]], Iterable[R]],
+    items: Iterable[T],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[Any, ...] = (),
+) -> Iterator[R]:
+    """Apply ``func`` to consecutive chunks of ``items`` and yield the results in order.
+
+    ``func`` receives a list of up to ``chunk_size`` items and returns an iterable of
+    results (usually one per item); it must be picklable, e.g. a module-level function
+    or a ``functools.partial`` of one. ``workers`` defaults to :func:`default_workers`.
+    ``initializer(*initargs)`` runs once in every worker before its first chunk, which
+    ships data shared by all chunks once per worker instead of once per task.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = default_workers() if workers is None else workers
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for chunk in _chunks(items, chunk_size):
+            yield from func(chunk)
+        return
+
+    # Imported here: multiprocessing is only worth its start-up cost when a pool is used.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as pool:
+        pending: deque = deque()
+        for chunk in _chunks(items, chunk_size):
+            pending.append(pool.submit(func, chunk))
+            if len(pending) >= workers * PREFETCH:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def build_profiles_parallel(
+    inputs: Iterable[ProfileInput],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[Dict[str, Any]]:
+    """Same result as :func:`build_profiles`, computed by a pool of worker processes.
+
+    Each chunk is memoized on its own, so larger chunks reuse more repeated names
+    and birthdates at the price of coarser load balancing.
+    """
+
+    return list(parallel_map(build_profiles, inputs, workers, chunk_size))
+
+
+def compatibility_matrix_parallel(
+    profiles_a: Sequence[Any],
+    profiles_b: Optional[Sequence[Any]] = None,
+    details: bool = False,
+    workers: Optional[int] = None,
+    chunk_size: int = 256,
+) -> CompatibilityMatrix:
+    """Same result as :func:`compatibility_matrix`, split by rows across worker processes.
+
+    Base values are computed once here and sent to each worker once, packed into
+    bytes, when it starts; a task then carries only the ``(start, stop)`` range of
+    up to ``chunk_size`` rows it scores against all columns.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = default_workers() if workers is None else workers
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    bases_a = [profile_bases(profile) for profile in profiles_a]
+    bases_b = bases_a if profiles_b is None else [profile_bases(p) for p in profiles_b]
+    if workers == 1 or len(bases_a) <= chunk_size:
+        return compatibility_matrix_from_bases(bases_a, bases_b, details)
+
+    columns = None if profiles_b is None else _pack(bases_b)
+    ranges = [
+        (start, min(start + chunk_size, len(bases_a)))
+        for start in range(0, len(bases_a), chunk_size)
+    ]
+    parts = list(
+        parallel_map(
+            _matrix_rows,
+            ranges,
+            workers,
+            chunk_size=1,
+            initializer=_init_matrix_worker,
+            initargs=(_pack(bases_a), columns, details),
+        )
+    )
+    return CompatibilityMatrix(
+        *(
+            _concat([getattr(part, field) for part in parts])
+            for field in ("scores", "matches", "bridges")
+        )
+    )
+
+
+# Per-worker matrix inputs set by _init_matrix_worker: (rows, columns, details).
+_matrix_inputs: Optional[Tuple[List[Tuple[int, ...]], List[Tuple[int, ...]], bool]] = None
+
+
+def _pack(bases: Sequence[Tuple[int, ...]]) -> bytes:
+    return array("b", [base for signature in bases for base in signature]).tobytes()
+
+
+def _unpack(data: bytes) -> List[Tuple[int, ...]]:
+    flat = array("b", data)
+    width = len(CORE_COMPONENTS)
+    return [tuple(flat[start : start + width]) for start in range(0, len(flat), width)]
+
+
+def _init_matrix_worker(rows: bytes, columns: Optional[bytes], details: bool) -> None:
+    global _matrix_inputs
+    bases_a = _unpack(rows)
+    bases_b = bases_a if columns is None else _unpack(columns)
+    _matrix_inputs = (bases_a, bases_b, details)
+
+
+def _matrix_rows(ranges: List[Tuple[int, int]]) -> List[CompatibilityMatrix]:
+    bases_a, bases_b, details = _matrix_inputs
+    return [
+        compatibility_matrix_from_bases(bases_a[start:stop], bases_b, details)
+        for start, stop in ranges
+    ]
+
+
+def _concat(blocks: List[Any]) -> Any:
+    if blocks[0] is None:
+        return None
+    if hasattr(blocks[0], "tolist"):
+        from numbers_core.calc.vectorized import np
+
+        return np.concatenate(blocks)
+    return [row for block in blocks for row in block]
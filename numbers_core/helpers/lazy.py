@@ -0,0 +1,38 @@
+"""Ленивые реэкспорты пакетов (PEP 562).
+
+``__init__`` пакета перечисляет, из каких модулей какие имена он отдаёт, а сами
+модули импортируются при первом обращении к имени. Так ``import numbers_core``
+не тянет за собой AI-стек (``requests``, ``httpx``, ``jinja2``) и пул процессов,
+пока они не понадобились.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package: str, namespace: Dict[str, Any], exports: Dict[str, Iterable[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Возвращает ``__getattr__`` и ``__dir__`` для пакета ``package``.
+
+    ``exports`` сопоставляет модуль (относительно пакета) с экспортируемыми именами;
+    загруженное значение кладётся в ``namespace``, и следующие обращения к нему
+    идут мимо ``__getattr__``.
+    """
+
+    origins = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = origins.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted({*namespace, *origins})
+
+    return __getattr__, __dir__
@@ -0,0 +1,321 @@
+"""Счётчики, гистограммы задержек и заголовок Server-Timing.
+
+Метрики копятся в памяти процесса и отдаются в текстовом формате Prometheus
+(``render``). Этапы обработки размечаются ``with stage("calc"):``: длительность
+попадает в гистограмму ``numbers_stage_duration_seconds`` и, если идёт HTTP-запрос,
+в его заголовок ``Server-Timing``. ``NUMBERS_METRICS=off`` выключает сбор целиком:
+``stage`` тогда возвращает общий пустой контекст, а middleware просто передаёт
+запрос приложению.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Границы корзин в секундах: от расчётов за микросекунды до ответов LLM за десятки секунд.
+FAST_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+SLOW_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+enabled = os.getenv("NUMBERS_METRICS", "").lower() not in ("0", "off", "false")
+
+
+def set_enabled(value: bool) -> None:
+    """Включает или выключает сбор метрик во время работы (например, в тестах)."""
+
+    global enabled
+    enabled = value
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Монотонный счётчик с метками; значения меток передаются по порядку ``labels``."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Iterable[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            yield f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}"
+
+
+class Histogram:
+    """Гистограмма задержек в секундах с фиксированными корзинами."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Iterable[str] = (),
+        buckets: Tuple[float, ...] = SLOW_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # Для каждой комбинации меток: [счётчики корзин (последняя — +Inf), сумма]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += seconds
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series is not None else 0
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted((labels, (list(s[0]), s[1])) for labels, s in self._series.items())
+        bounds = [*self.buckets, float("inf")]
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labels, labels, le)} {cumulative}"
+            suffix = _format_labels(self.labels, labels)
+            yield f"{self.name}_sum{suffix} {_format_value(total)}"
+            yield f"{self.name}_count{suffix} {cumulative}"
+
+
+class Registry:
+    """Набор метрик процесса и функций ``stats()``, опрашиваемых при каждом экспорте."""
+
+    def __init__(self, prefix: str = "numbers") -> None:
+        self.prefix = prefix
+        self._metrics: Dict[str, object] = {}
+        self._stats: Dict[str, Tuple[Callable[[], dict], frozenset]] = {}
+
+    def counter(self, name: str, help: str, labels: Iterable[str] = ()) -> Counter:
+        return self._add(Counter(f"{self.prefix}_{name}", help, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Iterable[str] = (),
+        buckets: Tuple[float, ...] = SLOW_BUCKETS,
+    ) -> Histogram:
+        return self._add(Histogram(f"{self.prefix}_{name}", help, labels, buckets))
+
+    def register_stats(
+        self, name: str, stats: Callable[[], dict], counters: Iterable[str] = ()
+    ) -> None:
+        """Экспортирует числовые поля ``stats()`` как ``<prefix>_<name>_<поле>``.
+
+        Поля из ``counters`` отдаются как счётчики с суффиксом ``_total``, остальные —
+        как gauge. Повторная регистрация под тем же именем заменяет источник.
+        """
+
+        self._stats[name] = (stats, frozenset(counters))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        for name, (stats, counters) in self._stats.items():
+            for key, value in stats().items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                metric = f"{self.prefix}_{name}_{key}"
+                if key in counters and not metric.endswith("_total"):
+                    metric += "_total"
+                lines.append(f"# TYPE {metric} {'counter' if key in counters else 'gauge'}")
+                lines.append(f"{metric} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _add(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+
+registry = Registry()
+
+REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests by route and status.", ("method", "route", "status")
+)
+REQUEST_ERRORS = registry.counter(
+    "http_request_errors_total", "HTTP requests that ended with a 5xx status.", ("method", "route")
+)
+REQUEST_SECONDS = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency.", ("method", "route")
+)
+STAGE_SECONDS = registry.histogram(
+    "stage_duration_seconds", "Time spent in pipeline stages.", ("stage",), FAST_BUCKETS
+)
+UPSTREAM_SECONDS = registry.histogram(
+    "upstream_duration_seconds", "AI provider call latency.", ("outcome",)
+)
+LIMITER_QUEUE_SECONDS = registry.histogram(
+    "upstream_queue_duration_seconds", "Time AI calls waited for a concurrency slot.", ("lane",)
+)
+LIMITER_REJECTIONS = registry.counter(
+    "upstream_rejections_total",
+    "AI calls rejected by the concurrency limiter (reason: full or timeout).",
+    ("lane", "reason"),
+)
+
+
+class Timings:
+    """Длительности этапов одного запроса в порядке первого появления."""
+
+    __slots__ = ("stages",)
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, float] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def header(self, total: Optional[float] = None) -> str:
+        """Значение заголовка Server-Timing, длительности в миллисекундах."""
+
+        parts = [f"{name};dur={seconds * 1000:.3f}" for name, seconds in self.stages.items()]
+        if total is not None:
+            parts.append(f"total;dur={total * 1000:.3f}")
+        return ", ".join(parts)
+
+
+_current: ContextVar[Optional[Timings]] = ContextVar("numbers_timings", default=None)
+
+
+def current_timings() -> Optional[Timings]:
+    return _current.get()
+
+
+class _Stage:
+    __slots__ = ("_name", "_upstream", "_start")
+
+    def __init__(self, name: str, upstream: bool) -> None:
+        self._name = name
+        self._upstream = upstream
+
+    def __enter__(self) -> None:
+        self._start = perf_counter()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        elapsed = perf_counter() - self._start
+        STAGE_SECONDS.observe(elapsed, self._name)
+        if self._upstream:
+            UPSTREAM_SECONDS.observe(elapsed, "ok" if exc_type is None else "error")
+        timings = _current.get()
+        if timings is not None:
+            timings.add(self._name, elapsed)
+
+
+class _NoStage:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NO_STAGE = _NoStage()
+
+
+def stage(name: str):
+    """Контекст, засекающий этап ``name``; при выключенных метриках ничего не делает."""
+
+    return _Stage(name, False) if enabled else _NO_STAGE
+
+
+def upstream():
+    """Как ``stage("upstream")``, но ещё и в гистограмму вызовов провайдера с исходом."""
+
+    return _Stage("upstream", True) if enabled else _NO_STAGE
+
+
+class MetricsMiddleware:
+    """ASGI middleware: счётчики и задержки HTTP-запросов и заголовок Server-Timing.
+
+    Маршрут в метках — шаблон пути (``/match/index/{item_id}``), а не сам путь,
+    чтобы число рядов не зависело от параметров; запросы мимо маршрутов считаются
+    как ``unmatched``.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not enabled:
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter()
+        timings = Timings()
+        token = _current.set(timings)
+        status = 500
+
+        async def send_with_timing(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                value = timings.header(perf_counter() - start).encode("latin-1")
+                headers = list(message.get("headers", ()))
+                headers.append((b"server-timing", value))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            method = scope["method"]
+            REQUESTS.inc(method, route, str(status))
+            if status >= 500:
+                REQUEST_ERRORS.inc(method, route)
+            REQUEST_SECONDS.observe(perf_counter() - start, method, route)
@@ -0,0 +1,100 @@
+"""Быстрая сериализация ответов API в JSON и кэш готовых байтов.
+
+``dumps`` выдаёт ровно те же байты, что ``JSONResponse`` из Starlette (компактные
+разделители, UTF-8 без экранирования). Если установлен orjson
+(``pip install numbers-core[fast]``), кодирует он; иначе — стандартный ``json``.
+orjson пишет некоторые числа иначе, чем ``repr(float)``: экспоненту без плюса и
+ведущего нуля (``1e16`` вместо ``1e+16``) и числа из [1e-5, 1e-4) без экспоненты
+(``0.000025`` вместо ``2.5e-05``). Такой вывод и всё, что orjson не умеет (целые
+больше 64 бит, подклассы ``tuple``), перекодируется стандартным путём.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable
+
+try:  # pragma: no cover - зависит от окружения
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Места, где orjson расходится с repr(float): экспонента (цифра, «e», необязательный
+# минус, цифра) и дробь с четырьмя нулями после точки (|x| < 1e-4). Совпадение внутри
+# строки лишь отправляет объект на стандартный путь.
+_FLOAT_MISMATCH = re.compile(rb"\de-?\d|0\.0000")
+
+
+def _stdlib_dumps(content: Any) -> bytes:
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def dumps(content: Any) -> bytes:
+    """Кодирует ``content`` в JSON байт в байт как ``starlette.responses.JSONResponse``."""
+
+    if orjson is not None:
+        try:
+            data = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return _stdlib_dumps(content)
+        if _FLOAT_MISMATCH.search(data) is None:
+            return data
+    return _stdlib_dumps(content)
+
+
+class EncodedCache:
+    """LRU готовых тел ответов с ограничением по числу записей и суммарному размеру."""
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size = 0
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> bytes | None:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: Hashable, body: bytes) -> None:
+        if len(body) > self.max_bytes or self.max_entries <= 0:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = body
+            self._size += len(body)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
@@ -1,4 +1,38 @@
-﻿from .analysis import analyze_profile, analyze_profile_with_ai
-from .engine import AIClient, MockAIClient
+﻿from typing import TYPE_CHECKING
 
-__all__ = ["AIClient", "MockAIClient", "analyze_profile", "analyze_profile_with_ai"]
\ No newline at end of file
+from ..helpers.lazy import lazy_exports
+
+# analysis тянет за собой HTTP-клиенты и jinja2, поэтому загружается по первому обращению
+_EXPORTS = {
+    ".analysis": (
+        "analyze_profile",
+        "analyze_profile_async",
+        "analyze_profile_with_ai",
+        "stream_analysis",
+    ),
+    ".engine": ("AIClient", "MockAIClient"),
+    ".limiter": ("ConcurrencyLimiter", "Overloaded"),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+if TYPE_CHECKING:
+    from .analysis import (
+        analyze_profile,
+        analyze_profile_async,
+        analyze_profile_with_ai,
+        stream_analysis,
+    )
+    from .engine import AIClient, MockAIClient
+    from .limiter import ConcurrencyLimiter, Overloaded
+
+__all__ = [
+    "AIClient",
+    "ConcurrencyLimiter",
+    "MockAIClient",
+    "Overloaded",
+    "analyze_profile",
+    "analyze_profile_async",
+    "analyze_profile_with_ai",
+    "stream_analysis",
+]
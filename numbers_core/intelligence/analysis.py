@@ -1,49 +1,211 @@
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Any, Dict
+import asyncio
+import os
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict
 import warnings
 
-from .prompts.loader import load_prompt
-from .openrouter_client import OpenRouterClient
+from ..helpers.metrics import stage, upstream
+from .cache import AnalysisCache, make_cache_key
+from .limiter import LANES, ConcurrencyLimiter, Overloaded
+from .prompts.loader import PROMPTS_DIR, registry as prompt_registry  # noqa: F401
+from .openrouter_client import DEFAULT_MODEL, OpenRouterClient
+from .singleflight import SingleFlight
 
-
-PROMPTS_DIR = Path(__file__).resolve().parent / "prompts"
 DEFAULT_ERROR_MESSAGE = "Анализ временно недоступен."
 
 
+def _default_client(model: str) -> OpenRouterClient:
+    return _shared_client(model, os.getenv("OPENROUTER_API_KEY", ""))
+
+
+@lru_cache(maxsize=8)
+def _shared_client(model: str, api_key: str) -> OpenRouterClient:
+    return OpenRouterClient(model=model, api_key=api_key)
+
+
+def _render_prompts(profile: Dict[str, Any], lang: str) -> tuple[str, str]:
+    with stage("render"):
+        return prompt_registry.render(profile, lang)
+
+
+def analysis_cache_key(profile: Dict[str, Any], lang: str, client: Any, model: str) -> str:
+    """Ключ кэша анализа: профиль, язык, модель клиента и версия шаблонов."""
+
+    if client is None:
+        model_name = model
+    else:
+        model_name = getattr(client, "model", None) or type(client).__name__
+    return make_cache_key(profile, lang, model_name, prompt_registry.fingerprint(lang))
+
+
+def _usable_cache(cache: AnalysisCache | None, client: Any) -> AnalysisCache | None:
+    """Кэш для ``client``; ответы заглушек (``cacheable = False``) не кэшируются."""
+
+    return cache if getattr(client, "cacheable", True) else None
+
+
+def _slot(limiter: ConcurrencyLimiter | None, lane: str):
+    return limiter.slot(lane) if limiter is not None else nullcontext()
+
+
+def _aslot(limiter: ConcurrencyLimiter | None, lane: str):
+    return limiter.aslot(lane) if limiter is not None else nullcontext()
+
+
+def _clean(text: Any) -> str:
+    cleaned = (text or "").strip()
+    if not cleaned:
+        raise ValueError("analysis text is empty")
+    return cleaned
+
+
+def _call_client(client: Any, system: str, user: str, profile: Dict[str, Any]) -> Any:
+    if hasattr(client, "chat"):
+        return client.chat(system, user)
+    if hasattr(client, "analyze_profile"):
+        return client.analyze_profile(profile)
+    if hasattr(client, "generate"):
+        return client.generate(system.strip() + "\n\n" + user.strip())
+    raise TypeError(
+        "client must expose chat(system,user), analyze_profile(profile) or generate(prompt)"
+    )
+
+
 def analyze_profile(
     profile: Dict[str, Any],
     lang: str = "ru",
     client: Any | None = None,
-    model: str = "openai/gpt-5-chat",
+    model: str = DEFAULT_MODEL,
+    cache: AnalysisCache | None = None,
+    limiter: ConcurrencyLimiter | None = None,
+    lane: str = LANES[0],
 ) -> str:
-    system_path = PROMPTS_DIR / f"system.{lang}.md"
-    user_path = PROMPTS_DIR / f"numerology.{lang}.md"
-    system, user = load_prompt(str(user_path), str(system_path), profile)
+    """Текст анализа профиля; ошибки провайдера заменяются заглушкой.
+
+    С ``limiter`` вызов ждёт свободного слота в полосе ``lane``; отказ лимитера
+    (:class:`Overloaded`) пробрасывается, чтобы вызывающий код мог ответить 429/503.
+    """
+
+    cache = _usable_cache(cache, client)
+    key = analysis_cache_key(profile, lang, client, model) if cache is not None else None
+    if key is not None and (cached := cache.get(key)) is not None:
+        return cached
+
+    system, user = _render_prompts(profile, lang)
 
     try:
-        client = client or OpenRouterClient(model=model)
-
-        if hasattr(client, "chat"):
-            text = client.chat(system, user)
-        elif hasattr(client, "analyze_profile"):
-            text = client.analyze_profile(profile)
-        elif hasattr(client, "generate"):
-            text = client.generate(system.strip() + "\n\n" + user.strip())
-        else:
-            raise TypeError(
-                "client must expose chat(system,user), analyze_profile(profile) or generate(prompt)"
-            )
-
-        cleaned = (text or "").strip()
-        if not cleaned:
-            raise ValueError("analysis text is empty")
-        return cleaned
+        client = client or _default_client(model)
+        with _slot(limiter, lane), upstream():
+            text = _clean(_call_client(client, system, user, profile))
+    except Overloaded:
+        raise
     except Exception as exc:
         return f"{DEFAULT_ERROR_MESSAGE} Причина: {exc}"
 
+    if key is not None:
+        cache.set(key, text)
+    return text
+
 
-def analyze_profile_with_ai(profile: Dict[str, Any], ai_client: Any = None, lang: str = "ru") -> str:
+async def analyze_profile_async(
+    profile: Dict[str, Any],
+    lang: str = "ru",
+    client: Any | None = None,
+    model: str = DEFAULT_MODEL,
+    cache: AnalysisCache | None = None,
+    flights: SingleFlight | None = None,
+    limiter: ConcurrencyLimiter | None = None,
+    lane: str = LANES[0],
+) -> str:
+    """Асинхронный вариант analyze_profile.
+
+    Клиенты с ``achat`` вызываются без блокировки цикла событий, синхронные
+    клиенты выполняются в пуле потоков. С ``flights`` одновременные запросы с
+    одинаковым ключом (профиль, язык, модель, шаблоны) делят один вызов клиента,
+    и слот ``limiter`` занимает только он.
+    """
+
+    cache = _usable_cache(cache, client)
+    use_key = cache is not None or flights is not None
+    key = analysis_cache_key(profile, lang, client, model) if use_key else None
+    if cache is not None and (cached := await cache.aget(key)) is not None:
+        return cached
+
+    system, user = _render_prompts(profile, lang)
+
+    async def generate() -> str:
+        ai = client or _default_client(model)
+        async with _aslot(limiter, lane):
+            with upstream():
+                if hasattr(ai, "achat"):
+                    text = _clean(await ai.achat(system, user))
+                else:
+                    text = _clean(await asyncio.to_thread(_call_client, ai, system, user, profile))
+        if cache is not None:
+            await cache.aset(key, text)
+        return text
+
+    try:
+        if flights is not None:
+            return await flights.do(key, generate)
+        return await generate()
+    except Overloaded:
+        raise
+    except Exception as exc:
+        return f"{DEFAULT_ERROR_MESSAGE} Причина: {exc}"
+
+
+async def stream_analysis(
+    profile: Dict[str, Any],
+    lang: str = "ru",
+    client: Any | None = None,
+    model: str = DEFAULT_MODEL,
+    cache: AnalysisCache | None = None,
+    limiter: ConcurrencyLimiter | None = None,
+    lane: str = LANES[0],
+) -> AsyncIterator[str]:
+    """Отдаёт текст анализа фрагментами по мере генерации.
+
+    Клиенты без ``astream_chat`` (например, MockAIClient) и попадания в кэш отдают
+    весь текст одним фрагментом. В отличие от analyze_profile ошибки не заменяются
+    заглушкой, а пробрасываются вызывающему коду.
+    """
+
+    cache = _usable_cache(cache, client)
+    key = analysis_cache_key(profile, lang, client, model) if cache is not None else None
+    if key is not None and (cached := await cache.aget(key)) is not None:
+        yield cached
+        return
+
+    system, user = _render_prompts(profile, lang)
+    client = client or _default_client(model)
+    if hasattr(client, "astream_chat"):
+        parts = []
+        async with _aslot(limiter, lane):
+            with upstream():
+                async for piece in client.astream_chat(system, user):
+                    parts.append(piece)
+                    yield piece
+        text = _clean("".join(parts))
+    else:
+        async with _aslot(limiter, lane):
+            with upstream():
+                if hasattr(client, "achat"):
+                    text = await client.achat(system, user)
+                else:
+                    text = await asyncio.to_thread(_call_client, client, system, user, profile)
+        text = _clean(text)
+        yield text
+
+    if key is not None:
+        await cache.aset(key, text)
+
+
+def analyze_profile_with_ai(
+    profile: Dict[str, Any], ai_client: Any = None, lang: str = "ru"
+) -> str:
     warnings.warn("Используй analyze_profile(..., client=ai_client)", DeprecationWarning)
     return analyze_profile(profile, lang=lang, client=ai_client)
@@ -0,0 +1,235 @@
+"""Кэш результатов AI-анализа: LRU в памяти и необязательный уровень SQLite."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict
+
+# Сколько попаданий на диск копится в памяти до принудительной записи времени доступа
+_MAX_TOUCHED = 1024
+
+
+def make_cache_key(profile: Dict[str, Any], lang: str, model: str, prompt_hash: str) -> str:
+    """Ключ кэша: канонический профиль, язык, модель и хэш шаблонов промпта."""
+
+    canonical = json.dumps(profile, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    raw = "\x1f".join((canonical, lang, model, prompt_hash))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class AnalysisCache:
+    """Двухуровневый кэш текстов анализа со счётчиками попаданий и промахов.
+
+    Первый уровень — LRU в памяти на ``max_entries`` записей. Если задан ``path``,
+    записи дублируются в SQLite, и при превышении ``max_disk_entries`` вытесняются
+    самые давно использованные. На обоих уровнях запись живёт ``ttl`` секунд
+    (``None`` — бессрочно).
+
+    Из цикла событий используйте ``aget``/``aset``: память проверяется сразу, а
+    обращения к SQLite уходят в пул потоков. Время использования записей на диске
+    копится в памяти и сохраняется пачкой при следующей записи. После ``close``
+    соединение открывается заново при первом обращении.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        path: str | None = None,
+        ttl: float | None = 7 * 24 * 3600,
+        max_disk_entries: int = 100_000,
+    ) -> None:
+        self.max_entries = max_entries
+        self.path = path
+        self.ttl = ttl
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        # SQLite обслуживается отдельной блокировкой, чтобы диск не держал память
+        self._disk_lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._disk_count = 0
+        self._touched: Dict[str, float] = {}
+        if path:
+            self._connection()
+
+    def get(self, key: str) -> str | None:
+        text = self._memory_get(key)
+        if text is None:
+            text = self._disk_lookup(key)
+        return text
+
+    async def aget(self, key: str) -> str | None:
+        """Как :meth:`get`, но чтение SQLite не блокирует цикл событий."""
+
+        text = self._memory_get(key)
+        if text is None:
+            if self.path is None:
+                return self._disk_lookup(key)
+            text = await asyncio.to_thread(self._disk_lookup, key)
+        return text
+
+    def set(self, key: str, text: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._remember(key, text, now)
+        if self.path is not None:
+            self._disk_put(key, text, now)
+
+    async def aset(self, key: str, text: str) -> None:
+        """Как :meth:`set`, но запись в SQLite выполняется в пуле потоков."""
+
+        now = time.time()
+        with self._lock:
+            self._remember(key, text, now)
+        if self.path is not None:
+            await asyncio.to_thread(self._disk_put, key, text, now)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self.path is not None:
+            with self._disk_lock:
+                db = self._connection()
+                db.execute("DELETE FROM analysis_cache")
+                db.commit()
+                self._disk_count = 0
+                self._touched.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "memory_entries": len(self._memory),
+            }
+
+    def close(self) -> None:
+        with self._disk_lock:
+            if self._db is not None:
+                self._flush_touched()
+                self._db.commit()
+                self._db.close()
+                self._db = None
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl is not None and time.time() - created > self.ttl
+
+    def _remember(self, key: str, text: str, created: float) -> None:
+        self._memory[key] = (text, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _memory_get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._expired(entry[1]):
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self._memory.pop(key, None)
+            if self.path is None:
+                self.misses += 1
+            return None
+
+    def _disk_lookup(self, key: str) -> str | None:
+        """Второй уровень после промаха в памяти; найденная запись поднимается в память."""
+
+        if self.path is None:
+            return None
+        with self._disk_lock:
+            entry = self._disk_get(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self._remember(key, *entry)
+            self.hits += 1
+            self.disk_hits += 1
+            return entry[0]
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._db is None:
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS analysis_cache ("
+                "key TEXT PRIMARY KEY, text TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS analysis_cache_accessed ON analysis_cache(accessed)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS analysis_cache_created ON analysis_cache(created)"
+            )
+            db.commit()
+            # Единственный полный подсчёт; дальше число строк ведётся по изменениям
+            (self._disk_count,) = db.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()
+            self._db = db
+        return self._db
+
+    def _disk_get(self, key: str) -> tuple[str, float] | None:
+        db = self._connection()
+        row = db.execute(
+            "SELECT text, created FROM analysis_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        text, created = row
+        if self._expired(created):
+            self._disk_count -= db.execute(
+                "DELETE FROM analysis_cache WHERE key = ?", (key,)
+            ).rowcount
+            db.commit()
+            return None
+        self._touched[key] = time.time()
+        if len(self._touched) >= _MAX_TOUCHED:
+            self._flush_touched()
+            db.commit()
+        return text, created
+
+    def _disk_put(self, key: str, text: str, now: float) -> None:
+        with self._disk_lock:
+            db = self._connection()
+            self._touched.pop(key, None)
+            updated = db.execute(
+                "UPDATE analysis_cache SET text = ?, created = ?, accessed = ? WHERE key = ?",
+                (text, now, now, key),
+            ).rowcount
+            if not updated:
+                db.execute("INSERT INTO analysis_cache VALUES (?, ?, ?, ?)", (key, text, now, now))
+                self._disk_count += 1
+            self._flush_touched()
+            self._evict_disk()
+            db.commit()
+
+    def _flush_touched(self) -> None:
+        if self._touched:
+            self._db.executemany(
+                "UPDATE analysis_cache SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _evict_disk(self) -> None:
+        excess = self._disk_count - self.max_disk_entries
+        if excess > 0:
+            self._disk_count -= self._db.execute(
+                "DELETE FROM analysis_cache WHERE key IN "
+                "(SELECT key FROM analysis_cache ORDER BY accessed, rowid LIMIT ?)",
+                (excess,),
+            ).rowcount
+        if self.ttl is not None:
+            self._disk_count -= self._db.execute(
+                "DELETE FROM analysis_cache WHERE created < ?", (time.time() - self.ttl,)
+            ).rowcount
@@ -10,6 +10,9 @@ class AIClient(Protocol):
 class MockAIClient:
     """Мок-реализация клиента, используемая по умолчанию."""
 
+    # Текст-заглушка не должен попадать в кэш анализов
+    cacheable = False
+
     def generate(self, prompt: str) -> str:
         return "Анализ временно недоступен: использована mock-реализация."
 
@@ -0,0 +1,214 @@
+"""Ограничение одновременных вызовов AI-провайдера с очередью и приоритетами.
+
+``ConcurrencyLimiter`` пропускает к провайдеру не больше ``max_concurrent`` вызовов;
+остальные ждут в ограниченных очередях по полосам (``interactive`` раньше ``bulk``).
+Переполненная очередь сразу отвечает ``Overloaded`` с кодом 429, слишком долгое
+ожидание — с кодом 503; в обоих случаях с оценкой ``retry_after``. Лимитер
+работает и из цикла событий (``aslot``), и из потоков (``slot``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from time import perf_counter
+from typing import AsyncIterator, Deque, Dict, Iterable, Iterator
+
+from ..helpers import metrics
+
+# Полосы в порядке приоритета: свободный слот достаётся первой непустой
+LANES = ("interactive", "bulk")
+MAX_RETRY_AFTER = 120
+
+
+class Overloaded(RuntimeError):
+    """Вызов отклонён лимитером: ``status_code`` 429 (очередь полна) или 503 (таймаут)."""
+
+    def __init__(self, message: str, status_code: int, retry_after: int) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    __slots__ = ("granted", "_event", "_future", "_loop")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self.granted = False
+        self._loop = loop
+        self._event = None if loop else threading.Event()
+        self._future = loop.create_future() if loop else None
+
+    def grant(self) -> None:
+        self.granted = True
+        if self._loop is None:
+            self._event.set()
+        else:
+            self._loop.call_soon_threadsafe(_resolve, self._future)
+
+    def wait(self, timeout: float | None) -> bool:
+        return self._event.wait(timeout)
+
+    async def await_grant(self, timeout: float | None) -> None:
+        await asyncio.wait_for(self._future, timeout)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class ConcurrencyLimiter:
+    """Не больше ``max_concurrent`` вызовов сразу и ``max_queue`` ожидающих на полосу.
+
+    Ожидание дольше ``queue_timeout`` секунд (``None`` — без ограничения)
+    отклоняется. ``retry_after`` оценивается по скользящему среднему времени
+    занятия слота и длине очереди.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 16,
+        max_queue: int = 64,
+        queue_timeout: float | None = 30.0,
+        lanes: Iterable[str] = LANES,
+    ) -> None:
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.lanes = tuple(lanes)
+        self.active = 0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._service_seconds = 1.0
+        self._queues: Dict[str, Deque[_Waiter]] = {lane: deque() for lane in self.lanes}
+        self._lock = threading.Lock()
+
+    def _enter(self, lane: str, loop: asyncio.AbstractEventLoop | None) -> _Waiter | None:
+        """Занимает слот (``None``) или ставит в очередь полосы ``lane`` (ожидающий)."""
+
+        with self._lock:
+            queue = self._queues.get(lane)
+            if queue is None:
+                raise ValueError(f"unknown lane {lane!r}, expected one of {', '.join(self.lanes)}")
+            if self.active < self.max_concurrent:
+                self.active += 1
+                self.admitted += 1
+                return None
+            if len(queue) >= self.max_queue:
+                self.rejected += 1
+                retry_after = self._retry_after()
+            else:
+                waiter = _Waiter(loop)
+                queue.append(waiter)
+                self.queued += 1
+                return waiter
+        metrics.LIMITER_REJECTIONS.inc(lane, "full")
+        raise Overloaded(f"AI queue for {lane} requests is full", 429, retry_after)
+
+    def _give_up(self, lane: str, waiter: _Waiter) -> bool:
+        """Снимает ожидающего с очереди; ``True``, если слот ему уже передан."""
+
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._queues[lane].remove(waiter)
+            return False
+
+    def _timed_out(self, lane: str) -> Overloaded:
+        with self._lock:
+            self.timed_out += 1
+            retry_after = self._retry_after()
+        metrics.LIMITER_REJECTIONS.inc(lane, "timeout")
+        return Overloaded(
+            f"AI call waited longer than {self.queue_timeout:g}s for a slot", 503, retry_after
+        )
+
+    def _retry_after(self) -> int:
+        waiting = sum(len(queue) for queue in self._queues.values())
+        estimate = self._service_seconds * (waiting + 1) / self.max_concurrent
+        return min(max(math.ceil(estimate), 1), MAX_RETRY_AFTER)
+
+    def acquire(self, lane: str = LANES[0]) -> float:
+        """Блокирующе занимает слот; возвращает время ожидания в секундах."""
+
+        start = perf_counter()
+        waiter = self._enter(lane, None)
+        if waiter is not None and not waiter.wait(self.queue_timeout):
+            if not self._give_up(lane, waiter):
+                raise self._timed_out(lane)
+        return self._waited(lane, start)
+
+    async def acquire_async(self, lane: str = LANES[0]) -> float:
+        """Как :meth:`acquire`, но ожидание не блокирует цикл событий."""
+
+        start = perf_counter()
+        waiter = self._enter(lane, asyncio.get_running_loop())
+        if waiter is not None:
+            try:
+                await waiter.await_grant(self.queue_timeout)
+            except asyncio.TimeoutError:
+                if not self._give_up(lane, waiter):
+                    raise self._timed_out(lane) from None
+            except BaseException:
+                if self._give_up(lane, waiter):
+                    self.release()
+                raise
+        return self._waited(lane, start)
+
+    def _waited(self, lane: str, start: float) -> float:
+        waited = perf_counter() - start
+        if metrics.enabled:
+            metrics.LIMITER_QUEUE_SECONDS.observe(waited, lane)
+            timings = metrics.current_timings()
+            if timings is not None:
+                timings.add("queue", waited)
+        return waited
+
+    def release(self, held: float | None = None) -> None:
+        """Освобождает слот, передавая его первому ожидающему по приоритету полос."""
+
+        with self._lock:
+            if held is not None:
+                self._service_seconds += (held - self._service_seconds) * 0.2
+            for queue in self._queues.values():
+                if queue:
+                    queue.popleft().grant()
+                    return
+            self.active -= 1
+
+    @contextmanager
+    def slot(self, lane: str = LANES[0]) -> Iterator[None]:
+        self.acquire(lane)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.release(perf_counter() - start)
+
+    @asynccontextmanager
+    async def aslot(self, lane: str = LANES[0]) -> AsyncIterator[None]:
+        await self.acquire_async(lane)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.release(perf_counter() - start)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "admitted": self.admitted,
+                "queued": self.queued,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "active": self.active,
+                "waiting": sum(len(queue) for queue in self._queues.values()),
+            }
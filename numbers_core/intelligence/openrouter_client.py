@@ -1,48 +1,194 @@
 from __future__ import annotations
 
+import json
 import os
-from typing import Any, Dict
+import threading
+from typing import Any, AsyncIterator, Dict
 
+import httpx
 import requests
 
+DEFAULT_MODEL = "openai/gpt-5-chat"
+DEFAULT_URL = "https://openrouter.ai/api/v1/chat/completions"
+MISSING_KEY_MESSAGE = "OpenRouter API key is missing. Set OPENROUTER_API_KEY to enable analysis."
+
+
+def _build_headers(api_key: str) -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+
+def _build_payload(model: str, system: str, user: str, stream: bool = False) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system},
+            {"role": "user", "content": user},
+        ],
+        "temperature": 0.7,
+        "max_tokens": 800,
+    }
+    if stream:
+        payload["stream"] = True
+    return payload
+
+
+class _StreamEnd(Exception):
+    pass
+
+
+def _parse_stream_line(line: str) -> str | None:
+    """Разбирает строку SSE-потока OpenRouter; возвращает фрагмент текста или None."""
+
+    if not line.startswith("data:"):
+        return None  # пустые строки-разделители и комментарии вида ": OPENROUTER PROCESSING"
+    data = line[len("data:") :].strip()
+    if data == "[DONE]":
+        raise _StreamEnd
+    try:
+        chunk = json.loads(data)
+    except ValueError as exc:
+        raise RuntimeError("OpenRouter stream contains malformed data") from exc
+    if isinstance(chunk, dict) and "error" in chunk:
+        raise RuntimeError(f"OpenRouter stream failed: {chunk['error']}")
+    try:
+        return chunk["choices"][0]["delta"].get("content") or None
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return None
+
+
+def _extract_content(data: Any) -> str:
+    try:
+        content = data["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError) as exc:
+        raise RuntimeError("OpenRouter response is missing message content") from exc
+
+    if not isinstance(content, str) or not content.strip():
+        raise RuntimeError("OpenRouter returned empty analysis text")
+
+    return content.strip()
+
 
 class OpenRouterClient:
-    def __init__(self, model: str = "openai/gpt-5-chat", api_key: str | None = None, url: str = "https://openrouter.ai/api/v1/chat/completions") -> None:
+    def __init__(
+        self, model: str = DEFAULT_MODEL, api_key: str | None = None, url: str = DEFAULT_URL
+    ) -> None:
         self.model = model
         self.api_key = (api_key or os.getenv("OPENROUTER_API_KEY", "")).strip()
         self.url = url
+        # У каждого потока своя сессия с keep-alive соединением: requests.Session
+        # не гарантирует потокобезопасность, а клиент общий для пула потоков.
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
 
     def chat(self, system: str, user: str) -> str:
         if not self.api_key:
-            raise ValueError("OpenRouter API key is missing. Set OPENROUTER_API_KEY to enable analysis.")
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-        payload: Dict[str, Any] = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": system},
-                {"role": "user", "content": user},
-            ],
-            "temperature": 0.7,
-            "max_tokens": 800,
-        }
+            raise ValueError(MISSING_KEY_MESSAGE)
 
         try:
-            response = requests.post(self.url, headers=headers, json=payload, timeout=60)
+            response = self._session().post(
+                self.url,
+                headers=_build_headers(self.api_key),
+                json=_build_payload(self.model, system, user),
+                timeout=60,
+            )
             response.raise_for_status()
         except requests.RequestException as exc:
             raise RuntimeError(f"OpenRouter request failed: {exc}") from exc
 
-        data = response.json()
+        return _extract_content(response.json())
+
+    def close(self) -> None:
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+
+
+class AsyncOpenRouterClient:
+    """Асинхронный клиент OpenRouter с общим ограниченным пулом keep-alive соединений.
+
+    Один экземпляр рассчитан на переиспользование между запросами: пул создаётся
+    лениво при первом вызове и закрывается через ``aclose()``.
+    """
+
+    def __init__(
+        self,
+        model: str = DEFAULT_MODEL,
+        api_key: str | None = None,
+        url: str = DEFAULT_URL,
+        timeout: float = 60.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+    ) -> None:
+        self.model = model
+        self.api_key = (api_key or os.getenv("OPENROUTER_API_KEY", "")).strip()
+        self.url = url
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._http: httpx.AsyncClient | None = None
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(limits=self.limits, timeout=self.timeout)
+        return self._http
+
+    async def achat(self, system: str, user: str) -> str:
+        if not self.api_key:
+            raise ValueError(MISSING_KEY_MESSAGE)
+
         try:
-            content = data["choices"][0]["message"]["content"]
-        except (KeyError, IndexError, TypeError) as exc:
-            raise RuntimeError("OpenRouter response is missing message content") from exc
+            response = await self._client().post(
+                self.url,
+                headers=_build_headers(self.api_key),
+                json=_build_payload(self.model, system, user),
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise RuntimeError(f"OpenRouter request failed: {exc}") from exc
+
+        return _extract_content(response.json())
+
+    async def astream_chat(self, system: str, user: str) -> AsyncIterator[str]:
+        """Асинхронно отдаёт фрагменты ответа по мере генерации."""
 
-        if not isinstance(content, str) or not content.strip():
-            raise RuntimeError("OpenRouter returned empty analysis text")
+        if not self.api_key:
+            raise ValueError(MISSING_KEY_MESSAGE)
+
+        try:
+            async with self._client().stream(
+                "POST",
+                self.url,
+                headers=_build_headers(self.api_key),
+                json=_build_payload(self.model, system, user, stream=True),
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    try:
+                        piece = _parse_stream_line(line)
+                    except _StreamEnd:
+                        return
+                    if piece:
+                        yield piece
+        except httpx.HTTPError as exc:
+            raise RuntimeError(f"OpenRouter request failed: {exc}") from exc
 
-        return content.strip()
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
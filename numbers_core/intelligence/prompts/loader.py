@@ -1,11 +1,128 @@
-﻿from pathlib import Path
+﻿from dataclasses import dataclass
+from pathlib import Path
 from jinja2 import Template
+import hashlib
 import json
+import os
+import threading
+import time
+
+PROMPTS_DIR = Path(__file__).resolve().parent
 
 
 def load_prompt(user_tmpl_path: str, system_tmpl_path: str, profile: dict):
     u_text = Path(user_tmpl_path).read_text(encoding="utf-8")
     s_text = Path(system_tmpl_path).read_text(encoding="utf-8")
-    user = Template(u_text).render(profile_json=json.dumps(profile, ensure_ascii=False, indent=2))
+    user = Template(u_text).render(profile_json=_profile_json(profile))
     system = Template(s_text).render()
     return system.strip(), user.strip()
+
+
+def _profile_json(profile: dict) -> str:
+    return json.dumps(profile, ensure_ascii=False, indent=2)
+
+
+@dataclass
+class _CompiledPrompt:
+    user: Template
+    system: str
+    fingerprint: str
+    mtimes: tuple[int, int]
+    checked_at: float
+
+
+class PromptRegistry:
+    """Скомпилированные шаблоны ``system.{lang}.md``/``numerology.{lang}.md``.
+
+    Каждый язык читается и компилируется один раз; изменения файлов подхватываются
+    по mtime, но не чаще раза в ``check_interval`` секунд (``None`` — не проверять).
+    Суммарное и последнее время рендера доступны через ``stats()``.
+    """
+
+    def __init__(self, directory: Path = PROMPTS_DIR, check_interval: float | None = 2.0):
+        self.directory = Path(directory)
+        self.check_interval = check_interval
+        self.renders = 0
+        self.render_seconds = 0.0
+        self.last_render_seconds = 0.0
+        self._prompts: dict[str, _CompiledPrompt] = {}
+        self._lock = threading.Lock()
+
+    def languages(self) -> list[str]:
+        """Языки, для которых есть оба шаблона."""
+
+        languages = []
+        for path in self.directory.glob("system.*.md"):
+            lang = path.name[len("system.") : -len(".md")]
+            if self._paths(lang)[0].exists():
+                languages.append(lang)
+        return sorted(languages)
+
+    def preload(self) -> list[str]:
+        """Компилирует шаблоны всех доступных языков заранее."""
+
+        languages = self.languages()
+        for lang in languages:
+            self._get(lang)
+        return languages
+
+    def render(self, profile: dict, lang: str = "ru") -> tuple[str, str]:
+        """Возвращает (system, user) для профиля — то же, что и ``load_prompt``."""
+
+        prompt = self._get(lang)
+        start = time.perf_counter()
+        user = prompt.user.render(profile_json=_profile_json(profile)).strip()
+        elapsed = time.perf_counter() - start
+        self.renders += 1
+        self.render_seconds += elapsed
+        self.last_render_seconds = elapsed
+        return prompt.system, user
+
+    def fingerprint(self, lang: str = "ru") -> str:
+        """SHA-256 исходников шаблонов языка — часть ключа кэша анализа."""
+
+        return self._get(lang).fingerprint
+
+    def stats(self) -> dict:
+        return {
+            "languages": sorted(self._prompts),
+            "renders": self.renders,
+            "render_seconds_total": self.render_seconds,
+            "last_render_seconds": self.last_render_seconds,
+        }
+
+    def _paths(self, lang: str) -> tuple[Path, Path]:
+        return self.directory / f"numerology.{lang}.md", self.directory / f"system.{lang}.md"
+
+    def _get(self, lang: str) -> _CompiledPrompt:
+        prompt = self._prompts.get(lang)
+        if prompt is not None and (
+            self.check_interval is None
+            or time.monotonic() - prompt.checked_at < self.check_interval
+        ):
+            return prompt
+        with self._lock:
+            paths = self._paths(lang)
+            mtimes = tuple(os.stat(path).st_mtime_ns for path in paths)
+            prompt = self._prompts.get(lang)
+            if prompt is None or prompt.mtimes != mtimes:
+                prompt = self._compile(paths, mtimes)
+            prompt.checked_at = time.monotonic()
+            self._prompts[lang] = prompt
+            return prompt
+
+    def _compile(self, paths: tuple[Path, Path], mtimes: tuple[int, int]) -> _CompiledPrompt:
+        user_path, system_path = paths
+        u_text = user_path.read_text(encoding="utf-8")
+        s_text = system_path.read_text(encoding="utf-8")
+        fingerprint = hashlib.sha256((u_text + "\x00" + s_text).encode("utf-8")).hexdigest()
+        return _CompiledPrompt(
+            user=Template(u_text),
+            system=Template(s_text).render().strip(),
+            fingerprint=fingerprint,
+            mtimes=mtimes,
+            checked_at=0.0,
+        )
+
+
+registry = PromptRegistry()
@@ -0,0 +1,43 @@
+"""Объединение одинаковых одновременных вызовов (single-flight)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Пока вызов с ключом ``key`` выполняется, остальные вызовы с тем же ключом
+    ждут его результат вместо собственного обращения к провайдеру.
+
+    Ошибка общего вызова пробрасывается всем ожидающим. Отмена одного ожидающего
+    не прерывает общий вызов для остальных. ``collapsed`` считает вызовы, которые
+    присоединились к уже идущему.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.collapsed = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.calls += 1
+        else:
+            self.collapsed += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        return {"calls": self.calls, "collapsed": self.collapsed, "in_flight": len(self._inflight)}
+
+    def _forget(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # помечаем ошибку прочитанной, даже если ждать было некому
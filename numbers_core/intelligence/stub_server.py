@@ -0,0 +1,125 @@
+"""Локальная подмена OpenRouter для тестов и нагрузочных прогонов.
+
+Запуск: ``python -m numbers_core.intelligence.stub_server --port 8765`` и
+``OPENROUTER_URL=http://127.0.0.1:8765/api/v1/chat/completions``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+CHAT_PATH = "/api/v1/chat/completions"
+DEFAULT_REPLY = "Анализ от тестового сервера."
+
+
+class StubOpenRouterServer(ThreadingHTTPServer):
+    """HTTP-сервер с ответами в формате chat/completions и счётчиками обращений."""
+
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), reply: str = DEFAULT_REPLY, delay: float = 0.0):
+        super().__init__(address, _StubHandler)
+        self.reply = reply
+        self.delay = delay
+        self.requests = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{CHAT_PATH}"
+
+    def count(self, attr: str) -> None:
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StubOpenRouterServer
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.count("connections")
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        self.server.count("requests")
+        if self.path != CHAT_PATH:
+            self._send(404, {"error": "not found"})
+            return
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        if payload.get("stream"):
+            self._stream(self.server.reply)
+            return
+        self._send(200, {"choices": [{"message": {"content": self.server.reply}}]})
+
+    def _stream(self, reply: str) -> None:
+        """Отдаёт ответ SSE-фрагментами по словам, как это делает OpenRouter."""
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        events = [": OPENROUTER PROCESSING\n\n"]
+        for word in reply.split(" "):
+            piece = word if len(events) == 1 else " " + word
+            chunk = {"choices": [{"delta": {"content": piece}}]}
+            events.append(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n")
+        events.append("data: [DONE]\n\n")
+        for event in events:
+            data = event.encode("utf-8")
+            self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@contextmanager
+def running_stub(**kwargs) -> Iterator[StubOpenRouterServer]:
+    """Запускает сервер в фоновом потоке на свободном порту."""
+
+    server = StubOpenRouterServer(**kwargs)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local OpenRouter stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds to wait per request")
+    parser.add_argument("--reply", default=DEFAULT_REPLY)
+    args = parser.parse_args()
+
+    server = StubOpenRouterServer((args.host, args.port), reply=args.reply, delay=args.delay)
+    print(f"Serving stub OpenRouter at {server.url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
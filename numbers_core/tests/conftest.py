@@ -0,0 +1,13 @@
+import pytest
+
+from numbers_core.calc import datetable
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_date_table(tmp_path_factory):
+    """Keep the generated date table out of the user's cache directory."""
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("NUMBERS_DATE_TABLE_PATH", str(tmp_path_factory.mktemp("cache") / "dates.bin"))
+        patch.setattr(datetable, "_table_data", datetable._UNLOADED)
+        yield
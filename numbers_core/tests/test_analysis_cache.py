@@ -0,0 +1,130 @@
+import asyncio
+
+from numbers_core.intelligence.analysis import analyze_profile, analyze_profile_async
+from numbers_core.intelligence.cache import AnalysisCache, make_cache_key
+from numbers_core.intelligence.engine import MockAIClient
+
+PROFILE = {
+    "life_path": "3",
+    "birthday": "1",
+    "expression": "5",
+    "soul": "2(11)",
+    "personality": "3",
+}
+
+
+class CountingClient:
+    model = "test/model"
+
+    def __init__(self):
+        self.calls = 0
+
+    def chat(self, system: str, user: str) -> str:
+        self.calls += 1
+        return f"analysis #{self.calls}"
+
+
+def test_analyze_profile_serves_repeated_profiles_from_cache():
+    cache = AnalysisCache()
+    client = CountingClient()
+
+    first = analyze_profile(dict(PROFILE), client=client, cache=cache)
+    second = analyze_profile(dict(reversed(PROFILE.items())), client=client, cache=cache)
+
+    assert first == second == "analysis #1"
+    assert client.calls == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_cache_key_covers_language_model_and_prompt_version():
+    base = make_cache_key(PROFILE, "ru", "m1", "hash")
+
+    assert base == make_cache_key(dict(PROFILE), "ru", "m1", "hash")
+    assert base != make_cache_key(PROFILE, "en", "m1", "hash")
+    assert base != make_cache_key(PROFILE, "ru", "m2", "hash")
+    assert base != make_cache_key(PROFILE, "ru", "m1", "other")
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = AnalysisCache(max_entries=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    cache.get("a")
+    cache.set("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+
+
+def test_disk_tier_survives_restart_and_honours_ttl(tmp_path):
+    path = str(tmp_path / "analysis.sqlite")
+    writer = AnalysisCache(path=path)
+    writer.set("key", "text")
+    writer.close()
+
+    reader = AnalysisCache(path=path)
+    assert reader.get("key") == "text"
+    assert reader.stats()["disk_hits"] == 1
+    reader.close()
+
+    expired = AnalysisCache(path=path, ttl=-1)
+    assert expired.get("key") is None
+    expired.close()
+
+
+def test_disk_tier_evicts_beyond_capacity(tmp_path):
+    cache = AnalysisCache(max_entries=1, path=str(tmp_path / "a.sqlite"), max_disk_entries=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, key.upper())
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "B"
+    cache.close()
+
+
+def test_disk_eviction_follows_recent_disk_hits(tmp_path):
+    cache = AnalysisCache(max_entries=1, path=str(tmp_path / "a.sqlite"), max_disk_entries=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.get("a") == "A"
+    cache.set("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    cache.close()
+
+
+def test_closed_cache_reopens_its_disk_tier(tmp_path):
+    path = str(tmp_path / "a.sqlite")
+    cache = AnalysisCache(max_entries=1, path=path)
+    cache.set("a", "A")
+    cache.close()
+    cache.set("b", "B")
+    cache.close()
+
+    reader = AnalysisCache(max_entries=1, path=path)
+    assert reader.get("a") == "A" and reader.get("b") == "B"
+    reader.close()
+
+
+def test_async_access_reads_and_writes_the_disk_tier(tmp_path):
+    path = str(tmp_path / "a.sqlite")
+    cache = AnalysisCache(max_entries=1, path=path)
+
+    async def scenario():
+        await cache.aset("a", "A")
+        await cache.aset("b", "B")
+        return await cache.aget("a"), await cache.aget("missing")
+
+    assert asyncio.run(scenario()) == ("A", None)
+    assert cache.stats()["disk_hits"] == 1 and cache.stats()["misses"] == 1
+    cache.close()
+
+
+def test_mock_client_placeholders_are_not_cached():
+    cache = AnalysisCache()
+
+    analyze_profile(dict(PROFILE), client=MockAIClient(), cache=cache)
+    asyncio.run(analyze_profile_async(dict(PROFILE), client=MockAIClient(), cache=cache))
+
+    assert cache.stats() == {"hits": 0, "misses": 0, "disk_hits": 0, "memory_entries": 0}
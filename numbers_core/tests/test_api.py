@@ -0,0 +1,259 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api
+
+
+@pytest.fixture
+def http():
+    with TestClient(api.app) as client:
+        yield client
+
+
+def test_batch_route_reports_errors_per_item(http):
+    response = http.post(
+        "/profiles/batch",
+        json={
+            "items": [
+                {"full_name": "Иван Иванов", "birthdate": "01.01.1990"},
+                {"full_name": "Иван Иванов", "birthdate": "31.02.1990"},
+            ]
+        },
+    )
+
+    results = response.json()["results"]
+    assert results[0]["profile"]["life_path"] == "3"
+    assert "birthdate" in results[1]["error"]
+
+
+def test_compatibility_matrix_route(http):
+    people = [
+        {"full_name": "Иван Иванов", "birthdate": "01.01.1990"},
+        {"full_name": "Анна Петрова", "birthdate": "15.07.1985"},
+    ]
+
+    response = http.post("/compatibility/matrix", json={"people": people})
+
+    scores = response.json()["scores"]
+    assert scores[0][0] == scores[1][1] == 10
+    assert scores[0][1] == scores[1][0]
+
+
+def test_compatibility_matrix_route_rejects_invalid_person(http):
+    response = http.post(
+        "/compatibility/matrix", json={"people": [{"full_name": "Иван", "birthdate": "x"}]}
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("people[0]")
+
+
+def test_compatibility_matrix_route_caps_the_number_of_cells(http, monkeypatch):
+    monkeypatch.setattr(api, "MAX_MATRIX_CELLS", 6)
+    monkeypatch.setattr(api, "MAX_DETAILED_MATRIX_CELLS", 2)
+    person = {"full_name": "Иван Иванов", "birthdate": "01.01.1990"}
+
+    assert http.post("/compatibility/matrix", json={"people": [person] * 2}).status_code == 200
+    too_many = http.post(
+        "/compatibility/matrix", json={"people": [person] * 2, "others": [person] * 4}
+    )
+    assert too_many.status_code == 413
+    detailed = http.post("/compatibility/matrix", json={"people": [person] * 2, "details": True})
+    assert detailed.status_code == 413 and "with details" in detailed.json()["detail"]
+
+
+@pytest.fixture
+def match_index(monkeypatch):
+    """A fresh, empty index for the match routes, dropped when the test ends."""
+
+    index = api.MatchIndex()
+    monkeypatch.setattr(api, "match_index", index)
+    return index
+
+
+def test_match_index_routes(http, match_index):
+    items = [
+        {"id": "a", "full_name": "Иван Иванов", "birthdate": "01.01.1990"},
+        {"id": "b", "full_name": "Анна Петрова", "birthdate": "15.07.1985"},
+        {"id": "bad", "full_name": "Анна Петрова", "birthdate": "nope"},
+    ]
+    added = http.post("/match/index", json={"items": items}).json()
+    assert added["added"] == 2 and added["errors"][0]["id"] == "bad"
+
+    top = http.post(
+        "/match/top", json={"full_name": "Иван Иванов", "birthdate": "01.01.1990", "k": 1}
+    ).json()
+    assert top["matches"] == [{"id": "a", "score": 10}]
+
+    assert http.delete("/match/index/a").status_code == 200
+    assert http.delete("/match/index/a").status_code == 404
+    assert "b" in match_index
+
+
+def test_calendar_route_returns_whole_year(http):
+    response = http.get("/calendar", params={"birthdate": "1990-01-01", "year": 2025})
+
+    assert response.json()["birthdate"] == "01.01.1990"
+    months = response.json()["months"]
+    assert len(months) == 12
+    assert months[1]["month"] == 2 and len(months[1]["days"]) == 28
+    assert months[0]["personal_year"] == months[11]["personal_year"]
+    assert http.get("/calendar", params={"birthdate": "nope"}).status_code == 400
+
+
+def test_profile_route_reports_server_timing(http):
+    response = http.post("/profile", json={"full_name": "Иван Иванов", "birthdate": "01.01.1990"})
+
+    stages = [part.split(";")[0] for part in response.headers["server-timing"].split(", ")]
+    assert stages == ["normalize", "calc", "total"]
+
+
+def test_metrics_route_exports_requests_and_cache_stats(http):
+    http.post("/profile", json={"full_name": "Иван Иванов", "birthdate": "01.01.1990"})
+    http.delete("/match/index/missing")
+
+    response = http.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert 'route="/profile",status="200"' in text
+    assert 'route="/match/index/{item_id}",status="404"' in text
+    assert 'numbers_stage_duration_seconds_count{stage="calc"}' in text
+    assert "numbers_analysis_cache_hits_total" in text
+    assert "numbers_prompt_render_seconds_total " in text
+
+
+def test_metrics_route_is_hidden_when_disabled(http, monkeypatch):
+    monkeypatch.setattr(api.metrics, "enabled", False)
+
+    response = http.post("/profile", json={"full_name": "Иван Иванов", "birthdate": "01.01.1990"})
+
+    assert "server-timing" not in response.headers
+    assert http.get("/metrics").status_code == 404
+
+
+def test_profile_route_returns_requested_sections(http):
+    payload = {"full_name": "Иван Иванов", "birthdate": "01.01.1990"}
+
+    flat = http.post("/profile", json=payload).json()
+    sections = http.post(
+        "/profile", json={**payload, "fields": ["bridges", "core"], "year": 2024}
+    ).json()
+    bad = http.post("/profile", json={**payload, "fields": ["soul"]})
+
+    assert list(sections) == ["core", "bridges"]
+    assert sections["core"] == flat
+    assert bad.status_code == 400
+
+
+def test_batch_route_returns_requested_sections(http):
+    response = http.post(
+        "/profiles/batch",
+        json={
+            "items": [{"full_name": "Иван Иванов", "birthdate": "01.01.1990"}],
+            "fields": ["extended"],
+        },
+    )
+
+    (result,) = response.json()["results"]
+    assert list(result["profile"]) == ["extended"]
+
+
+def test_json_routes_keep_the_compact_utf8_encoding(http):
+    person = {"full_name": "Анна Петрова", "birthdate": "15.07.1985"}
+    responses = [
+        http.post("/profile", json=person),
+        http.post("/profile", json={**person, "fields": ["core", "personal_months"]}),
+        http.post("/profiles/batch", json={"items": [person, {**person, "birthdate": "x"}]}),
+        http.post("/compatibility/matrix", json={"people": [person], "details": True}),
+        http.get("/calendar", params={"birthdate": "15.07.1985", "year": 2025, "months": 2}),
+    ]
+
+    for response in responses:
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        expected = json.dumps(response.json(), ensure_ascii=False, separators=(",", ":"))
+        assert response.content == expected.encode("utf-8")
+
+
+def test_profile_route_serves_repeated_normalized_input_from_cache(http):
+    api.profile_responses.clear()
+    hits = api.profile_responses.hits
+
+    first = http.post("/profile", json={"full_name": "Анна Петрова", "birthdate": "15.07.1985"})
+    second = http.post(
+        "/profile", json={"full_name": "  Анна   Петрова ", "birthdate": "1985-07-15"}
+    )
+
+    assert second.content == first.content
+    assert api.profile_responses.hits == hits + 1
+    assert len(api.profile_responses) == 1
+
+
+def test_get_profile_supports_conditional_requests(http):
+    person = {"full_name": "Анна Петрова", "birthdate": "15.07.1985"}
+
+    first = http.get("/profile", params=person)
+    etag = first.headers["etag"]
+    assert first.content == http.post("/profile", json=person).content
+    assert first.headers["cache-control"] == f"public, max-age={api.HTTP_CACHE_MAX_AGE}"
+
+    revalidated = http.get(
+        "/profile",
+        params={"full_name": " Анна  Петрова", "birthdate": "1985-07-15"},
+        headers={"If-None-Match": f'W/"other", W/{etag}'},
+    )
+    assert revalidated.status_code == 304 and revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+    sections = http.get("/profile", params={**person, "fields": "core,personal_years"})
+    assert sections.headers["etag"] != etag
+    assert http.get("/profile", params={**person, "fields": "nope"}).status_code == 400
+
+
+def test_personal_months_route_is_cacheable(http):
+    response = http.get(
+        "/personal-months", params={"birthdate": "1985-07-15", "year": 2025, "years": 2}
+    )
+
+    body = response.json()
+    assert body["birthdate"] == "15.07.1985"
+    assert list(body["years"]) == ["2025", "2026"]
+    assert body["years"]["2025"]["Январь"] == "5"
+    assert "etag" in response.headers
+    not_modified = http.get(
+        "/personal-months",
+        params={"birthdate": "15.07.1985", "year": 2025, "years": 2},
+        headers={"If-None-Match": "*"},
+    )
+    assert not_modified.status_code == 304
+
+
+def test_calendar_etag_ignores_the_birthdate_format(http):
+    params = {"year": 2025, "months": 1}
+    dotted = http.get("/calendar", params={**params, "birthdate": "15.07.1985"})
+    iso = http.get("/calendar", params={**params, "birthdate": "1985-07-15"})
+
+    assert dotted.json() == iso.json()
+    assert dotted.headers["etag"] == iso.headers["etag"]
+
+
+def test_analysis_route_sheds_load_with_retry_after(http, monkeypatch):
+    saturated = api.ConcurrencyLimiter(max_concurrent=1, max_queue=0)
+    saturated.acquire()
+    monkeypatch.setattr(api, "analysis_limiter", saturated)
+    payload = {"full_name": "Очередь Переполнена", "birthdate": "03.03.1993"}
+
+    rejected = http.post("/profile/analysis", json=payload, headers={"X-Priority": "bulk"})
+    assert rejected.status_code == 429
+    assert int(rejected.headers["retry-after"]) >= 1
+
+    invalid = http.post("/profile/analysis", json=payload, headers={"X-Priority": "urgent"})
+    assert invalid.status_code == 422
+
+    saturated.release()
+    accepted = http.post("/profile/analysis", json=payload)
+    assert accepted.status_code == 200
+    assert saturated.stats()["rejected"] == 1
@@ -0,0 +1,85 @@
+import io
+import json
+
+import pytest
+
+from numbers_core import __main__ as cli
+from numbers_core import ProfileInput, build_profile
+from numbers_core.calc import calculate_bridges, calculate_extended_profile, get_personal_years
+from numbers_core.core import batch
+from numbers_core.core.batch import BatchOptions, BatchRow, process_rows, read_rows, run_batch
+
+
+def _lines(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def test_read_rows_csv_and_jsonl():
+    csv_rows = list(read_rows(io.StringIO("name,birthdate,id\nИван Иванов,01.01.1990,7\n"), "csv"))
+    jsonl = io.StringIO('{"full_name": "Иван Иванов", "birthdate": "01.01.1990"}\n\n{oops\n[1]\n')
+    jsonl_rows = list(read_rows(jsonl, "jsonl"))
+
+    assert csv_rows == [BatchRow(1, "Иван Иванов", "01.01.1990", "7")]
+    assert jsonl_rows[0] == BatchRow(1, "Иван Иванов", "01.01.1990")
+    assert jsonl_rows[1].number == 2 and jsonl_rows[1].error.startswith("invalid JSON")
+    assert jsonl_rows[2] == BatchRow(3, error="row must be an object")
+
+
+def test_process_rows_matches_single_profile_functions():
+    options = BatchOptions(extended=True, bridges=True, personal_years=3)
+    rows = [BatchRow(1, "  Анна   Петрова ", "1985-07-15"), BatchRow(2, "Анна Петрова", None)]
+
+    first, second = process_rows(rows, options)
+
+    profile = build_profile(ProfileInput("Анна Петрова", "15.07.1985"))
+    assert first == {
+        "row": 1,
+        "profile": profile,
+        "extended": calculate_extended_profile("Анна Петрова", "15.07.1985"),
+        "bridges": calculate_bridges(profile),
+        "personal_years": get_personal_years("15.07.1985", 3),
+    }
+    assert second == {"row": 2, "error": "birthdate must be provided"}
+
+
+def test_process_rows_bounds_memo(monkeypatch):
+    monkeypatch.setattr(batch, "MEMO_SIZE", 2)
+    rows = [BatchRow(i, f"Иван {name}", "01.01.1990") for i, name in enumerate("АБВГД", 1)]
+
+    results = list(process_rows(rows))
+
+    assert [result["row"] for result in results] == [1, 2, 3, 4, 5]
+    assert all("profile" in result for result in results)
+
+
+def test_batch_options_reject_negative_personal_years(capsys):
+    with pytest.raises(ValueError, match="personal_years"):
+        BatchOptions(personal_years=-1)
+    with pytest.raises(SystemExit):
+        cli.main(["batch", "--personal-years", "-1"])
+    assert "personal_years must be >= 0" in capsys.readouterr().err
+
+
+def test_run_batch_splits_results_and_errors():
+    source = io.StringIO("full_name,birthdate\nИван Иванов,01.01.1990\nИван2,01.01.1990\n")
+    output, errors, reports = io.StringIO(), io.StringIO(), []
+
+    stats = run_batch(source, output, errors, "csv", progress=reports.append, progress_every=1)
+
+    assert [row["row"] for row in _lines(output.getvalue())] == [1]
+    assert _lines(errors.getvalue())[0]["row"] == 2
+    assert (stats.rows, stats.errors, len(reports)) == (2, 1, 2)
+
+
+def test_cli_batch_writes_files(tmp_path, capsys):
+    source = tmp_path / "people.csv"
+    source.write_text("\ufefffull_name,birthdate\nИван Иванов,01.01.1990\n,01.01.1990\n", "utf-8")
+    output, errors = tmp_path / "out.jsonl", tmp_path / "errors.jsonl"
+
+    code = cli.main(["batch", str(source), "-o", str(output), "--errors", str(errors), "--bridges"])
+
+    assert code == 0
+    (result,) = _lines(output.read_text("utf-8"))
+    assert set(result) == {"row", "profile", "bridges"}
+    assert _lines(errors.read_text("utf-8")) == [{"row": 2, "error": "full name must be provided"}]
+    assert "2 rows, 1 errors" in capsys.readouterr().err
@@ -0,0 +1,48 @@
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.bench_import import TARGETS, measure
+from benchmarks.suite import SCHEMA_VERSION, compare_results, run_suite
+
+
+def _results(**timings):
+    return {
+        "schema": SCHEMA_VERSION,
+        "results": {name: {"ns_per_item": value} for name, value in timings.items()},
+    }
+
+
+def test_compare_flags_only_tracked_regressions_beyond_threshold():
+    baseline = _results(fast=100.0, steady=100.0, retired=100.0)
+    current = _results(fast=130.0, steady=110.0, added=1.0)
+
+    rows = {row[0]: row for row in compare_results(baseline, current, threshold=0.15)}
+
+    assert set(rows) == {"fast", "steady"}
+    assert rows["fast"][4] and not rows["steady"][4]
+
+
+def test_run_writes_json_and_compare_exit_code(tmp_path):
+    results = run_suite(rows=20, repeat=1, min_time=0.0, select=["math.reduce_number"])
+    assert set(results["results"]) == {"math.reduce_number", "math.reduce_number.large"}
+
+    baseline, current = tmp_path / "baseline.json", tmp_path / "current.json"
+    baseline.write_text(json.dumps(_results(**{"math.reduce_number": 1e9})))
+    current.write_text(json.dumps(_results(**{"math.reduce_number": 2e9})))
+
+    assert main(["compare", str(baseline), str(baseline)]) == 0
+    assert main(["compare", str(baseline), str(current)]) == 1
+
+
+def test_small_row_counts_keep_at_least_one_item_per_benchmark():
+    selected = ["days.generate", "months.generate_personal_month_matrix"]
+    results = run_suite(rows=5, repeat=1, min_time=0.0, select=selected)["results"]
+
+    assert len(results) == 3
+    assert all(result["items"] == 1 for result in results.values())
+
+
+def test_calc_only_entry_points_do_not_load_the_ai_stack():
+    for target in TARGETS:
+        if target.budgeted:
+            assert measure(target, repeat=1)["loaded"] == [], target.name
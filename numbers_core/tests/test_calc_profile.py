@@ -2,9 +2,21 @@ from datetime import date
 
 import pytest
 
-from numbers_core.calc.days import calculate_personal_day_base
-from numbers_core.calc.months import get_personal_month
-from numbers_core.calc.profile import calculate_core_profile
+from numbers_core.calc.bridges import calculate_bridges
+from numbers_core.calc.compatibility import compare_core_profiles
+from numbers_core.calc.days import calculate_personal_day_base, generate_personal_days
+from numbers_core.calc.extended_profile import ExtendedProfile, calculate_extended_profile
+from numbers_core.calc.graph import (
+    PROFILE_FIELDS,
+    ProfileGraph,
+    calculate_profile_sections,
+    parse_profile_fields,
+)
+from numbers_core.calc.math import extract_base, parse_reduced, reduce_number, reduce_value
+from numbers_core.calc.names import LATIN, RUSSIAN, Alphabet, NameScorer, score_name
+from numbers_core.calc.months import generate_personal_month_matrix, get_personal_month
+from numbers_core.calc.profile import CoreProfile, calculate_core_profile
+from numbers_core.calc.years import get_personal_years, personal_year_value
 
 
 @pytest.mark.parametrize(
@@ -28,8 +40,135 @@ def test_calculate_personal_day_base_known_example():
     assert 1 <= day_number <= 9
 
 
-def test_get_personal_month_reuses_cached_matrix():
+def test_generate_personal_days_matches_per_day_calculation():
+    months = generate_personal_days("29.11.1999", 2024, months=15, start_month=11)
+
+    assert [(m.year, m.month) for m in months[:3]] == [(2024, 11), (2024, 12), (2025, 1)]
+    assert months[-1].year == 2026 and months[-1].month == 1
+    for month in months:
+        assert len(month.days) == len(month.to_dict()["days"])
+        for day, number in enumerate(month.days, start=1):
+            target = date(month.year, month.month, day)
+            assert number == calculate_personal_day_base("29.11.1999", target)
+
+
+def test_get_personal_month_returns_the_same_string_on_repeat_calls():
     month_value = get_personal_month("01.01.1990", 2025, 3)
     second_value = get_personal_month("01.01.1990", 2025, 3)
     assert isinstance(month_value, str)
     assert month_value == second_value
+
+
+@pytest.mark.parametrize("year", [1850, 1989, 2025, 2095, 2400])
+def test_get_personal_month_covers_any_year(year):
+    for month in range(1, 13):
+        expected = reduce_number(personal_year_value("19.09.1995", year).base + month)
+        assert get_personal_month("19.09.1995", year, month) == expected
+
+    row = generate_personal_month_matrix("19.09.1995", start_year=year, years=1)[year]
+    assert list(row.values()) == [get_personal_month("19.09.1995", year, m) for m in range(1, 13)]
+
+
+@pytest.mark.parametrize("n", [0, 7, 11, 13, 19, 38, 99, 2024, 123_456])
+def test_reduce_value_matches_legacy_string(n):
+    value = reduce_value(n)
+
+    assert str(value) == reduce_number(n)
+    assert str(parse_reduced(reduce_number(n))) == reduce_number(n)
+    assert extract_base(value) == extract_base(reduce_number(n)) == value.base
+
+
+def test_reduced_number_marks_master_and_karmic_values():
+    assert reduce_value(22).is_master and not reduce_value(22).is_karmic
+    assert reduce_value(14).is_karmic and str(reduce_value(14)) == "5(14)"
+    assert not reduce_value(12).is_master and str(reduce_value(12)) == "3"
+    assert parse_reduced("4(13)") == reduce_value(13)
+
+
+def test_core_profile_round_trips_through_dict():
+    profile = CoreProfile.calculate("Анна-Мария Петрова", "15.07.1985")
+
+    assert profile.to_dict() == calculate_core_profile("Анна-Мария Петрова", "15.07.1985")
+    assert CoreProfile.from_dict(profile.to_dict()).to_dict() == profile.to_dict()
+
+
+def test_calc_functions_accept_profile_objects():
+    profile_a = CoreProfile.calculate("Иван Иванов", "01.01.1990")
+    profile_b = CoreProfile.calculate("Анна-Мария Петрова", "15.07.1985")
+
+    assert calculate_bridges(profile_a) == calculate_bridges(profile_a.to_dict())
+    assert compare_core_profiles(profile_a, profile_b) == compare_core_profiles(
+        profile_a.to_dict(), profile_b.to_dict()
+    )
+    extended = ExtendedProfile.calculate("Иван Иванов", "01.01.1990", core=profile_a)
+    assert extended.to_dict() == calculate_extended_profile("Иван Иванов", "01.01.1990")
+
+
+def test_name_score_collects_all_sums_in_one_pass():
+    score = score_name("Иванова  Анна-Мария")
+
+    assert score.total == score.vowels + score.consonants == 57
+    assert score.vowels == 1 + 1 + 7 + 1 + 1 + 1 + 1 + 1 + 5
+    assert score.initials == 1 + 1  # «И» и «А»
+    assert score.first_name == 1 + 6 + 6 + 1 + 5 + 1 + 9 + 1 + 5
+    assert score.words == 2
+
+
+def test_latin_names_are_scored():
+    profile = calculate_core_profile("John Doe", "01.01.1990")
+
+    assert profile["expression"] == "8"  # J1 O6 H8 N5 D4 O6 E5 = 35
+    assert profile["soul"] == "8"  # O6 O6 E5 = 17
+    assert profile["personality"] == "9"  # J1 H8 N5 D4 = 18
+    assert calculate_extended_profile("John Doe", "01.01.1990")["balance"] == "5"
+
+
+def test_name_scorer_accepts_custom_alphabets():
+    latin_only = NameScorer(LATIN)
+    with_extra = NameScorer(RUSSIAN, Alphabet("extra", {"Ä": 7}, frozenset("Ä")))
+
+    assert latin_only.score("Иван").total == 0
+    assert latin_only.score("ſam").total == 1 + 1 + 4  # «ſ».upper() == «S»
+    assert with_extra.score("Äня").vowels == 7 + 5
+
+
+@pytest.mark.parametrize(
+    "full_name,birthdate",
+    [
+        ("Иван Иванов", "01.01.1990"),
+        ("Анна-Мария Д'Артаньян", "29.02.2000"),
+        ("Петров Пётр Петрович", "22.11.2029"),
+        ("John Doe", "12.12.1912"),
+    ],
+)
+def test_profile_graph_matches_separate_functions(full_name, birthdate):
+    sections = calculate_profile_sections(full_name, birthdate, PROFILE_FIELDS, 2024, 2)
+
+    core = calculate_core_profile(full_name, birthdate)
+    assert sections["core"] == core
+    assert sections["extended"] == calculate_extended_profile(full_name, birthdate)
+    assert sections["bridges"] == calculate_bridges(core)
+    assert sections["personal_months"] == generate_personal_month_matrix(birthdate, 2024, 1)[2024]
+    assert sections["personal_days"] == generate_personal_days(birthdate, 2024, 1, 2)[0].to_dict()
+    assert calculate_profile_sections(full_name, birthdate, ["personal_years"]) == {
+        "personal_years": get_personal_years(birthdate)
+    }
+
+
+def test_profile_graph_evaluates_only_needed_nodes():
+    graph = ProfileGraph("Иван Иванов", "01.01.1990", year=2024)
+
+    graph.sections("personal_years")
+    assert graph.computed() == {"date_values", "date_part", "personal_year", "personal_years"}
+
+    graph.sections(["bridges", "core"])
+    assert "name_score" in graph.computed() and "extended" not in graph.computed()
+
+
+def test_parse_profile_fields():
+    assert parse_profile_fields(None) == ("core",)
+    assert parse_profile_fields(" bridges,core ") == ("core", "bridges")
+    with pytest.raises(ValueError, match="unknown profile fields: soul"):
+        parse_profile_fields(["core", "soul"])
+    with pytest.raises(ValueError, match="at least one"):
+        parse_profile_fields([])
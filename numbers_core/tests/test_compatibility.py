@@ -0,0 +1,47 @@
+import itertools
+
+import pytest
+
+from numbers_core.calc import vectorized
+from numbers_core.calc.compatibility import (
+    compare_core_profiles,
+    compatibility_matrix,
+    score_compatibility,
+)
+from numbers_core.calc.profile import CoreProfile, calculate_core_profile
+
+NAMES = ("Иван Иванов", "Анна-Мария Петрова", "Пётр Д'Артаньян", "Ёлка")
+DATES = ("01.01.1990", "29.11.1999", "19.09.2000", "13.04.1977")
+PROFILES = [calculate_core_profile(n, d) for n, d in itertools.product(NAMES, DATES)]
+
+
+def _expected(profiles_a, profiles_b):
+    return [
+        [score_compatibility(compare_core_profiles(a, b)) for b in profiles_b] for a in profiles_a
+    ]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(vectorized, "np", None)
+    return request.param
+
+
+def test_matrix_preserves_pairwise_scores(engine):
+    matrix = compatibility_matrix(PROFILES).to_dict()
+
+    assert matrix["scores"] == _expected(PROFILES, PROFILES)
+
+
+def test_rectangular_matrix_with_details(engine):
+    others = [CoreProfile.from_dict(profile) for profile in PROFILES[:3]]
+
+    matrix = compatibility_matrix(PROFILES, others, details=True).to_dict()
+
+    assert matrix["scores"] == _expected(PROFILES, others)
+    table = compare_core_profiles(PROFILES[5], others[2])
+    assert matrix["matches"][5][2] == [row["match"] for row in table]
+    assert matrix["bridges"][5][2] == [row["bridge"] for row in table]
@@ -0,0 +1,66 @@
+import mmap
+
+from numbers_core.calc import datetable
+from numbers_core.calc.math import reduce_value
+from numbers_core.calc.profile import calculate_birthday_number, life_path_value
+
+
+def test_records_match_scalar_calculations():
+    table = datetable.build_table()
+
+    for year in (1900, 1999, 2000, 2024, 2100):
+        for month in range(1, 13):
+            for day in range(1, 32):
+                offset = (
+                    datetable.HEADER_SIZE
+                    + datetable.slot_index(day, month, year) * datetable.RECORD_SIZE
+                )
+                record = table[offset : offset + datetable.RECORD_SIZE]
+                if record[datetable.FLAGS] == 0:
+                    continue
+                birthdate = f"{day:02d}.{month:02d}.{year}"
+                life_path = reduce_value(record[datetable.LIFE_PATH])
+                assert life_path == life_path_value(birthdate)
+                assert str(reduce_value(record[datetable.DAY])) == calculate_birthday_number(
+                    birthdate
+                )
+                assert bool(record[datetable.FLAGS] & datetable.FLAG_LIFE_PATH_MASTER) == (
+                    life_path.is_master
+                )
+
+
+def test_invalid_and_out_of_range_dates_have_no_record():
+    assert datetable.build_record(29, 2, 2023) == bytes(datetable.RECORD_SIZE)
+    assert datetable.slot_index(1, 1, 1899) is None
+    assert datetable.slot_index(1, 13, 2000) is None
+    assert datetable.build_record(29, 2, 2024)[datetable.DAY] == 29
+
+
+def test_load_table_follows_the_configured_path(tmp_path, monkeypatch):
+    path = tmp_path / "dates.bin"
+    monkeypatch.setenv("NUMBERS_DATE_TABLE_PATH", str(path))
+    monkeypatch.setattr(datetable, "_table_data", datetable._UNLOADED)
+
+    assert datetable.load_table()[:] == path.read_bytes()
+
+    monkeypatch.setenv("NUMBERS_DATE_TABLE", "off")
+    monkeypatch.setattr(datetable, "_table_data", datetable._UNLOADED)
+    assert datetable.load_table() is None
+
+    monkeypatch.setenv("NUMBERS_DATE_TABLE", "on")
+    monkeypatch.setattr(datetable, "_table_data", datetable._UNLOADED)
+    assert datetable.load_table()[:] == path.read_bytes()
+
+
+def test_open_table_generates_and_repairs_file(tmp_path):
+    path = tmp_path / "dates.bin"
+
+    table = datetable.open_table(path)
+    assert isinstance(table, mmap.mmap)
+    assert table[:] == datetable.build_table()
+    table.close()
+
+    path.write_bytes(b"garbage")
+    table = datetable.open_table(path)
+    assert len(table) == len(datetable.build_table())
+    table.close()
@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from numbers_core.helpers import metrics
+from numbers_core.intelligence.analysis import analyze_profile, analyze_profile_async
+from numbers_core.intelligence.limiter import ConcurrencyLimiter, Overloaded
+
+PROFILE = {
+    "life_path": "3",
+    "birthday": "1",
+    "expression": "5",
+    "soul": "2(11)",
+    "personality": "3",
+}
+
+
+class RecordingClient:
+    model = "test/recording"
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.order = []
+
+    async def achat(self, system: str, user: str) -> str:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.order.append(user)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return "analysis"
+
+
+def test_limiter_caps_concurrency_and_queues_the_rest():
+    client = RecordingClient()
+    limiter = ConcurrencyLimiter(max_concurrent=2, max_queue=10)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(
+                analyze_profile_async({**PROFILE, "id": str(i)}, client=client, limiter=limiter)
+                for i in range(6)
+            )
+        )
+
+    assert asyncio.run(scenario()) == ["analysis"] * 6
+    assert client.peak == 2
+    stats = limiter.stats()
+    assert stats["admitted"] == 2 and stats["queued"] == 4
+    assert stats["active"] == 0 and stats["waiting"] == 0
+
+
+def test_full_queue_is_rejected_with_429_and_retry_after():
+    limiter = ConcurrencyLimiter(max_concurrent=1, max_queue=1)
+    rejections = metrics.LIMITER_REJECTIONS.value("bulk", "full")
+
+    async def scenario():
+        async with limiter.aslot("bulk"):
+            waiting = asyncio.ensure_future(limiter.acquire_async("bulk"))
+            await asyncio.sleep(0)
+            with pytest.raises(Overloaded) as rejected:
+                await limiter.acquire_async("bulk")
+            # The other lane has its own queue.
+            interactive = asyncio.ensure_future(limiter.acquire_async("interactive"))
+            await asyncio.sleep(0)
+        await interactive
+        limiter.release()
+        await waiting
+        limiter.release()
+        return rejected.value
+
+    error = asyncio.run(scenario())
+    assert error.status_code == 429 and error.retry_after >= 1
+    assert metrics.LIMITER_REJECTIONS.value("bulk", "full") == rejections + 1
+    assert limiter.stats()["active"] == 0
+
+
+def test_interactive_lane_goes_before_bulk():
+    limiter = ConcurrencyLimiter(max_concurrent=1, max_queue=10)
+    order = []
+
+    async def call(lane, name):
+        async with limiter.aslot(lane):
+            order.append(name)
+
+    async def scenario():
+        async with limiter.aslot():
+            tasks = [asyncio.ensure_future(call("bulk", f"bulk-{i}")) for i in range(2)]
+            tasks.append(asyncio.ensure_future(call("interactive", "gui")))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+    assert order == ["gui", "bulk-0", "bulk-1"]
+
+
+def test_queue_timeout_is_rejected_with_503_and_cancelled_waiters_leave():
+    limiter = ConcurrencyLimiter(max_concurrent=1, max_queue=5, queue_timeout=0.01)
+
+    async def scenario():
+        async with limiter.aslot():
+            with pytest.raises(Overloaded) as timed_out:
+                await limiter.acquire_async()
+            cancelled = asyncio.ensure_future(limiter.acquire_async())
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+            assert limiter.stats()["waiting"] == 0
+        return timed_out.value
+
+    assert asyncio.run(scenario()).status_code == 503
+    assert limiter.stats()["timed_out"] == 1 and limiter.stats()["active"] == 0
+
+
+def test_sync_clients_share_the_limiter_from_threads():
+    class SlowSyncClient:
+        model = "test/sync"
+        active = peak = 0
+        lock = threading.Lock()
+
+        def chat(self, system, user):
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.02)
+            with self.lock:
+                self.active -= 1
+            return "sync analysis"
+
+    client = SlowSyncClient()
+    limiter = ConcurrencyLimiter(max_concurrent=2, max_queue=10)
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(analyze_profile(PROFILE, client=client, limiter=limiter))
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["sync analysis"] * 5
+    assert client.peak == 2
+    assert limiter.stats()["active"] == 0
@@ -0,0 +1,85 @@
+import itertools
+import sys
+import threading
+
+from numbers_core.calc.compatibility import compare_core_profiles, score_compatibility
+from numbers_core.calc.matching import MatchIndex
+from numbers_core.calc.profile import CoreProfile
+
+NAMES = ("Иван Иванов", "Анна-Мария Петрова", "Пётр Д'Артаньян", "Ёлка", "Ольга Смирнова")
+DATES = ("01.01.1990", "29.11.1999", "19.09.2000", "13.04.1977", "07.07.2007", "22.02.1962")
+POPULATION = {
+    f"{name}|{born}": CoreProfile.calculate(name, born)
+    for name, born in itertools.product(NAMES, DATES)
+}
+
+
+def _score(a, b):
+    return score_compatibility(compare_core_profiles(a, b))
+
+
+def _index():
+    index = MatchIndex()
+    for item_id, profile in POPULATION.items():
+        index.add(item_id, profile)
+    return index
+
+
+def test_top_k_matches_brute_force_ranking():
+    index = _index()
+    query = CoreProfile.calculate("Мария Кузнецова", "15.07.1985")
+
+    top = index.top(query, k=7)
+
+    expected_scores = sorted((_score(query, p) for p in POPULATION.values()), reverse=True)
+    assert [score for _, score in top] == expected_scores[:7]
+    assert all(score == _score(query, POPULATION[item_id]) for item_id, score in top)
+
+
+def test_incremental_insert_and_delete():
+    index = _index()
+    query = POPULATION["Ёлка|13.04.1977"]
+
+    assert index.top(query, k=1) == [("Ёлка|13.04.1977", 10)]
+    assert index.remove("Ёлка|13.04.1977")
+    assert not index.remove("Ёлка|13.04.1977")
+    assert "Ёлка|13.04.1977" not in index
+    assert index.top(query, k=1)[0][0] != "Ёлка|13.04.1977"
+
+    index.add("twin", query.to_dict())
+    assert index.top(query, k=1) == [("twin", 10)]
+    assert index.top(query, k=1, exclude="twin")[0][0] != "twin"
+    assert len(index) == len(POPULATION)
+
+
+def test_queries_run_safely_while_the_index_changes():
+    index = MatchIndex()
+    profile = next(iter(POPULATION.values()))
+    for item in range(2000):
+        index.add(item, profile)
+    stop = threading.Event()
+    errors = []
+
+    def churn():
+        step = 0
+        while not stop.is_set():
+            index.add(f"churn-{step % 50}", profile)
+            index.remove(f"churn-{(step + 25) % 50}")
+            step += 1
+
+    writer = threading.Thread(target=churn)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    writer.start()
+    try:
+        for _ in range(200):
+            try:
+                index.top(profile, k=2000)
+            except RuntimeError as exc:  # pragma: no cover - проявление гонки
+                errors.append(exc)
+    finally:
+        stop.set()
+        writer.join()
+        sys.setswitchinterval(interval)
+
+    assert errors == []
@@ -0,0 +1,75 @@
+import pytest
+
+from numbers_core.core.orchestrator import ProfileInput, run
+from numbers_core.helpers import metrics
+
+
+class BrokenClient:
+    def chat(self, system, user):
+        raise RuntimeError("provider is down")
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = metrics.Registry(prefix="t")
+    latency = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+    latency.observe(0.05, "/a")
+    latency.observe(0.5, "/a")
+    latency.observe(5.0, "/a")
+
+    lines = registry.render().splitlines()
+    assert lines[:2] == ["# HELP t_latency_seconds Latency.", "# TYPE t_latency_seconds histogram"]
+    assert 't_latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 't_latency_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 't_latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 't_latency_seconds_sum{route="/a"} 5.55' in lines
+    assert 't_latency_seconds_count{route="/a"} 3' in lines
+
+
+def test_counter_escapes_label_values_and_stats_are_exported():
+    registry = metrics.Registry(prefix="t")
+    registry.counter("events_total", "Events.", ("name",)).inc('a"b\nc', amount=2)
+    registry.register_stats("cache", lambda: {"hits": 3, "size": 7, "tags": ["x"]}, ("hits",))
+
+    text = registry.render()
+
+    assert 't_events_total{name="a\\"b\\nc"} 2' in text
+    assert "# TYPE t_cache_hits_total counter\nt_cache_hits_total 3" in text
+    assert "# TYPE t_cache_size gauge\nt_cache_size 7" in text
+    assert "tags" not in text
+
+
+def test_registry_rejects_duplicate_metric():
+    registry = metrics.Registry(prefix="t")
+    registry.counter("x_total", "X.")
+
+    with pytest.raises(ValueError):
+        registry.counter("x_total", "X.")
+
+
+def test_server_timing_header_sums_repeated_stages():
+    timings = metrics.Timings()
+    timings.add("calc", 0.001)
+    timings.add("render", 0.0005)
+    timings.add("calc", 0.002)
+
+    assert timings.header(0.01) == "calc;dur=3.000, render;dur=0.500, total;dur=10.000"
+
+
+def test_run_records_upstream_failures():
+    before = metrics.UPSTREAM_SECONDS.count("error")
+
+    result = run(ProfileInput("Иван Иванов", "01.01.1990"), ai=BrokenClient())
+
+    assert "provider is down" in result["analysis"]["text"]
+    assert metrics.UPSTREAM_SECONDS.count("error") == before + 1
+
+
+def test_disabled_stage_records_nothing(monkeypatch):
+    monkeypatch.setattr(metrics, "enabled", False)
+    before = metrics.STAGE_SECONDS.count("disabled-stage")
+
+    with metrics.stage("disabled-stage"):
+        pass
+
+    assert metrics.STAGE_SECONDS.count("disabled-stage") == before
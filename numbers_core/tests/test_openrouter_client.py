@@ -0,0 +1,166 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from numbers_core.intelligence.analysis import analyze_profile_async
+from numbers_core.intelligence.openrouter_client import AsyncOpenRouterClient, OpenRouterClient
+from numbers_core.intelligence.stub_server import running_stub
+
+
+@pytest.fixture
+def stub():
+    with running_stub(reply="Ответ заглушки") as server:
+        yield server
+
+
+def test_sync_client_reuses_keep_alive_connection(stub):
+    client = OpenRouterClient(api_key="test", url=stub.url)
+
+    replies = [client.chat("system", "user") for _ in range(3)]
+    client.close()
+
+    assert replies == ["Ответ заглушки"] * 3
+    assert stub.connections == 1
+
+
+def test_sync_client_keeps_one_session_per_thread(stub):
+    client = OpenRouterClient(api_key="test", url=stub.url)
+    replies = []
+
+    def calls():
+        replies.extend(client.chat("system", "user") for _ in range(2))
+
+    threads = [threading.Thread(target=calls) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+        thread.join()
+    client.close()
+
+    assert replies == ["Ответ заглушки"] * 4
+    assert stub.connections == 2
+
+
+def test_async_client_shares_bounded_pool(stub):
+    """Concurrent calls never open more connections than the pool allows."""
+
+    client = AsyncOpenRouterClient(api_key="test", url=stub.url, max_connections=4)
+
+    async def scenario():
+        try:
+            return await asyncio.gather(*(client.achat("system", "user") for _ in range(20)))
+        finally:
+            await client.aclose()
+
+    replies = asyncio.run(scenario())
+
+    assert replies == ["Ответ заглушки"] * 20
+    assert stub.requests == 20
+    assert stub.connections <= 4
+
+
+def test_async_analysis_reports_upstream_errors(stub):
+    client = AsyncOpenRouterClient(api_key="test", url=stub.url.replace("chat", "missing"))
+
+    text = asyncio.run(analyze_profile_async({"life_path": "1"}, client=client))
+
+    assert text.startswith("Анализ временно недоступен.")
+    assert "404" in text
+
+
+def test_analysis_route_uses_async_client(stub, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import api
+
+    api.analysis_cache.clear()
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test")
+    monkeypatch.setenv("OPENROUTER_URL", stub.url)
+
+    with TestClient(api.app) as http:
+        response = http.post(
+            "/profile/analysis", json={"full_name": "Иван Иванов", "birthdate": "01.01.1990"}
+        )
+
+    assert response.status_code == 200
+    assert response.json()["analysis"] == "Ответ заглушки"
+
+
+def test_api_client_follows_url_and_model_settings(monkeypatch):
+    import api
+
+    monkeypatch.setattr(api, "_ai_clients", {})
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test")
+    monkeypatch.setenv("OPENROUTER_URL", "http://127.0.0.1:1/a")
+    first = api._select_ai_client()
+    assert api._select_ai_client() is first
+
+    monkeypatch.setenv("OPENROUTER_URL", "http://127.0.0.1:1/b")
+    moved = api._select_ai_client()
+    monkeypatch.setenv("OPENROUTER_MODEL", "test/other")
+    other_model = api._select_ai_client()
+
+    assert (first.url, moved.url) == ("http://127.0.0.1:1/a", "http://127.0.0.1:1/b")
+    assert other_model.model == "test/other" and other_model is not moved
+
+
+def test_async_stream_yields_chunks(stub):
+    client = AsyncOpenRouterClient(api_key="test", url=stub.url)
+
+    async def scenario():
+        try:
+            return [piece async for piece in client.astream_chat("system", "user")]
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(scenario()) == ["Ответ", " заглушки"]
+
+
+def _events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        event, data = block.split("\n")
+        events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+def test_stream_route_sends_profile_then_tokens(stub, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import api
+
+    api.analysis_cache.clear()
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test")
+    monkeypatch.setenv("OPENROUTER_URL", stub.url)
+
+    with TestClient(api.app) as http:
+        response = http.get(
+            "/profile/analysis/stream",
+            params={"full_name": "Иван Иванов", "birthdate": "01.01.1990"},
+        )
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response.text)
+    assert events[0] == (
+        "profile",
+        api.build_profile(api.ProfileInput("Иван Иванов", "01.01.1990")),
+    )
+    assert [data["text"] for name, data in events if name == "token"] == ["Ответ", " заглушки"]
+    assert events[-1] == ("done", {"analysis": "Ответ заглушки"})
+
+
+def test_stream_route_degrades_to_single_chunk_with_mock_client(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import api
+
+    monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+
+    with TestClient(api.app) as http:
+        response = http.post(
+            "/profile/analysis/stream", json={"full_name": "Иван Иванов", "birthdate": "01.01.1990"}
+        )
+
+    names = [name for name, _ in _events(response.text)]
+    assert names == ["profile", "token", "done"]
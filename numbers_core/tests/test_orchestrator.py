@@ -1,6 +1,18 @@
+from datetime import datetime
+
 import pytest
 
-from numbers_core.core.orchestrator import ProfileInput, build_profile, run
+from numbers_core.calc.dates import BirthDate
+from numbers_core.core.orchestrator import (
+    ProfileInput,
+    _normalize_birthdate,
+    _normalize_name,
+    build_profile,
+    build_profiles,
+    run,
+)
+
+LEGACY_DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y", "%d/%m/%Y", "%d-%m-%Y")
 
 
 def test_run_returns_profile_and_analysis():
@@ -27,3 +39,101 @@ def test_build_profile_rejects_invalid_name_characters():
 def test_build_profile_rejects_invalid_birthdate():
     with pytest.raises(ValueError, match="birthdate"):
         build_profile(ProfileInput(name="Иван Иванов", birthdate="not-a-date"))
+
+
+def test_build_profiles_matches_single_item_path():
+    inputs = [
+        ProfileInput(name="Иван Иванов", birthdate="1990-01-01"),
+        ProfileInput(name="Анна-Мария Петрова", birthdate="15.07.1985"),
+        ProfileInput(name="Иван Иванов", birthdate="01/01/1990"),
+    ]
+
+    results = build_profiles(inputs)
+
+    assert [item["profile"] for item in results] == [build_profile(inp) for inp in inputs]
+
+
+def test_build_profiles_isolates_errors_per_item():
+    """One invalid birthdate must not fail the rest of the batch."""
+
+    results = build_profiles(
+        [
+            ProfileInput(name="Иван Иванов", birthdate="not-a-date"),
+            ProfileInput(name="Иван Иванов", birthdate="1990-01-01"),
+            ProfileInput(name="Иван Иванов", birthdate="not-a-date"),
+        ]
+    )
+
+    assert "birthdate" in results[0]["error"]
+    assert "profile" in results[1]
+    assert results[2] == results[0]
+
+
+def _strptime_birthdate(raw):
+    for fmt in LEGACY_DATE_FORMATS:
+        try:
+            return datetime.strptime(raw, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "1990-01-01",
+        "1990-1-5",
+        "1990-01- 5",
+        "01.02.1990",
+        "1.2.1990",
+        "29/02/2024",
+        "29-02-2023",
+        "31.04.1990",
+        "00.01.1990",
+        "01.13.1990",
+        "01.02.90",
+        "01.02.19901",
+        "001.02.1990",
+        "01.02/1990",
+        "1990/01/01",
+        "1990.01.01",
+        "1990-01-01-01",
+        "01..1990",
+        "+1.02.1990",
+        "1",
+        "x1.02.1990",
+        "١٩٩٠-٠١-٠١",
+        "01.01.٢٠٢٠",
+        "0999-01-01",
+        "05.06.0999",
+    ],
+)
+def test_birthdate_parser_accepts_exactly_the_strptime_formats(raw):
+    # strptime's %Y also matches non-ASCII digits; the parser takes ASCII only.
+    expected = _strptime_birthdate(raw) if raw.isascii() else None
+
+    if expected is None:
+        with pytest.raises(ValueError, match="birthdate must be in one of the formats"):
+            _normalize_birthdate(raw)
+    else:
+        parsed = _normalize_birthdate(raw)
+        assert parsed == BirthDate(expected.day, expected.month, expected.year)
+        assert str(parsed) == expected.strftime("%d.%m.%Y")
+
+
+@pytest.mark.parametrize(
+    "raw,message",
+    [
+        ("  Анна-Мария   Д'Артаньян ", None),
+        ("", "full name must be provided"),
+        ("- '", "full name must contain letters"),
+        ("123", "full name must contain letters"),
+        ("Иван_Иванов", "full name may contain only letters"),
+    ],
+)
+def test_name_validation_messages(raw, message):
+    if message is None:
+        assert _normalize_name(raw) == "Анна-Мария Д'Артаньян"
+    else:
+        with pytest.raises(ValueError, match=message):
+            _normalize_name(raw)
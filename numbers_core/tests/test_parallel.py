@@ -0,0 +1,78 @@
+import io
+
+import pytest
+
+from numbers_core import (
+    ProfileInput,
+    build_profiles,
+    build_profiles_parallel,
+    compatibility_matrix_parallel,
+)
+from numbers_core.calc import compatibility_matrix
+from numbers_core.core.batch import BatchOptions, run_batch
+from numbers_core.core.parallel import parallel_map
+
+PEOPLE = [
+    ProfileInput(name, birthdate)
+    for name, birthdate in (
+        ("Иван Иванов", "01.01.1990"),
+        ("Анна Петрова", "1985-07-15"),
+        ("Пётр", "31.02.1990"),
+        ("Мария Смирнова", "29/02/2000"),
+        ("John Doe", "12-12-1912"),
+        ("Ольга 2", "01.01.1990"),
+        ("Сергей Козлов", "05.11.1977"),
+    )
+]
+
+
+def _chunk_sums(chunk):
+    return [sum(chunk)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_map_keeps_chunk_order(workers):
+    assert list(parallel_map(_chunk_sums, range(10), workers, chunk_size=3)) == [3, 12, 21, 9]
+
+
+def test_parallel_map_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        list(parallel_map(_chunk_sums, [1], workers=0))
+    with pytest.raises(ValueError):
+        list(parallel_map(_chunk_sums, [1], chunk_size=0))
+
+
+def test_build_profiles_parallel_matches_build_profiles():
+    assert build_profiles_parallel(PEOPLE, workers=2, chunk_size=2) == build_profiles(PEOPLE)
+
+
+@pytest.mark.parametrize("details", [False, True])
+def test_compatibility_matrix_parallel_matches_serial(details):
+    profiles = [item["profile"] for item in build_profiles(PEOPLE) if "profile" in item]
+
+    square = compatibility_matrix_parallel(profiles, details=details, workers=2, chunk_size=2)
+    rect = compatibility_matrix_parallel(
+        profiles[:3], profiles[1:], details=details, workers=2, chunk_size=1
+    )
+
+    assert square.to_dict() == compatibility_matrix(profiles, details=details).to_dict()
+    assert rect.to_dict() == compatibility_matrix(profiles[:3], profiles[1:], details).to_dict()
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+def test_run_batch_with_workers_matches_single_process(fmt):
+    if fmt == "csv":
+        text = "full_name,birthdate\n" + "".join(f"{p.name},{p.birthdate}\n" for p in PEOPLE)
+    else:
+        text = "".join(f'{{"name": "{p.name}", "birthdate": "{p.birthdate}"}}\n' for p in PEOPLE)
+    options = BatchOptions(extended=True, bridges=True, personal_years=2)
+    outputs = []
+    for workers in (1, 2):
+        output, errors = io.StringIO(), io.StringIO()
+        stats = run_batch(
+            io.StringIO(text), output, errors, fmt, options, workers=workers, chunk_size=2
+        )
+        outputs.append((output.getvalue(), errors.getvalue(), stats.rows, stats.errors))
+
+    assert outputs[0] == outputs[1]
+    assert outputs[0][2:] == (7, 2)
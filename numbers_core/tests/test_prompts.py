@@ -0,0 +1,43 @@
+import os
+
+from numbers_core.intelligence.prompts.loader import PROMPTS_DIR, PromptRegistry, load_prompt
+
+PROFILE = {
+    "life_path": "3",
+    "birthday": "1",
+    "expression": "5",
+    "soul": "2(11)",
+    "personality": "3",
+}
+
+
+def test_registry_renders_same_prompts_as_load_prompt():
+    registry = PromptRegistry()
+
+    expected = load_prompt(
+        str(PROMPTS_DIR / "numerology.ru.md"), str(PROMPTS_DIR / "system.ru.md"), PROFILE
+    )
+
+    assert registry.render(PROFILE, "ru") == expected
+    assert registry.stats()["renders"] == 1
+
+
+def test_registry_preloads_all_languages():
+    registry = PromptRegistry()
+
+    assert "ru" in registry.preload()
+    assert registry.stats()["languages"] == registry.languages()
+
+
+def test_registry_recompiles_when_template_changes(tmp_path):
+    (tmp_path / "system.xx.md").write_text("system v1", encoding="utf-8")
+    user_path = tmp_path / "numerology.xx.md"
+    user_path.write_text("v1 {{ profile_json }}", encoding="utf-8")
+    registry = PromptRegistry(tmp_path, check_interval=0)
+
+    first_hash = registry.fingerprint("xx")
+    user_path.write_text("v2 {{ profile_json }}", encoding="utf-8")
+    os.utime(user_path, ns=(0, 10**18))
+
+    assert registry.render({}, "xx") == ("system v1", "v2 {}")
+    assert registry.fingerprint("xx") != first_hash
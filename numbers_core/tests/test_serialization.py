@@ -0,0 +1,51 @@
+import json
+from collections import namedtuple
+
+import pytest
+
+from numbers_core.helpers import serialization
+from numbers_core.helpers.serialization import EncodedCache, dumps
+
+Point = namedtuple("Point", "x y")
+
+
+def _starlette(content):
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+VALUES = [
+    {"life_path": "11(29)", "name": "Анна-Мария Д'Арк", "ok": True, "none": None},
+    {"scores": [[10, 7], [7, 10]], "ratio": 0.125, "tiny": 1e-05, "huge": 1e16},
+    {1: "int key", "big": 2**70, "point": Point(1, 2), "nested": [(1, "a"), []]},
+    "  \x7f \U0001f600",
+    [2.5e-05, 9.99e-05, -3.1e-05, 1e-4, 0.00012, 1e15],
+    {"small": 2.5e-05},
+]
+
+
+@pytest.mark.parametrize("content", VALUES)
+def test_dumps_matches_starlette_json_response(content):
+    assert dumps(content) == _starlette(content)
+
+
+@pytest.mark.parametrize("content", VALUES)
+def test_dumps_without_orjson_uses_stdlib(content, monkeypatch):
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert dumps(content) == _starlette(content)
+
+
+def test_encoded_cache_evicts_least_recent_by_entries_and_bytes():
+    cache = EncodedCache(max_entries=2, max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    assert cache.get("a") == b"1234"
+    cache.put("c", b"12")
+    assert cache.get("b") is None and len(cache) == 2
+
+    cache.put("d", b"123456")
+    assert cache.get("a") is None
+    cache.put("too big", b"x" * 11)
+    assert cache.get("too big") is None
+    assert cache.stats() == {"hits": 1, "misses": 3, "entries": 2, "bytes": 8}
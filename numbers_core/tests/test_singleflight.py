@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from numbers_core.intelligence.analysis import DEFAULT_ERROR_MESSAGE, analyze_profile_async
+from numbers_core.intelligence.singleflight import SingleFlight
+
+PROFILE = {
+    "life_path": "3",
+    "birthday": "1",
+    "expression": "5",
+    "soul": "2(11)",
+    "personality": "3",
+}
+
+
+class SlowClient:
+    model = "test/slow"
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+
+    async def achat(self, system: str, user: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return "shared analysis"
+
+
+def test_concurrent_identical_requests_share_one_call():
+    client = SlowClient()
+    flights = SingleFlight()
+
+    async def scenario():
+        return await asyncio.gather(
+            *(analyze_profile_async(PROFILE, client=client, flights=flights) for _ in range(10))
+        )
+
+    results = asyncio.run(scenario())
+
+    assert results == ["shared analysis"] * 10
+    assert client.calls == 1
+    assert flights.stats() == {"calls": 1, "collapsed": 9, "in_flight": 0}
+
+
+def test_errors_reach_every_waiter():
+    flights = SingleFlight()
+    client = SlowClient(fail=True)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(analyze_profile_async(PROFILE, client=client, flights=flights) for _ in range(3))
+        )
+
+    results = asyncio.run(scenario())
+
+    assert client.calls == 1
+    assert all(
+        text.startswith(DEFAULT_ERROR_MESSAGE) and "upstream down" in text for text in results
+    )
+
+
+def test_cancelled_waiter_does_not_cancel_shared_call():
+    flights = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return 42
+
+    async def scenario():
+        first = asyncio.ensure_future(flights.do("k", work))
+        second = asyncio.ensure_future(flights.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == 42
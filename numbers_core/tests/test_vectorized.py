@@ -0,0 +1,54 @@
+import itertools
+
+import pytest
+
+from numbers_core.calc.profile import calculate_core_profile
+
+pytest.importorskip("numpy")
+
+from numbers_core.calc.vectorized import (
+    calculate_core_profiles_columnar,
+    format_reduced,
+    reduce_array,
+)
+
+
+def test_columnar_profiles_match_scalar_profiles():
+    """Колоночный расчёт должен совпадать с calculate_core_profile бит в бит."""
+
+    names = ("Иван Иванов", "Анна-Мария Петрова", "Пётр Д'Артаньян", "Вᲁ Ёжик", "Ёлка", "John Doe")
+    dates = (
+        "01.01.1990",
+        "29.11.1999",
+        "19.09.2000",
+        "13.04.1977",
+        "31.12.2011",
+        "31.02.1990",  # нет в таблице дат — считается напрямую
+        "15.07.1850",
+        "02.03.2345",
+    )
+    people = list(itertools.product(names, dates))
+    names = [name for name, _ in people]
+    days = [int(born[:2]) for _, born in people]
+    months = [int(born[3:5]) for _, born in people]
+    years = [int(born[6:]) for _, born in people]
+
+    columns = calculate_core_profiles_columnar(names, days, months, years)
+    formatted = {key: format_reduced(column) for key, column in columns.items()}
+
+    for index, (name, born) in enumerate(people):
+        expected = calculate_core_profile(name, born)
+        assert {key: formatted[key][index] for key in expected} == expected
+
+
+def test_reduce_array_flags_master_and_karmic_numbers():
+    column = reduce_array([7, 11, 13, 38])
+
+    assert column["base"].tolist() == [7, 2, 4, 2]
+    assert column["master"].tolist() == [False, True, False, False]
+    assert column["karmic"].tolist() == [False, False, True, False]
+
+
+def test_columnar_profiles_reject_misaligned_columns():
+    with pytest.raises(ValueError, match="same length"):
+        calculate_core_profiles_columnar(["Иван"], [1, 2], [1], [1990])